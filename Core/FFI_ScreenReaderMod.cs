@@ -9,6 +9,7 @@ using System;
 using System.Collections;
 using System.Collections.Generic;
 using System.Reflection;
+using System.Runtime.CompilerServices;
 using GameCursor = Il2CppLast.UI.Cursor;
 using static FFI_ScreenReader.Utils.ModTextTranslator;
 
@@ -761,11 +762,22 @@ namespace FFI_ScreenReader.Core
         /// <summary>
         /// Speak text through the screen reader.
         /// Thread-safe: TolkWrapper uses locking to prevent concurrent native calls.
+        /// callerFile/callerMember are filled in by the compiler and only used for AnnouncementTiming records.
         /// </summary>
-        public static void SpeakText(string text, bool interrupt = true)
+        public static void SpeakText(string text, bool interrupt = true,
+            [CallerFilePath] string callerFile = "", [CallerMemberName] string callerMember = "")
         {
             MelonLoader.MelonLogger.Msg($"[TTS] {text}");
-            tolk?.Speak(TextUtils.StripRichTextTags(text), interrupt);
+            string stripped = TextUtils.StripRichTextTags(text);
+            if (!AnnouncementTiming.Enabled)
+            {
+                tolk?.Speak(stripped, interrupt);
+                return;
+            }
+
+            long start = AnnouncementTiming.Now;
+            tolk?.Speak(stripped, interrupt);
+            AnnouncementTiming.Speak(start, AnnouncementTiming.Now, stripped?.Length ?? 0, callerFile, callerMember);
         }
 
         /// <summary>
@@ -843,6 +855,7 @@ namespace FFI_ScreenReader.Core
         /// </summary>
         public static void CursorNavigation_Postfix(object __instance)
         {
+            AnnouncementTiming.Event();
             try
             {
                 // Cast to the actual Cursor type
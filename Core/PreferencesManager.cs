@@ -35,6 +35,9 @@ namespace FFI_ScreenReader.Core
         // Multi-hit damage display (0=Total only, 1=With hit count "14x1552 damage")
         private static MelonPreferences_Entry<int> prefDamageDisplay;
 
+        // Diagnostics (no in-game toggle; edit MelonPreferences.cfg)
+        private static MelonPreferences_Entry<bool> prefAnnouncementTiming;
+
         /// <summary>
         /// Initialize all preferences. Call once during OnInitializeMelon.
         /// </summary>
@@ -60,6 +63,8 @@ namespace FFI_ScreenReader.Core
 
             prefEnemyHPDisplay = prefsCategory.CreateEntry<int>("EnemyHPDisplay", 0, "Enemy HP Display", "0=Numbers, 1=Percentage, 2=Hidden");
             prefDamageDisplay = prefsCategory.CreateEntry<int>("DamageDisplay", 0, "Multi-hit Damage", "0=Total only, 1=With hit count (e.g. 14x1552 damage)");
+
+            prefAnnouncementTiming = prefsCategory.CreateEntry<bool>("AnnouncementTiming", false, "Announcement Timing Log", "Write [Timing] records for hook-to-speech latency (see tools/announcement_latency.py)");
         }
 
         #region Toggle Getters (saved preference values)
@@ -88,6 +93,12 @@ namespace FFI_ScreenReader.Core
 
         #endregion
 
+        #region Diagnostics
+
+        public static bool AnnouncementTiming => prefAnnouncementTiming?.Value ?? false;
+
+        #endregion
+
         #region Volume Setters (with clamping + auto-save)
 
         private static void SetIntPreference(MelonPreferences_Entry<int> pref, int value, int min, int max)
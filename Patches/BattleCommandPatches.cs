@@ -581,6 +581,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void SetCursor_Postfix(BattleCommandSelectController __instance, int index)
         {
+            AnnouncementTiming.Event();
             try
             {
                 if (__instance == null) return;
@@ -696,7 +697,11 @@ namespace FFI_ScreenReader.Patches
             if (string.IsNullOrWhiteSpace(mesIdName)) return;
 
             // Dedup on command identity (a page switch keeps the index but changes the id, so it announces).
-            if (mesIdName == lastAnnouncedCmdMesId) return;
+            if (mesIdName == lastAnnouncedCmdMesId)
+            {
+                AnnouncementTiming.Dedup();
+                return;
+            }
 
             var messageManager = MessageManager.Instance;
             if (messageManager == null) return;
@@ -733,6 +738,7 @@ namespace FFI_ScreenReader.Patches
         public static void SelectContent_Player_Postfix(object __instance,
             Il2CppSystem.Collections.Generic.IEnumerable<BattlePlayerData> list, int index)
         {
+            AnnouncementTiming.Event();
             try
             {
                 // Set target selection active
@@ -812,6 +818,7 @@ namespace FFI_ScreenReader.Patches
         public static void SelectContent_Enemy_Postfix(object __instance,
             Il2CppSystem.Collections.Generic.IEnumerable<BattleEnemyData> list, int index)
         {
+            AnnouncementTiming.Event();
             try
             {
                 // Set target selection active
@@ -96,6 +96,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void SetCursor_Postfix(object __instance, object __0)
         {
+            AnnouncementTiming.Event();
             try
             {
                 var cursor = __0 as GameCursor;
@@ -200,6 +200,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void InitActionState_Postfix(object __instance)
         {
+            AnnouncementTiming.Event();
             try
             {
                 if (__instance == null) return;
@@ -247,6 +248,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void CreateDamageView_Postfix(BattleUnitData data, int value, HitType hitType, bool isRecovery)
         {
+            AnnouncementTiming.Event();
             try
             {
                 int hitTypeValue = (int)hitType;
@@ -591,6 +593,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void SetMessage_Postfix(object __0)
         {
+            AnnouncementTiming.Event();
             try
             {
                 // __0 is the message string (using __0 to avoid IL2CPP string param crash)
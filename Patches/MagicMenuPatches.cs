@@ -368,6 +368,7 @@ namespace FFI_ScreenReader.Patches
 
         public static void SetCursor_Postfix(object __instance, int index, GameCursor targetCursor)
         {
+            AnnouncementTiming.Event();
             try
             {
                 if (!MagicMenuState.IsSpellListActive)
@@ -502,7 +503,10 @@ namespace FFI_ScreenReader.Patches
                 announcement = MenuPosition.Format(announcement, index, count);
 
                 if (announcement == _lastSpellAnnouncement)
+                {
+                    AnnouncementTiming.Dedup();
                     return false; // identical to the last announce (e.g. cursor-settle re-fire) — skip
+                }
                 _lastSpellAnnouncement = announcement;
 
                 FFI_ScreenReaderMod.SpeakText(announcement, interrupt: true);
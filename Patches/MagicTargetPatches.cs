@@ -142,6 +142,7 @@ namespace FFI_ScreenReader.Patches
 
         public static void TargetSetCursor_Postfix(object __instance, GameCursor targetCursor)
         {
+            AnnouncementTiming.Event();
             try
             {
                 if (__instance == null || targetCursor == null)
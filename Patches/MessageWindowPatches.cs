@@ -227,6 +227,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void SetContent_Postfix(object __instance)
         {
+            AnnouncementTiming.Event();
             try
             {
                 // Read messageList from the instance and store it
@@ -360,6 +361,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void PlayingInit_Postfix(object __instance)
         {
+            AnnouncementTiming.Event();
             try
             {
                 if (!IsInDialogue || currentPageBreaks.Count == 0)
@@ -368,6 +370,10 @@ namespace FFI_ScreenReader.Patches
                 // Get current page number from instance
                 int currentPage = GetCurrentPageNumber(__instance);
 
+                // Same page re-entering PlayingInit was already spoken
+                if (currentPage >= 0 && currentPage == lastAnnouncedPageIndex)
+                    AnnouncementTiming.Dedup();
+
                 // Announce page if we haven't announced it yet
                 if (currentPage >= 0 && currentPage < currentPageBreaks.Count && currentPage != lastAnnouncedPageIndex)
                 {
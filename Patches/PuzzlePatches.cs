@@ -109,6 +109,7 @@ namespace FFI_ScreenReader.Patches
 
         public static void Move_Postfix(object __instance)
         {
+            AnnouncementTiming.Event();
             try
             {
                 IntPtr ptr = (__instance as Il2CppObjectBase)?.Pointer ?? IntPtr.Zero;
@@ -144,7 +145,11 @@ namespace FFI_ScreenReader.Patches
                     LogSnapshot(ctrlPtr, cursorPos, emptyPos);
                 }
 
-                if (cursorPos == lastAnnouncedCursorPos) return;
+                if (cursorPos == lastAnnouncedCursorPos)
+                {
+                    AnnouncementTiming.Dedup();
+                    return;
+                }
                 lastAnnouncedCursorPos = cursorPos;
 
                 string label;
@@ -113,6 +113,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void FadeManagerPlay_Postfix(object __0)
         {
+            AnnouncementTiming.Event();
             try
             {
                 // __0 is the first parameter (message string)
@@ -159,6 +160,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void LineFadeWindowController_SetData_Postfix(object __0)
         {
+            AnnouncementTiming.Event();
             try
             {
                 if (__0 == null) return;
@@ -220,6 +222,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void ScrollManagerPlay_Postfix(object __1, object __2)
         {
+            AnnouncementTiming.Event();
             try
             {
                 // __1 is the second parameter (message string, first is ScrollType)
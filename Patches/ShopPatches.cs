@@ -199,6 +199,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void SetDescription_Postfix(ShopInfoController __instance)
         {
+            AnnouncementTiming.Event();
             try
             {
                 if (__instance == null)
@@ -262,7 +263,10 @@ namespace FFI_ScreenReader.Patches
             // Scoped exception to the "no dedup" rule: SetDescription also fires on stats/description panel
             // toggle for the same focused item, and no non-dedup signal covers unaffordable items.
             if (index == _lastAnnouncedListIndex)
+            {
+                AnnouncementTiming.Dedup();
                 return;
+            }
             _lastAnnouncedListIndex = index;
 
             IntPtr listPtr = IL2CppFieldReader.ReadPointer(instancePtr, IL2CppOffsets.Shop.ListMainProductContentList);
@@ -464,6 +468,7 @@ namespace FFI_ScreenReader.Patches
         /// </summary>
         public static void CommandSetCursor_Postfix(ShopCommandMenuController __instance, int index)
         {
+            AnnouncementTiming.Event();
             try
             {
                 if (__instance == null)
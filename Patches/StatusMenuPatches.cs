@@ -745,7 +745,10 @@ namespace FFI_ScreenReader.Patches
                     try
                     {
                         if (characterData.Name == tracker.CurrentCharacterData.Name)
+                        {
+                            AnnouncementTiming.Dedup();
                             yield break;
+                        }
                     }
                     catch { } // IL2CPP name read may fail, proceed with update
                 }
@@ -1,5 +1,6 @@
 using System;
 using System.Collections;
+using System.Runtime.CompilerServices;
 using FFI_ScreenReader.Core;
 
 namespace FFI_ScreenReader.Utils
@@ -7,7 +8,8 @@ namespace FFI_ScreenReader.Utils
     /// <summary>
     /// Helper coroutines for announcements that need to wait for UI to settle
     /// before reading state. No deduplication — every patch that calls into here
-    /// is already at a discrete event boundary.
+    /// is already at a discrete event boundary. The queuing patch's file and member are
+    /// captured here and forwarded so AnnouncementTiming attributes the speech to it.
     /// </summary>
     public static class AnnouncementHelper
     {
@@ -15,35 +17,38 @@ namespace FFI_ScreenReader.Utils
         /// Coroutine that waits one frame, then speaks the result of textGetter.
         /// Common pattern used across many patches for reading UI state after it updates.
         /// </summary>
-        public static IEnumerator DelayedSpeak(Func<string> textGetter, bool interrupt = false)
+        public static IEnumerator DelayedSpeak(Func<string> textGetter, bool interrupt = false,
+            [CallerFilePath] string callerFile = "", [CallerMemberName] string callerMember = "")
         {
             yield return null;
             string text = textGetter();
             if (!string.IsNullOrEmpty(text))
-                FFI_ScreenReaderMod.SpeakText(text, interrupt: interrupt);
+                FFI_ScreenReaderMod.SpeakText(text, interrupt: interrupt, callerFile: callerFile, callerMember: callerMember);
         }
 
         /// <summary>
         /// Coroutine that waits the specified number of frames, then speaks the result of textGetter.
         /// </summary>
-        public static IEnumerator DelayedSpeak(int frames, Func<string> textGetter, bool interrupt = false)
+        public static IEnumerator DelayedSpeak(int frames, Func<string> textGetter, bool interrupt = false,
+            [CallerFilePath] string callerFile = "", [CallerMemberName] string callerMember = "")
         {
             for (int i = 0; i < frames; i++)
                 yield return null;
             string text = textGetter();
             if (!string.IsNullOrEmpty(text))
-                FFI_ScreenReaderMod.SpeakText(text, interrupt: interrupt);
+                FFI_ScreenReaderMod.SpeakText(text, interrupt: interrupt, callerFile: callerFile, callerMember: callerMember);
         }
 
         /// <summary>
         /// Coroutine that waits the specified number of seconds, then speaks the result of textGetter.
         /// </summary>
-        public static IEnumerator DelayedSpeakSeconds(float seconds, Func<string> textGetter, bool interrupt = false)
+        public static IEnumerator DelayedSpeakSeconds(float seconds, Func<string> textGetter, bool interrupt = false,
+            [CallerFilePath] string callerFile = "", [CallerMemberName] string callerMember = "")
         {
             yield return new UnityEngine.WaitForSeconds(seconds);
             string text = textGetter();
             if (!string.IsNullOrEmpty(text))
-                FFI_ScreenReaderMod.SpeakText(text, interrupt: interrupt);
+                FFI_ScreenReaderMod.SpeakText(text, interrupt: interrupt, callerFile: callerFile, callerMember: callerMember);
         }
     }
 }
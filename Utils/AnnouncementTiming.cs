@@ -0,0 +1,69 @@
+using System.Diagnostics;
+using System.IO;
+using System.Runtime.CompilerServices;
+using MelonLoader;
+using FFI_ScreenReader.Core;
+
+namespace FFI_ScreenReader.Utils
+{
+    /// <summary>
+    /// Opt-in high-resolution timing records for the speech path (AnnouncementTiming preference).
+    /// Hooks call Event() on entry, SpeakText calls Speak() around the Tolk output, and patches
+    /// that drop a repeat call Dedup(). Each writes one "[Timing]" log line with a microsecond
+    /// timestamp; tools/announcement_latency.py pairs them by event id.
+    /// When the preference is off every method is a single flag check.
+    /// </summary>
+    public static class AnnouncementTiming
+    {
+        private static readonly double microsecondsPerTick = 1_000_000.0 / Stopwatch.Frequency;
+        private static long eventCounter = 0;
+        private static long currentEvent = 0;
+
+        /// <summary>
+        /// True when timing records are being written.
+        /// </summary>
+        public static bool Enabled => PreferencesManager.AnnouncementTiming;
+
+        /// <summary>
+        /// Microseconds on the Stopwatch clock (monotonic, unaffected by the wall clock).
+        /// </summary>
+        public static long Now => (long)(Stopwatch.GetTimestamp() * microsecondsPerTick);
+
+        /// <summary>
+        /// Marks a game event entering a hook. Speech and dedup records that follow are
+        /// attributed to this event until the next one.
+        /// </summary>
+        public static void Event([CallerFilePath] string file = "", [CallerMemberName] string member = "")
+        {
+            if (!Enabled)
+                return;
+
+            currentEvent = ++eventCounter;
+            MelonLogger.Msg($"[Timing] evt id={currentEvent} t={Now} src={Source(file, member)}");
+        }
+
+        /// <summary>
+        /// Records one Tolk output: start timestamp, time spent in the native call and the caller.
+        /// </summary>
+        public static void Speak(long start, long end, int length, string callerFile, string callerMember)
+        {
+            MelonLogger.Msg($"[Timing] speak evt={currentEvent} t={start} out={end - start} len={length} src={Source(callerFile, callerMember)}");
+        }
+
+        /// <summary>
+        /// Records an announcement dropped because it repeats the previous one.
+        /// </summary>
+        public static void Dedup([CallerFilePath] string file = "", [CallerMemberName] string member = "")
+        {
+            if (!Enabled)
+                return;
+
+            MelonLogger.Msg($"[Timing] dedup evt={currentEvent} t={Now} src={Source(file, member)}");
+        }
+
+        private static string Source(string file, string member)
+        {
+            return $"{Path.GetFileNameWithoutExtension(file)}.{member}";
+        }
+    }
+}
@@ -1,7 +1,5 @@
 using System;
 using System.Collections.Generic;
-using System.IO;
-using System.Reflection;
 using System.Text;
 using System.Text.RegularExpressions;
 using MelonLoader;
@@ -18,7 +16,7 @@ namespace FFI_ScreenReader.Utils
     /// </summary>
     public static class EntityTranslator
     {
-        private static Dictionary<string, Dictionary<string, string>> translations;
+        private static TranslationSlices slices;
         private static bool isInitialized = false;
         private static string cachedLanguageCode = "en";
         private static bool hasLoggedLanguage = false;
@@ -114,51 +112,23 @@ namespace FFI_ScreenReader.Utils
         }
 
         /// <summary>
-        /// Loads the embedded translation resource into the multi-language lookup dictionary.
+        /// Locates the embedded translation language slices (compiled from translation.json at build time).
+        /// The slice for the detected language is loaded on first lookup; entries with no
+        /// non-empty values are dropped by the compiler.
         /// </summary>
         public static void Initialize()
         {
             if (isInitialized) return;
 
-            translations = new Dictionary<string, Dictionary<string, string>>();
-
             try
             {
-                using var stream = Assembly.GetExecutingAssembly()
-                    .GetManifestResourceStream("translation.json");
-
-                if (stream != null)
-                {
-                    using var reader = new StreamReader(stream, Encoding.UTF8);
-                    string json = reader.ReadToEnd();
-
-                    var data = ModTextTranslator.ParseNestedJson(json);
-
-                    foreach (var entry in data)
-                    {
-                        bool hasValue = false;
-                        foreach (var langEntry in entry.Value)
-                        {
-                            if (!string.IsNullOrEmpty(langEntry.Value))
-                            {
-                                hasValue = true;
-                                break;
-                            }
-                        }
-                        if (hasValue)
-                            translations[entry.Key] = entry.Value;
-                    }
-
-                    MelonLogger.Msg($"[EntityTranslator] Loaded {translations.Count} translations from embedded resource");
-                }
-                else
-                {
-                    MelonLogger.Warning("[EntityTranslator] Embedded translation resource not found");
-                }
+                slices = new TranslationSlices("translation", "EntityTranslator");
+                MelonLogger.Msg($"[EntityTranslator] Found translations for {slices.LanguageCount} languages");
             }
             catch (Exception ex)
             {
-                MelonLogger.Warning($"[EntityTranslator] Error loading translations: {ex.Message}");
+                slices = null;
+                MelonLogger.Warning($"[EntityTranslator] Error locating translations, using untranslated text: {ex.Message}");
             }
 
             isInitialized = true;
@@ -177,7 +147,7 @@ namespace FFI_ScreenReader.Utils
             if (!isInitialized)
                 Initialize();
 
-            if (translations.Count == 0)
+            if (slices == null || slices.LanguageCount == 0)
                 return japaneseName;
 
             // When game is in Japanese, entity names are already Japanese — no translation needed
@@ -272,26 +242,15 @@ namespace FFI_ScreenReader.Utils
         }
 
         /// <summary>
-        /// Looks up a Japanese key in the translations dictionary for the current game language.
+        /// Looks up a Japanese key in the current language's translation slice for the current game language.
         /// </summary>
         private static bool TryLookup(string key, out string result)
         {
-            result = null;
-            if (!translations.TryGetValue(key, out var langDict))
-                return false;
             string lang = DetectLanguage();
-            if (langDict.TryGetValue(lang, out string localized) && !string.IsNullOrEmpty(localized))
-            {
-                result = localized;
+            if (slices.TryGet(lang, key, out result))
                 return true;
-            }
             // Fallback to English
-            if (lang != "en" && langDict.TryGetValue("en", out string english) && !string.IsNullOrEmpty(english))
-            {
-                result = english;
-                return true;
-            }
-            return false;
+            return lang != "en" && slices.TryGetEnglish(key, out result);
         }
 
         /// <summary>
@@ -334,9 +293,9 @@ namespace FFI_ScreenReader.Utils
         }
 
         /// <summary>
-        /// Gets the count of loaded translations.
+        /// Gets the count of translations for the current language (0 until its slice is loaded).
         /// </summary>
-        public static int TranslationCount => translations?.Count ?? 0;
+        public static int TranslationCount => slices?.KeyCount(DetectLanguage()) ?? 0;
 
         /// <summary>
         /// Clears the untranslated names tracking dictionary.
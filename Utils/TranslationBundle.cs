@@ -0,0 +1,178 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Reflection;
+using System.Text;
+using MelonLoader;
+
+namespace FFI_ScreenReader.Utils
+{
+    /// <summary>
+    /// Read-only view over a translation bundle compiled by tools/compile_translations.py.
+    /// Lookups hash straight into the embedded bytes (minimal perfect hash per language),
+    /// so nothing is parsed at startup and strings are only decoded when first requested.
+    /// See the compiler's header comment for the byte layout.
+    /// </summary>
+    public sealed class TranslationBundle
+    {
+        private const uint Magic = 0x42544646; // "FFTB"
+        private const ushort SupportedVersion = 1;
+        private const int HeaderSize = 24;
+        private const int LanguageEntrySize = 12;
+        private const int SlotSize = 6;
+
+        private readonly byte[] data;
+        private readonly int keyTableOffset;
+        private readonly int poolOffset;
+        private readonly Dictionary<string, LanguageIndex> languages = new Dictionary<string, LanguageIndex>();
+
+        // Decoded results per language (null = miss), so repeated announcements skip hashing
+        private readonly Dictionary<string, Dictionary<string, string>> lookupCache =
+            new Dictionary<string, Dictionary<string, string>>();
+
+        private struct LanguageIndex
+        {
+            public int BucketCount;
+            public int DisplacementOffset;
+            public int SlotOffset;
+            public int Count;
+        }
+
+        /// <summary>
+        /// Number of distinct keys across all languages.
+        /// </summary>
+        public int KeyCount { get; }
+
+        private TranslationBundle(byte[] data)
+        {
+            this.data = data;
+            if (data.Length < HeaderSize || BitConverter.ToUInt32(data, 0) != Magic)
+                throw new InvalidDataException("not a translation bundle");
+            ushort version = BitConverter.ToUInt16(data, 4);
+            if (version != SupportedVersion)
+                throw new InvalidDataException($"unsupported bundle version {version}");
+
+            int languageCount = BitConverter.ToUInt16(data, 6);
+            KeyCount = (int)BitConverter.ToUInt32(data, 8);
+            keyTableOffset = (int)BitConverter.ToUInt32(data, 12);
+            poolOffset = (int)BitConverter.ToUInt32(data, 16);
+
+            for (int i = 0; i < languageCount; i++)
+            {
+                int entry = HeaderSize + i * LanguageEntrySize;
+                string code = ReadPoolString((int)BitConverter.ToUInt32(data, entry));
+                int indexOffset = (int)BitConverter.ToUInt32(data, entry + 4);
+                int bucketCount = (int)BitConverter.ToUInt32(data, indexOffset);
+                languages[code] = new LanguageIndex
+                {
+                    BucketCount = bucketCount,
+                    DisplacementOffset = indexOffset + 4,
+                    SlotOffset = indexOffset + 4 + bucketCount * 4,
+                    Count = (int)BitConverter.ToUInt32(data, entry + 8)
+                };
+            }
+        }
+
+        /// <summary>
+        /// Loads a bundle from an embedded resource. Returns null (and logs) if it is missing or invalid.
+        /// </summary>
+        public static TranslationBundle LoadResource(string resourceName, string logTag)
+        {
+            try
+            {
+                using var stream = Assembly.GetExecutingAssembly().GetManifestResourceStream(resourceName);
+                if (stream == null)
+                {
+                    MelonLogger.Warning($"[{logTag}] Embedded {resourceName} not found");
+                    return null;
+                }
+
+                var bytes = new byte[stream.Length];
+                int read = 0;
+                while (read < bytes.Length)
+                {
+                    int n = stream.Read(bytes, read, bytes.Length - read);
+                    if (n <= 0) break;
+                    read += n;
+                }
+                return new TranslationBundle(bytes);
+            }
+            catch (Exception ex)
+            {
+                MelonLogger.Warning($"[{logTag}] Error loading {resourceName}: {ex.Message}");
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Looks up the value for a key in one language. Empty values are never stored,
+        /// so a hit is always a non-empty string.
+        /// </summary>
+        public bool TryGet(string lang, string key, out string value)
+        {
+            value = null;
+            if (key == null || !languages.TryGetValue(lang, out var index) || index.Count == 0)
+                return false;
+
+            if (!lookupCache.TryGetValue(lang, out var cache))
+            {
+                cache = new Dictionary<string, string>();
+                lookupCache[lang] = cache;
+            }
+            if (cache.TryGetValue(key, out value))
+                return value != null;
+
+            value = Lookup(index, Encoding.UTF8.GetBytes(key));
+            cache[key] = value;
+            return value != null;
+        }
+
+        private string Lookup(LanguageIndex index, byte[] key)
+        {
+            uint bucket = Hash(key, 0) % (uint)index.BucketCount;
+            int d = BitConverter.ToInt32(data, index.DisplacementOffset + (int)bucket * 4);
+            int slot = d < 0 ? -d - 1 : (int)(Hash(key, (uint)d) % (uint)index.Count);
+
+            int slotOffset = index.SlotOffset + slot * SlotSize;
+            int keyId = BitConverter.ToUInt16(data, slotOffset);
+            int keyOffset = (int)BitConverter.ToUInt32(data, keyTableOffset + keyId * 4);
+            if (!PoolStringEquals(keyOffset, key))
+                return null;
+            return ReadPoolString((int)BitConverter.ToUInt32(data, slotOffset + 2));
+        }
+
+        /// <summary>
+        /// 32-bit FNV-1a with the seed folded into the offset basis (matches compile_translations.fnv1a).
+        /// </summary>
+        private static uint Hash(byte[] bytes, uint seed)
+        {
+            uint h = 0x811C9DC5 ^ seed;
+            for (int i = 0; i < bytes.Length; i++)
+            {
+                h ^= bytes[i];
+                h *= 0x01000193;
+            }
+            return h;
+        }
+
+        private bool PoolStringEquals(int offset, byte[] key)
+        {
+            int start = poolOffset + offset;
+            int length = BitConverter.ToUInt16(data, start);
+            if (length != key.Length)
+                return false;
+            for (int i = 0; i < length; i++)
+            {
+                if (data[start + 2 + i] != key[i])
+                    return false;
+            }
+            return true;
+        }
+
+        private string ReadPoolString(int offset)
+        {
+            int start = poolOffset + offset;
+            return Encoding.UTF8.GetString(data, start + 2, BitConverter.ToUInt16(data, start));
+        }
+    }
+}
@@ -0,0 +1,133 @@
+using System.Collections.Generic;
+using System.Reflection;
+using MelonLoader;
+
+namespace FFI_ScreenReader.Utils
+{
+    /// <summary>
+    /// Lazily loads per-language translation bundles ("name-lang.bin" embedded resources,
+    /// written by tools/compile_translations.py --split). Only the active language's slice
+    /// is resident, plus English once a fallback lookup needs it; when the game language
+    /// changes the previous slice is released and the new one is loaded on first use.
+    /// </summary>
+    public sealed class TranslationSlices
+    {
+        private readonly string resourceName;
+        private readonly string logTag;
+        private readonly HashSet<string> availableLanguages = new HashSet<string>();
+
+        private string activeLanguage;
+        private TranslationBundle activeSlice;
+        private TranslationBundle englishSlice;
+        private bool englishLoaded = false;
+
+        public TranslationSlices(string resourceName, string logTag)
+        {
+            this.resourceName = resourceName;
+            this.logTag = logTag;
+
+            // Only "<name>-<lang>.bin" counts; anything else with the same name (e.g. a
+            // single-bundle "<name>.bin" from an older build) is ignored
+            string prefix = resourceName + "-";
+            const string suffix = ".bin";
+            foreach (string name in Assembly.GetExecutingAssembly().GetManifestResourceNames())
+            {
+                if (name.Length <= prefix.Length + suffix.Length || !name.StartsWith(prefix) || !name.EndsWith(suffix))
+                    continue;
+
+                string lang = name.Substring(prefix.Length, name.Length - prefix.Length - suffix.Length);
+                if (lang.IndexOf('.') < 0 && lang.IndexOf('-') < 0)
+                    availableLanguages.Add(lang);
+            }
+
+            if (availableLanguages.Count == 0)
+                MelonLogger.Warning($"[{logTag}] No embedded {resourceName} language slices found");
+        }
+
+        /// <summary>
+        /// Number of languages with an embedded slice.
+        /// </summary>
+        public int LanguageCount => availableLanguages.Count;
+
+        /// <summary>
+        /// Looks up a key in the game's current language, loading (or swapping to) that
+        /// language's slice if needed. When the game is in English the previous language's
+        /// slice is released and lookups are served by the English slice.
+        /// </summary>
+        public bool TryGet(string lang, string key, out string value)
+        {
+            if (lang == "en")
+            {
+                if (activeLanguage != null)
+                    ReleaseActive("en");
+                return TryGetEnglish(key, out value);
+            }
+
+            value = null;
+            var slice = GetActive(lang);
+            return slice != null && slice.TryGet(lang, key, out value);
+        }
+
+        /// <summary>
+        /// English fallback lookup; loads the English slice without touching the active one.
+        /// </summary>
+        public bool TryGetEnglish(string key, out string value)
+        {
+            value = null;
+            var slice = GetEnglish();
+            return slice != null && slice.TryGet("en", key, out value);
+        }
+
+        /// <summary>
+        /// Key count of the given language's slice if it is already loaded, otherwise 0.
+        /// Never loads or swaps slices.
+        /// </summary>
+        public int KeyCount(string lang)
+        {
+            var slice = lang == "en" ? englishSlice : (lang == activeLanguage ? activeSlice : null);
+            return slice?.KeyCount ?? 0;
+        }
+
+        private TranslationBundle GetActive(string lang)
+        {
+            if (lang == activeLanguage)
+                return activeSlice;
+
+            ReleaseActive(lang);
+            activeLanguage = lang;
+            activeSlice = Load(lang);
+            return activeSlice;
+        }
+
+        private void ReleaseActive(string newLanguage)
+        {
+            if (activeLanguage != null)
+                MelonLogger.Msg($"[{logTag}] Language changed {activeLanguage} -> {newLanguage}, releasing {activeLanguage} slice");
+
+            activeLanguage = null;
+            activeSlice = null;
+        }
+
+        private TranslationBundle GetEnglish()
+        {
+
+            if (!englishLoaded)
+            {
+                englishSlice = Load("en");
+                englishLoaded = true;
+            }
+            return englishSlice;
+        }
+
+        private TranslationBundle Load(string lang)
+        {
+            if (!availableLanguages.Contains(lang))
+                return null;
+
+            var slice = TranslationBundle.LoadResource($"{resourceName}.{lang}.bin", logTag);
+            if (slice != null)
+                MelonLogger.Msg($"[{logTag}] Loaded {lang} slice ({slice.KeyCount} entries)");
+            return slice;
+        }
+    }
+}
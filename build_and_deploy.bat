@@ -1,6 +1,15 @@
 @echo off
 cd /d "%~dp0"
 echo Building FFI Screen Reader Mod... > build_log.txt
+
+rem The build compiles the translation bundles with Python 3 (tools\compile_translations.py)
+where python >nul 2>&1
+if %ERRORLEVEL% NEQ 0 (
+    echo Python 3 not found on PATH - it is required to build. >> build_log.txt
+    echo Python 3 not found on PATH - it is required to build the translation bundles.
+    exit /b 1
+)
+
 echo Building...
 dotnet build -c Debug >> build_log.txt 2>&1
 set BUILD_ERROR=%ERRORLEVEL%
@@ -0,0 +1,108 @@
+# Ghidra headless script to index which functions reference which string literals
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+#
+# Loads Il2CppDumper's ScriptString entries from script.json (each is the RVA of
+# a StringLiteral slot plus its text), then makes one pass over every reference
+# in the program's executable blocks and keeps those that land on a slot.
+# Output goes to XREF_INDEX_DIR/strings.tsv next to the call graph from
+# build_xref_index.py; query both with xref_query.py:
+#   python xref_query.py uses-string "MSG_"
+#   python xref_query.py strings-of MapModel$$GetMapName
+
+import codecs
+import os
+import time
+
+from script_json import load_script_json
+
+# Paths
+XREF_INDEX_DIR = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\xref_index"
+SCRIPT_JSON_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\script.json"
+
+def load_string_literals():
+    """(slot RVA -> text, method RVA -> name) from script.json."""
+    data = load_script_json(SCRIPT_JSON_PATH)
+    if data is None:
+        print("ERROR: script.json not found at: " + SCRIPT_JSON_PATH)
+        return {}, {}
+    strings = {}
+    for entry in data.get("ScriptString", []):
+        if entry.get("Address"):
+            strings[entry["Address"]] = entry.get("Value", "")
+    names = {}
+    for method in data.get("ScriptMethod", []):
+        addr = method.get("Address")
+        if addr and method.get("Name") and addr not in names:
+            names[addr] = method["Name"]
+    print("Loaded " + str(len(strings)) + " string literals, " + str(len(names)) + " method names")
+    return strings, names
+
+def escape(text):
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\r", "\\r").replace("\n", "\\n")
+
+def run():
+    """Main script entry point."""
+    print("=" * 70)
+    print("FF1 String Literal Reference Index Builder")
+    print("=" * 70)
+
+    program = getCurrentProgram()
+    if program is None:
+        print("ERROR: No program loaded!")
+        return
+
+    image_base = program.getImageBase().getOffset()
+    print("Program: " + program.getName())
+    print("Output: " + XREF_INDEX_DIR)
+    print("")
+
+    strings, names = load_string_literals()
+    if not strings:
+        return
+
+    ref_mgr = program.getReferenceManager()
+    func_mgr = program.getFunctionManager()
+    hits = set()
+    start = time.time()
+    scanned = 0
+
+    for block in program.getMemory().getBlocks():
+        if not block.isExecute():
+            continue
+        print("Scanning block " + block.getName() + "...")
+        sources = ref_mgr.getReferenceSourceIterator(block.getStart(), True)
+        while sources.hasNext():
+            src = sources.next()
+            if src.compareTo(block.getEnd()) > 0 or getMonitor().isCancelled():
+                break
+            scanned += 1
+            for ref in ref_mgr.getReferencesFrom(src):
+                slot_rva = ref.getToAddress().getOffset() - image_base
+                if slot_rva not in strings:
+                    continue
+                func = func_mgr.getFunctionContaining(src)
+                func_rva = func.getEntryPoint().getOffset() - image_base if func else 0
+                hits.add((slot_rva, func_rva, src.getOffset() - image_base))
+
+    if not os.path.exists(XREF_INDEX_DIR):
+        os.makedirs(XREF_INDEX_DIR)
+    output_path = os.path.join(XREF_INDEX_DIR, "strings.tsv")
+    with codecs.open(output_path, 'w', 'utf-8') as f:
+        f.write("# image_base\t{:X}\n".format(image_base))
+        f.write("# string_rva\tfunction_rva\tfunction\tsite_rva\tvalue\n")
+        for slot_rva, func_rva, site_rva in sorted(hits):
+            func_name = names.get(func_rva)
+            if func_name is None:
+                func_name = "FUN_{:x}".format(image_base + func_rva) if func_rva else "(no function)"
+            f.write("{:X}\t{:X}\t{}\t{:X}\t{}\n".format(slot_rva, func_rva, func_name, site_rva, escape(strings[slot_rva])))
+
+    referenced = len(set(h[0] for h in hits))
+    print("")
+    print("=" * 70)
+    print("Index complete in {:.0f}s ({} reference sources scanned)".format(time.time() - start, scanned))
+    print("  {} references to {} of {} string literals".format(len(hits), referenced, len(strings)))
+    print("  Output: " + output_path)
+    print("=" * 70)
+
+# Run the script
+run()
@@ -0,0 +1,168 @@
+# Ghidra headless script to build a caller/callee index for FF1's GameAssembly.dll
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+#
+# Extracts every call edge in one pass and writes it to XREF_INDEX_DIR as two
+# tab-separated files that xref_query.py compiles into a SQLite index:
+#   functions.tsv  - rva, name (script.json name when known, else Ghidra's
+#                    FUN_<absolute address>); the header records the image base
+#   edges.tsv      - caller rva, callee rva, call site rva
+#
+# Set NAMESPACE_FILTER to a list of class names (e.g. ["MapRouteSearcher"]) to
+# only index edges into/out of those classes - much faster than a full scan
+# when you only need patch points for one area.
+
+from ghidra.util.task import ConsoleTaskMonitor
+import codecs
+import os
+import time
+
+from script_json import load_script_json
+
+# Empty list = whole binary
+NAMESPACE_FILTER = []
+
+# Paths
+XREF_INDEX_DIR = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\xref_index"
+SCRIPT_JSON_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\script.json"
+
+def load_script_names():
+    """Map RVA -> IL2CPP method name from script.json (first name wins for shared code)."""
+    names = {}
+    print("Loading IL2CPP method names from: " + SCRIPT_JSON_PATH)
+    data = load_script_json(SCRIPT_JSON_PATH)
+    if data is None:
+        print("WARNING: script.json not found at: " + SCRIPT_JSON_PATH)
+        return names
+    for method in data.get("ScriptMethod", []):
+        addr = method.get("Address")
+        name = method.get("Name")
+        if addr and name and addr not in names:
+            names[addr] = name
+    print("Loaded " + str(len(names)) + " method names")
+    return names
+
+def in_namespace(name):
+    if not NAMESPACE_FILTER:
+        return True
+    class_name = name.split("$$")[0] if "$$" in name else name
+    return class_name in NAMESPACE_FILTER
+
+def function_name(func, image_base, script_names):
+    rva = func.getEntryPoint().getOffset() - image_base
+    return script_names.get(rva, func.getName())
+
+def collect_call_edges(program, func, image_base, edges, monitor):
+    """Append (caller, callee, site) for every call reference out of func."""
+    ref_mgr = program.getReferenceManager()
+    func_mgr = program.getFunctionManager()
+    caller_rva = func.getEntryPoint().getOffset() - image_base
+
+    sources = ref_mgr.getReferenceSourceIterator(func.getBody(), True)
+    while sources.hasNext():
+        if monitor.isCancelled():
+            return
+        src = sources.next()
+        for ref in ref_mgr.getReferencesFrom(src):
+            ref_type = ref.getReferenceType()
+            if not (ref_type.isCall() or ref_type.isJump()):
+                continue
+            callee = func_mgr.getFunctionAt(ref.getToAddress())
+            if callee is None:
+                continue
+            # Jumps only count as edges when they are tail calls into another function
+            if ref_type.isJump() and callee.getEntryPoint() == func.getEntryPoint():
+                continue
+            callee_rva = callee.getEntryPoint().getOffset() - image_base
+            edges.add((caller_rva, callee_rva, src.getOffset() - image_base))
+
+def collect_caller_edges(program, func, image_base, edges):
+    """Append (caller, callee, site) for every call reference into func."""
+    ref_mgr = program.getReferenceManager()
+    func_mgr = program.getFunctionManager()
+    callee_rva = func.getEntryPoint().getOffset() - image_base
+
+    for ref in ref_mgr.getReferencesTo(func.getEntryPoint()):
+        ref_type = ref.getReferenceType()
+        if not (ref_type.isCall() or ref_type.isJump()):
+            continue
+        caller = func_mgr.getFunctionContaining(ref.getFromAddress())
+        if caller is None or caller.getEntryPoint() == func.getEntryPoint():
+            continue
+        caller_rva = caller.getEntryPoint().getOffset() - image_base
+        edges.add((caller_rva, callee_rva, ref.getFromAddress().getOffset() - image_base))
+
+def write_index(functions, edges, image_base):
+    if not os.path.exists(XREF_INDEX_DIR):
+        os.makedirs(XREF_INDEX_DIR)
+
+    functions_path = os.path.join(XREF_INDEX_DIR, "functions.tsv")
+    with codecs.open(functions_path, 'w', 'utf-8') as f:
+        f.write("# image_base\t{:X}\n".format(image_base))
+        f.write("# rva\tname\n")
+        for rva in sorted(functions):
+            f.write("{:X}\t{}\n".format(rva, functions[rva]))
+
+    edges_path = os.path.join(XREF_INDEX_DIR, "edges.tsv")
+    with codecs.open(edges_path, 'w', 'utf-8') as f:
+        f.write("# caller_rva\tcallee_rva\tsite_rva\n")
+        for caller, callee, site in sorted(edges):
+            f.write("{:X}\t{:X}\t{:X}\n".format(caller, callee, site))
+
+    print("  Functions: " + str(len(functions)) + " -> " + functions_path)
+    print("  Edges:     " + str(len(edges)) + " -> " + edges_path)
+
+def run():
+    """Main script entry point."""
+    print("=" * 70)
+    print("FF1 Cross-Reference Index Builder")
+    print("=" * 70)
+
+    program = getCurrentProgram()
+    if program is None:
+        print("ERROR: No program loaded!")
+        return
+
+    image_base = program.getImageBase().getOffset()
+    print("Program: " + program.getName())
+    print("Image Base: 0x{:X}".format(image_base))
+    print("Namespace filter: " + (", ".join(NAMESPACE_FILTER) if NAMESPACE_FILTER else "(whole binary)"))
+    print("Output: " + XREF_INDEX_DIR)
+    print("")
+
+    script_names = load_script_names()
+    monitor = ConsoleTaskMonitor()
+    func_mgr = program.getFunctionManager()
+
+    functions = {}
+    edges = set()
+    start = time.time()
+    scanned = 0
+
+    for func in func_mgr.getFunctions(True):
+        if monitor.isCancelled():
+            break
+        name = function_name(func, image_base, script_names)
+        if not in_namespace(name):
+            continue
+        if NAMESPACE_FILTER:
+            collect_caller_edges(program, func, image_base, edges)
+        collect_call_edges(program, func, image_base, edges, monitor)
+        scanned += 1
+        if scanned % 10000 == 0:
+            print("  Scanned {} functions, {} edges ({:.0f}s)".format(scanned, len(edges), time.time() - start))
+
+    # Name every function that appears on either end of an edge
+    for caller, callee, site in edges:
+        for rva in (caller, callee):
+            if rva not in functions:
+                func = func_mgr.getFunctionAt(toAddr(image_base + rva))
+                functions[rva] = function_name(func, image_base, script_names) if func else "FUN_{:x}".format(image_base + rva)
+
+    print("")
+    print("=" * 70)
+    print("Index complete in {:.0f}s ({} functions scanned)".format(time.time() - start, scanned))
+    write_index(functions, edges, image_base)
+    print("=" * 70)
+
+# Run the script
+run()
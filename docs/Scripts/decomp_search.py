@@ -0,0 +1,230 @@
+# Symbol-aware search over the decompiled_*.c outputs in this folder
+# Runs under regular Python 3 (not Ghidra)
+#
+# Tokenises every decompiled file into an inverted index (SQLite) that knows:
+#   - Function boundaries from the "/* Class$$Method / * RVA: 0x..." banners
+#   - C identifiers, FUN_/DAT_/LAB_ names (case-insensitive)
+#   - Hex literals normalised by value (0x88 == 0x088 == 136 in hex form)
+#   - Field offsets: a literal added to a pointer, "(param_1 + 0xf8)", is also
+#     indexed as "+0xf8" and tagged read or write from its side of the "=";
+#     the target of a compound assignment ("+=", "|=", ...) is both
+#
+# Several terms (find) or offsets (offset) match functions containing all of
+# them; "offset --any" matches functions containing at least one.
+#
+# Files are re-indexed incrementally when their size or mtime changes.
+#
+# Usage:
+#   python decomp_search.py offset 0xF8 --writes
+#   python decomp_search.py offset 0xF8 0x100 --any
+#   python decomp_search.py find FUN_1802794b0
+#   python decomp_search.py find DAT_181a72610 param_3
+#   python decomp_search.py functions
+
+import argparse
+import glob
+import os
+import re
+import sqlite3
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(SCRIPTS_DIR, "decompiled_index.db")
+SOURCE_GLOB = "decompiled_*.c"
+
+TOKEN = re.compile(r"0x[0-9A-Fa-f]+|[A-Za-z_][A-Za-z0-9_$]*")
+OFFSET = re.compile(r"\+\s*(0x[0-9A-Fa-f]+|\d+)\s*\)")
+ASSIGN = re.compile(r"(?<![=!<>])(<<|>>|[+\-*/%&|^])?=(?!=)")
+BANNER_RULE = re.compile(r"^/\*{20,}/$")
+BANNER_NAME = re.compile(r"^/\* (\S+)\s*$")
+BANNER_RVA = re.compile(r"^ \* RVA: 0x([0-9A-Fa-f]+)")
+BANNER_END = re.compile(r"^ \*{20,}/$")
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime REAL);
+    CREATE TABLE IF NOT EXISTS functions (
+        id INTEGER PRIMARY KEY, path TEXT, name TEXT, rva INTEGER, start_line INTEGER, end_line INTEGER);
+    CREATE TABLE IF NOT EXISTS postings (token TEXT, function_id INTEGER, line INTEGER, access TEXT);
+    CREATE INDEX IF NOT EXISTS postings_token ON postings (token);
+    CREATE INDEX IF NOT EXISTS functions_path ON functions (path);
+"""
+
+def normalize(token):
+    """Canonical index form of a query or source token."""
+    token = token.strip()
+    if token.startswith("+"):
+        return "+" + normalize(token[1:])
+    if token.lower().startswith("0x"):
+        return "0x{:x}".format(int(token, 16))
+    return token.lower()
+
+def tokenize_line(line):
+    """Yield (token, access) for one source line; access is 'r', 'w' or ''."""
+    m = ASSIGN.search(line)
+    split = m.start() if m and not line.lstrip().startswith(("if", "while", "for", "return")) else -1
+    compound = split >= 0 and m.group(1) is not None
+
+    for t in TOKEN.finditer(line):
+        yield normalize(t.group()), ""
+    for o in OFFSET.finditer(line):
+        written = split >= 0 and o.start() < split
+        value = o.group(1)
+        value = "+" + normalize(value if value.lower().startswith("0x") else hex(int(value)))
+        yield value, "w" if written else "r"
+        if written and compound:
+            yield value, "r"
+
+def parse_functions(lines):
+    """Split a decompiled file into (name, rva, start, end, body_start) sections (1-based lines)."""
+    sections = []
+    i = 0
+    while i < len(lines):
+        if BANNER_RULE.match(lines[i]) and i + 1 < len(lines):
+            name_match = BANNER_NAME.match(lines[i + 1])
+            if name_match:
+                rva = None
+                j = i + 2
+                while j < len(lines) and not BANNER_END.match(lines[j]):
+                    rva_match = BANNER_RVA.match(lines[j])
+                    if rva_match:
+                        rva = int(rva_match.group(1), 16)
+                    j += 1
+                if sections:
+                    sections[-1][3] = i
+                sections.append([name_match.group(1), rva, i + 1, len(lines), j + 2])
+                i = j + 1
+                continue
+        i += 1
+    return sections
+
+def index_file(db, path):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        lines = f.read().split("\n")
+
+    db.execute("DELETE FROM postings WHERE function_id IN (SELECT id FROM functions WHERE path = ?)", (path,))
+    db.execute("DELETE FROM functions WHERE path = ?", (path,))
+
+    postings = []
+    for name, rva, start, end, body_start in parse_functions(lines):
+        cur = db.execute("INSERT INTO functions (path, name, rva, start_line, end_line) VALUES (?, ?, ?, ?, ?)",
+                         (path, name, rva, start, end))
+        function_id = cur.lastrowid
+        seen = set()
+        for line_no in range(body_start, end + 1):
+            for token, access in tokenize_line(lines[line_no - 1]):
+                key = (token, line_no, access)
+                if key not in seen:
+                    seen.add(key)
+                    postings.append((token, function_id, line_no, access))
+    db.executemany("INSERT INTO postings VALUES (?, ?, ?, ?)", postings)
+    return len(postings)
+
+def open_index(index_path=INDEX_PATH, source_dir=SCRIPTS_DIR, quiet=False):
+    """Open the index, re-indexing any decompiled file that changed since last time."""
+    db = sqlite3.connect(index_path)
+    db.executescript(SCHEMA)
+
+    known = dict((row[0], (row[1], row[2])) for row in db.execute("SELECT path, size, mtime FROM files"))
+    current = sorted(glob.glob(os.path.join(source_dir, SOURCE_GLOB)))
+
+    for path in current:
+        st = os.stat(path)
+        if known.get(path) == (st.st_size, st.st_mtime):
+            continue
+        count = index_file(db, path)
+        db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?)", (path, st.st_size, st.st_mtime))
+        if not quiet:
+            print("Indexed {} ({} postings)".format(os.path.basename(path), count), file=sys.stderr)
+
+    for path in set(known) - set(current):
+        db.execute("DELETE FROM postings WHERE function_id IN (SELECT id FROM functions WHERE path = ?)", (path,))
+        db.execute("DELETE FROM functions WHERE path = ?", (path,))
+        db.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    db.commit()
+    return db
+
+def search(db, tokens, access=None, match_any=False):
+    """Return {function_id: [(line, token)]} for functions containing every token
+    (any one of them with match_any)."""
+    matches = None
+    hits = {}
+    for token in tokens:
+        query = "SELECT function_id, line FROM postings WHERE token = ?"
+        params = [token]
+        if access and token.startswith("+"):
+            query += " AND access = ?"
+            params.append(access)
+        found = {}
+        for function_id, line in db.execute(query, params):
+            found.setdefault(function_id, []).append((line, token))
+        if matches is None:
+            matches = set(found)
+        elif match_any:
+            matches |= set(found)
+        else:
+            matches &= set(found)
+        for function_id, lines in found.items():
+            hits.setdefault(function_id, []).extend(lines)
+    return dict((fid, sorted(set(hits[fid]))) for fid in (matches or ()))
+
+_file_cache = {}
+
+def source_line(path, line_no):
+    if path not in _file_cache:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            _file_cache[path] = f.read().split("\n")
+    return _file_cache[path][line_no - 1].strip()
+
+def print_hits(db, hits, show_lines):
+    if not hits:
+        print("No matches")
+        return
+    rows = db.execute("SELECT id, path, name, rva FROM functions WHERE id IN ({})".format(
+        ",".join(str(fid) for fid in hits))).fetchall()
+    for function_id, path, name, rva in sorted(rows, key=lambda r: r[2]):
+        rva_text = "0x{:X}".format(rva) if rva is not None else "?"
+        print("{} (RVA {}) - {}".format(name, rva_text, os.path.basename(path)))
+        if show_lines:
+            for line_no in sorted(set(line for line, _ in hits[function_id])):
+                print("  {:>5}: {}".format(line_no, source_line(path, line_no)))
+    print("{} function(s)".format(len(rows)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Search decompiled FF1 functions")
+    parser.add_argument("--index", default=INDEX_PATH)
+    parser.add_argument("--dir", default=SCRIPTS_DIR, help="Folder holding decompiled_*.c")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("find", help="Functions containing every term (identifier, FUN_/DAT_ name, hex, +offset)")
+    p.add_argument("terms", nargs="+")
+    p.add_argument("--names-only", action="store_true")
+
+    p = sub.add_parser("offset", help="Functions that access every given field offset, e.g. 0xF8")
+    p.add_argument("offsets", nargs="+")
+    p.add_argument("--any", action="store_true", help="Match functions accessing any of the offsets")
+    access = p.add_mutually_exclusive_group()
+    access.add_argument("--reads", action="store_true")
+    access.add_argument("--writes", action="store_true")
+    p.add_argument("--names-only", action="store_true")
+
+    sub.add_parser("functions", help="List indexed functions")
+    sub.add_parser("reindex", help="Drop and rebuild the whole index")
+    args = parser.parse_args()
+
+    if args.command == "reindex" and os.path.exists(args.index):
+        os.remove(args.index)
+    db = open_index(args.index, args.dir)
+
+    if args.command == "find":
+        print_hits(db, search(db, [normalize(t) for t in args.terms]), not args.names_only)
+    elif args.command == "offset":
+        mode = "r" if args.reads else "w" if args.writes else None
+        tokens = [normalize("+" + o.lstrip("+")) for o in args.offsets]
+        print_hits(db, search(db, tokens, mode, args.any), not args.names_only)
+    elif args.command == "functions":
+        for path, name, rva in db.execute("SELECT path, name, rva FROM functions ORDER BY path, name"):
+            print("{:<40} 0x{:<8X} {}".format(os.path.basename(path), rva or 0, name))
+
+if __name__ == "__main__":
+    main()
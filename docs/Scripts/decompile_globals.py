@@ -0,0 +1,187 @@
+# Batched DAT_ global resolution shared by the decompile_*.py Ghidra scripts
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+#
+# Collects every DAT_xxxxxxxx referenced across a run's decompiled output, reads
+# all of them in one pass over program memory (adjacent globals in the same
+# memory block are merged into a single read), and types each one by how it is used:
+#   - IL2CPP metadata slot (script.json ScriptMetadata / ScriptMetadataMethod /
+#     ScriptString) -> named class/method/string literal pointer
+#   - Defined Ghidra data with a real type -> that type
+#   - Used in float/double arithmetic -> float/double
+#   - Value points into the image -> pointer (named when it hits a known symbol)
+#   - Otherwise -> int
+# The result is appended to each function as a "Globals" comment block.
+
+import jarray
+import re
+import struct
+
+from script_json import load_script_json
+
+DAT_PATTERN = re.compile(r"\bDAT_([0-9a-fA-F]{8,16})\b")
+MERGE_GAP = 64              # Globals closer than this are read in one getBytes call
+READ_SIZE = 8               # Bytes read per global (enough for pointer/double)
+
+_metadata_cache = {}
+
+def load_metadata_names(script_json_path):
+    """Map RVA -> (kind, name) for IL2CPP metadata globals in script.json."""
+    data = load_script_json(script_json_path)
+    if "names" in _metadata_cache and _metadata_cache["data"] is data:
+        return _metadata_cache["names"]
+    names = {}
+    _metadata_cache["data"] = data
+    _metadata_cache["names"] = names
+    if data is None:
+        print("WARNING: script.json not found, globals will not be named: " + script_json_path)
+        return names
+
+    for entry in data.get("ScriptMetadata", []):
+        if entry.get("Address"):
+            names[entry["Address"]] = ("metadata", entry.get("Name", "") + " (" + entry.get("Signature", "") + ")")
+    for entry in data.get("ScriptMetadataMethod", []):
+        if entry.get("Address"):
+            names[entry["Address"]] = ("method metadata", entry.get("Name", ""))
+    for entry in data.get("ScriptString", []):
+        if entry.get("Address"):
+            value = entry.get("Value", "").replace("\n", "\\n").replace("*/", "* /")
+            names[entry["Address"]] = ("string literal", '"' + value[:60] + '"')
+    for entry in data.get("ScriptMethod", []):
+        if entry.get("Address") and entry["Address"] not in names:
+            names[entry["Address"]] = ("method", entry.get("Name", ""))
+    print("Loaded " + str(len(names)) + " IL2CPP metadata names")
+    return names
+
+def collect_globals(codes):
+    """Return {absolute address: [usage lines]} for every DAT_ in the given C code strings."""
+    usages = {}
+    for code in codes:
+        for line in code.split("\n"):
+            for m in DAT_PATTERN.finditer(line):
+                usages.setdefault(int(m.group(1), 16), []).append(line)
+    return usages
+
+def read_bytes(memory, space, start, size):
+    """Bytes at start as a str (may be short, or empty if the read fails)."""
+    buf = jarray.zeros(size, 'b')
+    try:
+        read = memory.getBytes(space.getAddress(start), buf)
+    except Exception:
+        read = 0
+    return ''.join(chr(b & 0xff) for b in buf[:read])
+
+def read_globals(program, addresses):
+    """Read READ_SIZE bytes at every address, merging nearby addresses in one block into one read."""
+    memory = program.getMemory()
+    space = program.getAddressFactory().getDefaultAddressSpace()
+    values = {}
+
+    ordered = sorted(addresses)
+    i = 0
+    while i < len(ordered):
+        start = ordered[i]
+        end = start + READ_SIZE
+        block = memory.getBlock(space.getAddress(start))
+        block_end = block.getEnd().getOffset() + 1 if block is not None else end
+        j = i + 1
+        while j < len(ordered) and ordered[j] - end <= MERGE_GAP and ordered[j] + READ_SIZE <= block_end:
+            end = max(end, ordered[j] + READ_SIZE)
+            j += 1
+        raw = read_bytes(memory, space, start, end - start)
+        for addr in ordered[i:j]:
+            chunk = raw[addr - start:addr - start + READ_SIZE]
+            if len(chunk) != READ_SIZE and j - i > 1:
+                # Merged read came up short - retry this global on its own
+                chunk = read_bytes(memory, space, addr, READ_SIZE)
+            values[addr] = chunk if len(chunk) == READ_SIZE else None
+        i = j
+    return values
+
+def infer_use(name, lines):
+    """Guess the type of a global from the decompiled lines that use it."""
+    text = "\n".join(lines)
+    # Needs an operand on the left so address-of (&DAT_x) isn't taken for a mask
+    if re.search(r"[\w)\]]\s*[\^&|]\s*" + name + r"\b|\b" + name + r"\s*[\^&|][^&|]", text):
+        return "int"  # Bit mask (e.g. the float sign-flip constant)
+    if re.search(r"\(double\)|double\b", text):
+        return "double"
+    if re.search(r"\(float\)|float\b|\d\.\d", text):
+        return "float"
+    if re.search(r"\*\s*\(\w+\s*\*+\)\s*\(?" + name + r"\s*\+|" + name + r"\s*->|\(\w+\s*\*\*\)\s*" + name, text):
+        return "pointer"
+    if re.search(r"\(longlong\)|longlong\b|undefined8\b", text):
+        return "int64"
+    return "int"
+
+def format_value(program, addr, raw, use, metadata):
+    image_base = program.getImageBase().getOffset()
+    rva = addr - image_base
+
+    if rva in metadata:
+        kind, name = metadata[rva]
+        return "IL2CPP " + kind + ": " + name
+
+    data = program.getListing().getDataAt(program.getAddressFactory().getDefaultAddressSpace().getAddress(addr))
+    if data is not None and data.isDefined() and not data.getDataType().getName().startswith("undefined"):
+        return data.getDataType().getName() + " = " + str(data.getDefaultValueRepresentation())
+
+    # .bss-style blocks have no file bytes, so check before treating the read as failed
+    block = program.getMemory().getBlock(program.getAddressFactory().getDefaultAddressSpace().getAddress(addr))
+    if block is not None and not block.isInitialized():
+        return "runtime-initialised (" + block.getName() + ")"
+
+    if raw is None:
+        return "(unreadable)"
+
+    qword = struct.unpack("<Q", raw)[0]
+    if use == "double":
+        return "double = " + repr(struct.unpack("<d", raw)[0])
+    if use == "float":
+        return "float = " + repr(struct.unpack("<f", raw[:4])[0]) + "f"
+
+    if image_base <= qword < program.getMaxAddress().getOffset():
+        target = qword - image_base
+        label = metadata.get(target, ("", ""))[1]
+        if not label:
+            symbol = program.getSymbolTable().getPrimarySymbol(
+                program.getAddressFactory().getDefaultAddressSpace().getAddress(qword))
+            label = symbol.getName() if symbol is not None else ""
+        return "pointer = 0x{:X}".format(qword) + (" -> " + label if label else "")
+    if use == "int64":
+        return "int64 = 0x{:X}".format(qword)
+    dword = struct.unpack("<i", raw[:4])[0]
+    return "int = {} (0x{:X})".format(dword, dword & 0xFFFFFFFF)
+
+def resolve_globals(program, codes, script_json_path):
+    """Resolve every DAT_ in codes at once. Returns {absolute address: description}."""
+    usages = collect_globals(codes)
+    if not usages:
+        return {}
+    print("Resolving " + str(len(usages)) + " DAT_ globals in one batched read...")
+    metadata = load_metadata_names(script_json_path)
+    values = read_globals(program, usages.keys())
+
+    resolved = {}
+    for addr, lines in usages.items():
+        name = "DAT_{:x}".format(addr)
+        use = infer_use(name, lines)
+        try:
+            resolved[addr] = format_value(program, addr, values.get(addr), use, metadata)
+        except Exception as e:
+            resolved[addr] = "(error: " + str(e) + ")"
+    return resolved
+
+def globals_comment(code, resolved):
+    """Comment block listing the resolved globals used by one function ('' if none)."""
+    seen = []
+    for m in DAT_PATTERN.finditer(code):
+        addr = int(m.group(1), 16)
+        if addr not in seen:
+            seen.append(addr)
+    if not seen:
+        return ""
+    lines = ["/* Globals:"]
+    for addr in seen:
+        lines.append(" *   DAT_{:x}: {}".format(addr, resolved.get(addr, "(unresolved)")))
+    lines.append(" */")
+    return "\n".join(lines)
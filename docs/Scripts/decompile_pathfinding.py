@@ -8,9 +8,13 @@ from ghidra.program.model.data import DataTypeConflictHandler
 from ghidra.util.task import ConsoleTaskMonitor
 from ghidra.program.model.symbol import SourceType
 import codecs
-import json
 import os
 
+from decompile_globals import globals_comment, resolve_globals
+from decompile_signatures import apply_signatures
+from decompile_timeouts import DecompileStats, decompile_adaptive, order_targets
+from script_json import load_script_json
+
 # Target functions to decompile (RVA -> name mapping)
 # These are Relative Virtual Addresses - image base will be added at runtime
 TARGET_FUNCTIONS_RVA = {
@@ -62,6 +66,7 @@ TARGET_FUNCTIONS_RVA = {
 OUTPUT_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\ff1-screen-reader\\docs\\scripts\\decompiled_pathfinding.c"
 SCRIPT_JSON_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\script.json"
 IL2CPP_HEADER_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\il2cpp_ghidra.h"
+DECOMPILE_STATS_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\ff1-screen-reader\\docs\\Scripts\\decompile_stats.json"
 
 def parse_il2cpp_header(program):
     """Parse il2cpp_ghidra.h and apply types to the program's data type manager."""
@@ -158,8 +163,7 @@ def apply_il2cpp_symbols(program):
 
     print("Loading IL2CPP symbols from: " + SCRIPT_JSON_PATH)
     try:
-        with codecs.open(SCRIPT_JSON_PATH, 'r', 'utf-8') as f:
-            data = json.load(f)
+        data = load_script_json(SCRIPT_JSON_PATH)
 
         symbol_table = program.getSymbolTable()
         address_factory = program.getAddressFactory()
@@ -187,7 +191,7 @@ def apply_il2cpp_symbols(program):
         print("Error loading script.json: " + str(e))
         return 0
 
-def decompile_function_at_address(decompiler, program, rva, name):
+def decompile_function_at_address(decompiler, program, rva, name, stats):
     """Decompile function at given RVA and return C code."""
     address_factory = program.getAddressFactory()
     image_base = program.getImageBase().getOffset()
@@ -203,20 +207,7 @@ def decompile_function_at_address(decompiler, program, rva, name):
             if func is None:
                 return None, "Could not create function at 0x{:X}".format(abs_addr)
 
-        results = decompiler.decompileFunction(func, 120, ConsoleTaskMonitor())
-
-        if results.decompileCompleted():
-            decomp_func = results.getDecompiledFunction()
-            if decomp_func:
-                return decomp_func.getC(), None
-            else:
-                return None, "Decompilation returned no result"
-        else:
-            error_msg = results.getErrorMessage()
-            if error_msg:
-                return None, "Decompilation failed: " + str(error_msg)
-            else:
-                return None, "Decompilation failed (unknown error)"
+        return decompile_adaptive(decompiler, func, rva, name, stats)
 
     except Exception as e:
         return None, "Exception: " + str(e)
@@ -256,6 +247,20 @@ def run():
     apply_il2cpp_symbols(program)
     print("")
 
+    # Step 2b: Apply method signatures so the decompiler starts from typed prototypes
+    print("-" * 70)
+    print("STEP 2b: Applying IL2CPP method signatures")
+    print("-" * 70)
+    target_functions = {}
+    for rva, name in TARGET_FUNCTIONS_RVA.items():
+        func = getFunctionAt(toAddr(image_base + rva))
+        if func is None:
+            func = createFunction(toAddr(image_base + rva), name.replace("$$", "_"))
+        if func is not None:
+            target_functions[rva] = func
+    apply_signatures(program, target_functions, SCRIPT_JSON_PATH)
+    print("")
+
     # Step 3: Decompile target functions
     print("-" * 70)
     print("STEP 3: Decompiling target functions")
@@ -263,6 +268,7 @@ def run():
     print("Initializing decompiler...")
     decompiler = DecompInterface()
     decompiler.openProgram(program)
+    stats = DecompileStats(DECOMPILE_STATS_PATH, program.getName())
 
     results = []
     results.append("/*")
@@ -284,14 +290,16 @@ def run():
 
     success_count = 0
     fail_count = 0
+    decompiled = []  # (index into results, code) for the globals pass
 
     # Group functions by class for better organization
     current_class = ""
-    for rva, name in sorted(TARGET_FUNCTIONS_RVA.items(), key=lambda x: x[1]):
+    # Known hangs go last (or are skipped) so they can't stall the batch
+    targets, skipped = order_targets(stats, TARGET_FUNCTIONS_RVA.items())
+    for rva, name, class_name in targets:
         abs_addr = image_base + rva
 
-        # Extract class name for grouping
-        class_name = name.split("$$")[0] if "$$" in name else "Unknown"
+        # Group by class (deferred hangs share one section at the end)
         if class_name != current_class:
             current_class = class_name
             results.append("")
@@ -303,7 +311,8 @@ def run():
         print("Decompiling: " + name)
         print("  RVA: 0x{:X} -> Absolute: 0x{:X}".format(rva, abs_addr))
 
-        code, error = decompile_function_at_address(decompiler, program, rva, name)
+        code, error = decompile_function_at_address(decompiler, program, rva, name, stats)
+        stats.save()
 
         results.append("")
         results.append("/" + "*" * 68 + "/")
@@ -314,6 +323,7 @@ def run():
         results.append("")
 
         if code:
+            decompiled.append((len(results), code))
             results.append(code)
             print("  SUCCESS")
             success_count += 1
@@ -322,6 +332,26 @@ def run():
             print("  FAILED: " + str(error))
             fail_count += 1
 
+    for rva, name in skipped:
+        print("Skipped (blacklisted): " + name)
+        results.append("")
+        results.append("/" + "*" * 68 + "/")
+        results.append("/* " + name)
+        results.append(" * RVA: 0x{:X}".format(rva))
+        results.append(" * Address: 0x{:X}".format(image_base + rva))
+        results.append(" " + "*" * 67 + "/")
+        results.append("")
+        results.append("/* SKIPPED: timed out in previous runs */")
+        fail_count += 1
+
+    # Resolve all DAT_ globals across the run in one batched memory pass
+    print("")
+    resolved = resolve_globals(program, [code for _, code in decompiled], SCRIPT_JSON_PATH)
+    for index, code in decompiled:
+        comment = globals_comment(code, resolved)
+        if comment:
+            results[index] = code + "\n" + comment
+
     # Write output
     print("")
     print("=" * 70)
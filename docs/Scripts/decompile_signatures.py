@@ -0,0 +1,95 @@
+# Bulk IL2CPP method signature application shared by the decompile_*.py scripts
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+#
+# Il2CppDumper writes a C prototype for every method into script.json's
+# "Signature" field, e.g.
+#   void MapRouteSearcher__Search (MapRouteSearcher_o* __this, ..., const MethodInfo* method);
+# Only names were applied before, so output was full of undefined8 *param_1.
+# This stage parses the prototypes of the target functions and everything they
+# call against the types from il2cpp_ghidra.h, and applies them all in a single
+# transaction before decompiling. With committed prototypes the decompiler skips
+# parameter-ID and most type recovery, and fields show up by name.
+
+from ghidra.app.cmd.function import ApplyFunctionSignatureCmd
+from ghidra.app.util.cparser.C import CParserUtils
+from ghidra.program.model.symbol import SourceType
+from ghidra.util.task import ConsoleTaskMonitor
+
+from script_json import load_script_json
+
+def load_signatures(script_json_path):
+    """Map RVA -> C prototype from script.json ScriptMethod entries."""
+    data = load_script_json(script_json_path)
+    signatures = {}
+    if data is None:
+        print("script.json not found at: " + script_json_path)
+        return signatures
+    for method in data.get("ScriptMethod", []):
+        addr = method.get("Address")
+        sig = method.get("Signature")
+        if addr and sig and addr not in signatures:
+            signatures[addr] = sig
+    return signatures
+
+def collect_callees(program, functions):
+    """RVAs of every function directly called from the given functions."""
+    image_base = program.getImageBase().getOffset()
+    monitor = ConsoleTaskMonitor()
+    callees = set()
+    for func in functions:
+        for callee in func.getCalledFunctions(monitor):
+            callees.add(callee.getEntryPoint().getOffset() - image_base)
+    return callees
+
+def apply_signatures(program, target_functions, script_json_path):
+    """Apply script.json prototypes to targets and their callees in one transaction.
+
+    target_functions: {rva: Function}. Returns (applied, failed).
+    """
+    signatures = load_signatures(script_json_path)
+    if not signatures:
+        return 0, 0
+
+    image_base = program.getImageBase().getOffset()
+    func_mgr = program.getFunctionManager()
+    space = program.getAddressFactory().getDefaultAddressSpace()
+
+    rvas = set(target_functions.keys()) | collect_callees(program, target_functions.values())
+    rvas = sorted(rva for rva in rvas if rva in signatures)
+    print("Applying " + str(len(rvas)) + " signatures (" + str(len(target_functions)) + " targets + callees)")
+
+    # Parse everything first so a bad prototype doesn't leave a half-applied batch.
+    # CParserUtils takes the full C declaration (const qualifiers, trailing ';'),
+    # the same way Il2CppDumper's own Ghidra script applies these prototypes.
+    parsed = []
+    failed = 0
+    for rva in rvas:
+        try:
+            definition = CParserUtils.parseSignature(None, program, signatures[rva], False)
+        except Exception as e:
+            definition = None
+            print("  Could not parse signature for 0x{:X}: {} ({})".format(rva, signatures[rva], e))
+        if definition is None:
+            failed += 1
+        else:
+            parsed.append((rva, definition))
+
+    monitor = ConsoleTaskMonitor()
+    applied = 0
+    tx = program.startTransaction("Apply IL2CPP signatures")
+    try:
+        for rva, definition in parsed:
+            addr = space.getAddress(image_base + rva)
+            if func_mgr.getFunctionAt(addr) is None:
+                continue
+            cmd = ApplyFunctionSignatureCmd(addr, definition, SourceType.USER_DEFINED)
+            if cmd.applyTo(program, monitor):
+                applied += 1
+            else:
+                failed += 1
+                print("  Could not apply signature at 0x{:X}: {}".format(rva, cmd.getStatusMsg()))
+    finally:
+        program.endTransaction(tx, True)
+
+    print("Applied " + str(applied) + " signatures, " + str(failed) + " failed")
+    return applied, failed
@@ -0,0 +1,228 @@
+# Adaptive decompiler timeouts shared by the decompile_*.py Ghidra scripts
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+#
+# Replaces the fixed decompileFunction(func, 120, ...) call with:
+#   - A per-function budget predicted from function size and past runs
+#   - Retry with an escalated budget, then with a cheaper decompiler preset;
+#     functions that only ever finished with the cheaper preset start with it
+#   - A persisted hang blacklist so pathological functions are skipped or
+#     pushed to the end of the batch (with a bounded budget) instead of
+#     stalling every run
+#
+# Stats are stored as JSON keyed by "<program name>:<RVA hex>" so the same
+# file can be shared by every decompile script for a given GameAssembly.dll.
+
+from ghidra.util.task import ConsoleTaskMonitor
+import codecs
+import json
+import os
+import time
+
+# Budget prediction (seconds)
+MIN_TIMEOUT = 15
+MAX_TIMEOUT = 300
+BASE_TIMEOUT = 20
+SECONDS_PER_KB = 10          # Extra budget per KB of function body
+HISTORY_MARGIN = 2.0         # Multiplier over the slowest successful past run
+ESCALATION_FACTOR = 2.5      # Multiplier applied on each timeout retry
+MAX_ATTEMPTS = 3             # Attempts with the default preset before falling back
+
+# Cheaper preset used as the last resort: skips parameter/return type recovery
+CHEAP_SIMPLIFICATION_STYLE = "normalize"
+DEFAULT_SIMPLIFICATION_STYLE = "decompile"
+
+# Hang blacklist
+BLACKLIST_TIMEOUTS = 2       # Full-run timeouts (all attempts) before blacklisting
+BLACKLIST_MODE = "defer"     # "defer" = decompile last, "skip" = don't decompile at all
+DEFERRED_GROUP = "Deferred (previously timed out)"
+DEFERRED_TIMEOUT = 60        # Single cheap attempt per deferred function
+DEFERRED_RUN_BUDGET = 300    # Total seconds spent on deferred functions per run
+HISTORY_LENGTH = 5           # Successful durations remembered per function and preset
+
+
+class DecompileStats(object):
+    """Persisted per-function decompile durations and timeout counts."""
+
+    def __init__(self, path, program_name):
+        self.path = path
+        self.program_name = program_name
+        self.entries = {}
+        self.dirty = False
+        self.deferred_spent = 0.0
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with codecs.open(self.path, 'r', 'utf-8') as f:
+                self.entries = json.load(f)
+            print("Loaded decompile stats for " + str(len(self.entries)) + " functions")
+        except Exception as e:
+            print("WARNING: Could not read decompile stats (" + str(e) + "), starting fresh")
+            self.entries = {}
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        try:
+            with codecs.open(self.path, 'w', 'utf-8') as f:
+                f.write(json.dumps(self.entries, indent=1, sort_keys=True))
+            self.dirty = False
+        except Exception as e:
+            print("WARNING: Could not write decompile stats: " + str(e))
+
+    def key(self, rva):
+        return "{}:0x{:X}".format(self.program_name, rva)
+
+    def get(self, rva):
+        return self.entries.get(self.key(rva))
+
+    def entry(self, rva, name):
+        k = self.key(rva)
+        e = self.entries.get(k)
+        if e is None:
+            e = {"name": name, "durations": [], "timeouts": 0, "size": 0}
+            self.entries[k] = e
+        return e
+
+    def record_success(self, rva, name, size, seconds, cheap):
+        """Remember a successful run. Cheap-preset durations are kept apart so they
+        don't lower the default preset's prediction; "cheap" marks functions whose
+        latest success needed the cheaper preset."""
+        e = self.entry(rva, name)
+        e["size"] = size
+        field = "cheap_durations" if cheap else "durations"
+        e[field] = (e.get(field, []) + [round(seconds, 2)])[-HISTORY_LENGTH:]
+        e["timeouts"] = 0
+        e["cheap"] = cheap
+        self.dirty = True
+
+    def record_timeout(self, rva, name, size):
+        e = self.entry(rva, name)
+        e["size"] = size
+        e["timeouts"] = e.get("timeouts", 0) + 1
+        self.dirty = True
+
+    def is_blacklisted(self, rva):
+        e = self.get(rva)
+        return e is not None and e.get("timeouts", 0) >= BLACKLIST_TIMEOUTS
+
+    def needs_cheap(self, rva):
+        e = self.get(rva)
+        return e is not None and e.get("cheap", False)
+
+
+def function_size(func):
+    """Number of bytes in the function body (0 if unknown)."""
+    try:
+        return int(func.getBody().getNumAddresses())
+    except Exception:
+        return 0
+
+
+def predict_timeout(stats, rva, size, cheap=False):
+    """Initial budget from function size, raised to cover past successful runs
+    with the same preset."""
+    budget = BASE_TIMEOUT + SECONDS_PER_KB * (size / 1024.0)
+    e = stats.get(rva) if stats else None
+    history = e.get("cheap_durations" if cheap else "durations") if e else None
+    if history:
+        budget = max(budget, max(history) * HISTORY_MARGIN)
+    return int(min(MAX_TIMEOUT, max(MIN_TIMEOUT, budget)))
+
+
+def class_group(name):
+    return name.split("$$")[0] if "$$" in name else "Unknown"
+
+def order_targets(stats, targets):
+    """Sort (rva, name) pairs by name, pushing blacklisted functions to the end.
+
+    Returns ([(rva, name, group)], [(rva, name)]). group is the class header the
+    function is listed under; in "defer" mode blacklisted functions all share one
+    DEFERRED_GROUP section at the end so their classes aren't repeated. In "skip"
+    mode they are returned separately so the caller can emit a placeholder
+    without decompiling them.
+    """
+    ordered = sorted(targets, key=lambda x: x[1])
+    normal = [(rva, name, class_group(name)) for rva, name in ordered if not stats.is_blacklisted(rva)]
+    hung = [(rva, name) for rva, name in ordered if stats.is_blacklisted(rva)]
+    if BLACKLIST_MODE == "skip":
+        return normal, hung
+    return normal + [(rva, name, DEFERRED_GROUP) for rva, name in hung], []
+
+
+def _decompile_once(decompiler, func, timeout):
+    results = decompiler.decompileFunction(func, timeout, ConsoleTaskMonitor())
+    if results.decompileCompleted():
+        decomp_func = results.getDecompiledFunction()
+        if decomp_func:
+            return decomp_func.getC(), None, False
+        return None, "Decompilation returned no result", False
+    error_msg = results.getErrorMessage()
+    timed_out = results.isTimedOut() or (error_msg is not None and "timeout" in str(error_msg).lower())
+    if error_msg:
+        return None, "Decompilation failed: " + str(error_msg), timed_out
+    return None, "Decompilation failed (unknown error)", timed_out
+
+
+def decompile_adaptive(decompiler, func, rva, name, stats):
+    """Decompile with a predicted budget, escalating on timeout.
+
+    Returns (code, error). Only timeouts are retried; other decompiler errors
+    are returned immediately since a longer budget won't fix them. Functions
+    whose last success needed the cheaper preset escalate with that preset only.
+    """
+    size = function_size(func)
+    blacklisted = stats.is_blacklisted(rva)
+    cheap_only = blacklisted or stats.needs_cheap(rva)
+    style = CHEAP_SIMPLIFICATION_STYLE if cheap_only else DEFAULT_SIMPLIFICATION_STYLE
+    timeout = predict_timeout(stats, rva, size, cheap_only)
+    attempts = []
+
+    if blacklisted:
+        # Known hang: one short cheap attempt, within the run's deferred budget
+        remaining = DEFERRED_RUN_BUDGET - stats.deferred_spent
+        if remaining < MIN_TIMEOUT:
+            return None, "Skipped: deferred budget of {}s for this run is used up".format(DEFERRED_RUN_BUDGET)
+        print("  Blacklisted (timed out in previous runs)")
+        timeout = int(min(DEFERRED_TIMEOUT, remaining))
+    elif cheap_only:
+        print("  Starting with '" + style + "' preset (default preset timed out before)")
+
+    while True:
+        cheap = style != DEFAULT_SIMPLIFICATION_STYLE
+        if cheap:
+            decompiler.setSimplificationStyle(style)
+        print("  Attempt {}: {}s budget ({}, {} bytes)".format(len(attempts) + 1, timeout, style, size))
+        start = time.time()
+        try:
+            code, error, timed_out = _decompile_once(decompiler, func, timeout)
+        finally:
+            if cheap:
+                decompiler.setSimplificationStyle(DEFAULT_SIMPLIFICATION_STYLE)
+        elapsed = time.time() - start
+        if blacklisted:
+            stats.deferred_spent += elapsed
+
+        if code:
+            stats.record_success(rva, name, size, elapsed, cheap)
+            if cheap:
+                code = "/* NOTE: decompiled with cheaper '" + style + "' preset after timeouts */\n" + code
+            return code, None
+        if not timed_out:
+            return None, error
+
+        attempts.append("{}s/{}".format(timeout, style))
+        if blacklisted:
+            break
+        if len(attempts) >= MAX_ATTEMPTS or timeout >= MAX_TIMEOUT:
+            if cheap:
+                break
+            # Out of escalation room - last try with the cheaper preset
+            style = CHEAP_SIMPLIFICATION_STYLE
+        else:
+            timeout = int(min(MAX_TIMEOUT, timeout * ESCALATION_FACTOR))
+
+    stats.record_timeout(rva, name, size)
+    return None, "Decompilation timed out (attempts: " + ", ".join(attempts) + ")"
@@ -0,0 +1,226 @@
+# Offline per-map reachability and distance-field cache
+# Runs under regular Python 3 with NumPy (not Ghidra)
+#
+# Takes the exported collision grids route_search.py reads (.npz with a
+# "collision" array shaped (layers, width, height), non-zero = walkable) plus
+# optional target cells stored alongside:
+#   exits      int (N, 3) array of (layer, x, y) for map exits
+#   entities   int (M, 3) array of (layer, x, y) for NPCs, chests, events
+#   entity_names / exit_names  optional string arrays (same order)
+# and writes one <map>.dfc file per grid with:
+#   - a connected-component label per cell (0 = blocked), so "can A reach B?"
+#     is two array reads
+#   - one distance field per exit/entity: steps from every cell to the target
+#     (0xFFFF = unreachable), so "how far?" is one array read
+# Distances use the route_search.py wavefront (same neighbours and the same
+# "blocked goal cell is still a valid seed" rule as Search), over the whole
+# map rather than Search's 64-cell window, so world-map answers are exact.
+#
+# Layout (little-endian, every array 2-byte aligned so it can be memory-mapped):
+#   Header     magic "FFDF", u16 version, u16 layers, u16 width, u16 height,
+#              u16 target count, u16 component count, u32 names offset
+#   Targets    per target: u8 kind (0 exit, 1 entity), u8 pad, u16 layer,
+#              u16 x, u16 y
+#   Components u16[layers * width * height]
+#   Fields     u16[layers * width * height] per target, in target order
+#   Names      UTF-8 target names, one per line
+#
+# Usage:
+#   python distance_cache.py build exported_grids distance_cache
+#   python distance_cache.py info distance_cache/Map_10010.dfc
+#   python distance_cache.py query distance_cache/Map_10010.dfc 0,12,30 --to 0,40,8
+#   python distance_cache.py query distance_cache/Map_10010.dfc 0,12,30 --target 3
+
+import argparse
+import glob
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+
+from route_search import NEIGHBOURS, _shift_slices, expand, load_grid, make_route_map
+
+MAGIC = b"FFDF"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHHHHI")
+TARGET = struct.Struct("<BBHHH")
+UNREACHABLE = 0xFFFF
+KIND_EXIT = 0
+KIND_ENTITY = 1
+FIELD_BATCH = 16            # Distance fields flooded per wavefront batch
+
+def label_components(walkable, neighbours=NEIGHBOURS):
+    """Connected-component labels (1..n, 0 = blocked) by vectorised min-label propagation."""
+    shape = walkable.shape
+    big = np.iinfo(np.int32).max
+    labels = np.where(walkable, np.arange(walkable.size, dtype=np.int32).reshape(shape), big)
+    moves = []
+    for dx, dy, dz in neighbours:
+        pairs = [_shift_slices(d, n) for d, n in zip((dz, dx, dy), shape)]
+        moves.append((tuple(p[0] for p in pairs), tuple(p[1] for p in pairs)))
+    while True:
+        before = labels.copy()
+        for src, dst in moves:
+            view = labels[dst]
+            np.minimum(view, np.where(walkable[dst], labels[src], big), out=view)
+        # Pointer jumping: adopt the label of the cell our label names
+        flat = labels.reshape(-1)
+        valid = flat != big
+        flat[valid] = flat[flat[valid]]
+        if np.array_equal(labels, before):
+            break
+    roots, dense = np.unique(labels[walkable], return_inverse=True)
+    result = np.zeros(shape, dtype=np.int32)
+    result[walkable] = dense + 1
+    return result, len(roots)
+
+def distance_fields(walkable, targets):
+    """u16 (targets, layers, width, height): steps from each cell to each target."""
+    base = make_route_map(walkable)
+    fields = np.full((len(targets),) + walkable.shape, UNREACHABLE, dtype=np.uint16)
+    for start in range(0, len(targets), FIELD_BATCH):
+        chunk = targets[start:start + FIELD_BATCH]
+        route = np.repeat(base[None], len(chunk), axis=0)
+        route[np.arange(len(chunk)), chunk[:, 0], chunk[:, 1], chunk[:, 2]] = 1
+        expand(route, np.ones(len(chunk), dtype=bool))
+        steps = route - 1
+        reached = route > 0
+        if steps.max(initial=0) >= UNREACHABLE:
+            raise ValueError("distance does not fit in u16")
+        fields[start:start + len(chunk)][reached] = steps[reached]
+    return fields
+
+def read_targets(data, walkable):
+    """[(kind, (layer, x, y), name)] from the optional exits/entities arrays of a grid."""
+    targets = []
+    for kind, key, names_key in ((KIND_EXIT, "exits", "exit_names"), (KIND_ENTITY, "entities", "entity_names")):
+        if data is None or key not in data:
+            continue
+        cells = np.asarray(data[key], dtype=np.int64).reshape(-1, 3)
+        names = list(data[names_key]) if names_key in data else [""] * len(cells)
+        for cell, name in zip(cells, names):
+            if all(0 <= v < n for v, n in zip(cell, walkable.shape)):
+                targets.append((kind, tuple(int(v) for v in cell), str(name)))
+            else:
+                print("  warning: {} {} outside the map, skipped".format(key[:-1], tuple(cell)), file=sys.stderr)
+    return targets
+
+def write_cache(path, walkable, components, count, targets, fields):
+    layers, width, height = walkable.shape
+    if count > 0xFFFF:
+        raise ValueError("{} components do not fit in u16 labels".format(count))
+    names = "\n".join(name.replace("\n", " ") for _, _, name in targets).encode("utf-8")
+    body_size = TARGET.size * len(targets) + 2 * walkable.size * (1 + len(targets))
+    names_offset = HEADER.size + body_size
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, layers, width, height, len(targets), count, names_offset))
+        for kind, (layer, x, y), _ in targets:
+            f.write(TARGET.pack(kind, 0, layer, x, y))
+        f.write(components.astype("<u2").tobytes())
+        f.write(fields.astype("<u2").tobytes())
+        f.write(names)
+
+class DistanceCache(object):
+    """Memory-mapped reader for one .dfc file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        magic, version, self.layers, self.width, self.height, count, self.component_count, names_offset = \
+            HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{}: not a version {} distance cache".format(path, VERSION))
+        shape = (self.layers, self.width, self.height)
+        cells = self.layers * self.width * self.height
+        raw = np.memmap(path, dtype=np.uint8, mode="r")
+        table = bytes(raw[HEADER.size:HEADER.size + TARGET.size * count])
+        offset = HEADER.size + TARGET.size * count
+        self.components = np.memmap(path, dtype="<u2", mode="r", offset=offset, shape=shape)
+        self.fields = np.memmap(path, dtype="<u2", mode="r", offset=offset + 2 * cells, shape=(count,) + shape)
+        names = bytes(raw[names_offset:]).decode("utf-8").split("\n") if count else []
+        self.targets = []
+        for i in range(count):
+            kind, _, layer, x, y = TARGET.unpack_from(table, i * TARGET.size)
+            self.targets.append((kind, (layer, x, y), names[i] if i < len(names) else ""))
+
+    def reachable(self, a, b):
+        """True if walkable cells a and b are in the same component."""
+        ca = self.components[a]
+        return bool(ca) and ca == self.components[b]
+
+    def distance(self, target_index, cell):
+        """Steps from cell to the target, or None if it can't be reached."""
+        d = int(self.fields[target_index][cell])
+        return None if d == UNREACHABLE else d
+
+def cmd_build(args):
+    paths = sorted(glob.glob(os.path.join(args.grids, "*.npz")) + glob.glob(os.path.join(args.grids, "*.npy")))
+    if not paths:
+        sys.exit("No .npz/.npy grids in " + args.grids)
+    if not os.path.exists(args.output):
+        os.makedirs(args.output)
+    total = 0
+    for path in paths:
+        start = time.time()
+        walkable = load_grid(path)
+        data = np.load(path) if path.endswith(".npz") else None
+        targets = read_targets(data, walkable)
+        components, count = label_components(walkable)
+        cells = np.array([cell for _, cell, _ in targets], dtype=np.int64).reshape(-1, 3)
+        fields = distance_fields(walkable, cells)
+        out = os.path.join(args.output, os.path.splitext(os.path.basename(path))[0] + ".dfc")
+        write_cache(out, walkable, components, count, targets, fields)
+        size = os.path.getsize(out)
+        total += size
+        print("{}: {} components, {} fields, {} bytes ({:.1f}s)".format(
+            os.path.basename(out), count, len(targets), size, time.time() - start))
+    print("Wrote {} caches, {} bytes".format(len(paths), total))
+
+def parse_cell(text):
+    return tuple(int(v) for v in text.split(","))
+
+def cmd_info(args):
+    cache = DistanceCache(args.cache)
+    print("{} layers, {}x{}, {} components".format(cache.layers, cache.width, cache.height, cache.component_count))
+    for i, (kind, cell, name) in enumerate(cache.targets):
+        field = np.asarray(cache.fields[i])
+        reach = int((field != UNREACHABLE).sum())
+        print("  [{}] {} {} {}  reachable from {} cells".format(
+            i, "exit" if kind == KIND_EXIT else "entity", cell, name, reach))
+
+def cmd_query(args):
+    cache = DistanceCache(args.cache)
+    cell = parse_cell(args.cell)
+    if args.to:
+        other = parse_cell(args.to)
+        print("reachable" if cache.reachable(cell, other) else "not reachable")
+    indexes = [args.target] if args.target is not None else range(len(cache.targets))
+    for i in indexes:
+        kind, target, name = cache.targets[i]
+        d = cache.distance(i, cell)
+        print("  [{}] {} {}: {}".format(i, target, name, "unreachable" if d is None else "{} steps".format(d)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-map reachability and distance-field cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="Build .dfc caches from exported grids")
+    p.add_argument("grids")
+    p.add_argument("output")
+
+    p = sub.add_parser("info", help="Summarise a cache")
+    p.add_argument("cache")
+
+    p = sub.add_parser("query", help="Reachability / distances from one cell")
+    p.add_argument("cache")
+    p.add_argument("cell", help="layer,x,y")
+    p.add_argument("--to", help="layer,x,y to test reachability against")
+    p.add_argument("--target", type=int, help="Only this target index")
+    args = parser.parse_args()
+
+    {"build": cmd_build, "info": cmd_info, "query": cmd_query}[args.command](args)
+
+if __name__ == "__main__":
+    main()
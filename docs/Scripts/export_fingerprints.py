@@ -0,0 +1,141 @@
+# Ghidra headless script to export per-function instruction fingerprints
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+#
+# Run once per Pixel Remaster GameAssembly.dll (set GAME to match), then load
+# the output with:  python similarity_index.py add <GAME> <output.tsv>
+#
+# Each instruction is normalised so the same C# method compiles to the same
+# tokens in every game even though offsets and addresses differ:
+#   - Mnemonic kept
+#   - Registers kept
+#   - Memory displacements -> DISP (field offsets move between games, e.g.
+#     BattleUIManager.pauseController is 0x98 in FF1 and 0x90 in FF3)
+#   - Immediates -> IMM, except small constants (enum values, flags)
+#   - Call targets -> the callee's script.json name when known, else CALL
+# Overlapping windows of SHINGLE_SIZE tokens are hashed (CRC32) and the set of
+# distinct shingle hashes is written per function.
+
+from ghidra.program.model.address import Address
+from ghidra.program.model.lang import OperandType, Register
+from ghidra.program.model.scalar import Scalar
+import codecs
+import os
+import time
+import zlib
+
+from script_json import load_script_json
+
+GAME = "ff1"
+
+SHINGLE_SIZE = 4
+MIN_INSTRUCTIONS = 4        # Skip thunks/stubs - they match everything
+SMALL_CONSTANT = 0x10       # Immediates below this are kept verbatim
+
+# Paths
+OUTPUT_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\fingerprints_ff1.tsv"
+SCRIPT_JSON_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\script.json"
+
+def load_script_names():
+    """Map RVA -> IL2CPP method name from script.json."""
+    names = {}
+    print("Loading IL2CPP method names from: " + SCRIPT_JSON_PATH)
+    data = load_script_json(SCRIPT_JSON_PATH)
+    if data is None:
+        print("WARNING: script.json not found at: " + SCRIPT_JSON_PATH)
+        return names
+    for method in data.get("ScriptMethod", []):
+        addr = method.get("Address")
+        name = method.get("Name")
+        if addr and name and addr not in names:
+            names[addr] = name
+    print("Loaded " + str(len(names)) + " method names")
+    return names
+
+def normalise_operand(instr, op_index, image_base, script_names):
+    op_type = instr.getOperandType(op_index)
+    parts = []
+    for obj in instr.getOpObjects(op_index):
+        if isinstance(obj, Scalar):
+            value = obj.getUnsignedValue()
+            if OperandType.isDynamic(op_type):
+                parts.append("DISP")
+            elif value < SMALL_CONSTANT:
+                parts.append(str(value))
+            else:
+                parts.append("IMM")
+        elif isinstance(obj, Address):
+            # Call/jump target or global
+            name = script_names.get(obj.getOffset() - image_base)
+            parts.append(name if name else "ADDR")
+        elif isinstance(obj, Register):
+            parts.append(obj.getName())
+    if OperandType.isDynamic(op_type):
+        return "[" + "+".join(parts) + "]"
+    return ",".join(parts)
+
+def normalise_instruction(instr, image_base, script_names):
+    tokens = [instr.getMnemonicString()]
+    if instr.getFlowType().isCall():
+        flows = instr.getFlows()
+        target = script_names.get(flows[0].getOffset() - image_base) if flows else None
+        tokens.append(target if target else "CALL")
+        return " ".join(tokens)
+    for op_index in range(instr.getNumOperands()):
+        tokens.append(normalise_operand(instr, op_index, image_base, script_names))
+    return " ".join(tokens)
+
+def fingerprint(listing, func, image_base, script_names):
+    """(instruction count, sorted distinct shingle hashes)."""
+    tokens = [normalise_instruction(i, image_base, script_names) for i in listing.getInstructions(func.getBody(), True)]
+    if len(tokens) < MIN_INSTRUCTIONS:
+        return len(tokens), []
+    hashes = set()
+    for i in range(max(1, len(tokens) - SHINGLE_SIZE + 1)):
+        hashes.add(zlib.crc32("|".join(tokens[i:i + SHINGLE_SIZE])) & 0xFFFFFFFF)
+    return len(tokens), sorted(hashes)
+
+def run():
+    """Main script entry point."""
+    print("=" * 70)
+    print("FF Pixel Remaster Function Fingerprint Export (" + GAME + ")")
+    print("=" * 70)
+
+    program = getCurrentProgram()
+    if program is None:
+        print("ERROR: No program loaded!")
+        return
+
+    image_base = program.getImageBase().getOffset()
+    print("Program: " + program.getName())
+    print("Output: " + OUTPUT_PATH)
+    print("")
+
+    script_names = load_script_names()
+    listing = program.getListing()
+    start = time.time()
+    written = 0
+
+    with codecs.open(OUTPUT_PATH, 'w', 'utf-8') as f:
+        f.write("# game=" + GAME + " shingle=" + str(SHINGLE_SIZE) + "\n")
+        f.write("# rva\tname\tinstructions\tshingle_hashes\n")
+        for func in program.getFunctionManager().getFunctions(True):
+            if getMonitor().isCancelled():
+                break
+            rva = func.getEntryPoint().getOffset() - image_base
+            count, hashes = fingerprint(listing, func, image_base, script_names)
+            if not hashes:
+                continue
+            name = script_names.get(rva, func.getName())
+            f.write("{:X}\t{}\t{}\t{}\n".format(rva, name, count, " ".join("{:x}".format(h) for h in hashes)))
+            written += 1
+            if written % 10000 == 0:
+                print("  {} functions ({:.0f}s)".format(written, time.time() - start))
+
+    print("")
+    print("=" * 70)
+    print("Exported {} fingerprints in {:.0f}s".format(written, time.time() - start))
+    print("  Output: " + OUTPUT_PATH)
+    print("=" * 70)
+
+# Run the script
+run()
@@ -0,0 +1,375 @@
+# Whole-game map-exit graph with precomputed multi-hop routes
+# Runs under regular Python 3 with NumPy (not Ghidra)
+#
+# Reads exported map data instead of resolving exits one at a time in-game:
+#   --maps     extracted map assets; every entity_default.json (Tiled JSON)
+#              under a directory named after a map's asset_name is scanned for
+#              GotoMapEventEntity objects (ObjectType 3, or any object with a
+#              map_id property = PropertyGotoMap.MapId / AssetName / PointIn)
+#   --master   master data CSVs: map.csv (id, area_id, map_title, floor,
+#              asset_name) and area.csv (id, area_name)
+#   --messages optional key<TAB>text message files for area/map title keys
+#
+# Builds one graph (node = map id, edge = exit), then:
+#   - labels each exit like MapNameResolver.TryResolveMapNameById
+#     ("<area name> <map title or floor>")
+#   - validates exits offline: unknown MapId, MapId whose asset_name differs
+#     from the exit's AssetName (the "Cornelia exit says Chaos Shrine" class of
+#     bug), exits back into the same map, maps with no way out
+#   - precomputes all-pairs hop counts and next-hop exits by BFS from every map
+# and writes a compact indexed asset.
+#
+# Layout (little-endian):
+#   Header    magic "FFMG", u16 version, u16 map count N, u32 exit count E,
+#             u32 string pool offset
+#   Maps      per map: u32 map id, u32 label (pool offset), u32 asset name
+#   ExitIndex u32[N + 1] first exit per map (exits sorted by source map)
+#   Exits     per exit: u16 source map index, u16 destination map index,
+#             i16 cell x, i16 cell y, i32 point_in
+#   NextHop   u16[N * N] exit to take from map i towards map j (0xFFFF = none)
+#   Hops      u8[N * N] exits needed from map i to map j (0xFF = unreachable)
+#   Pool      u16 byte length + UTF-8 bytes per string
+#
+# Usage:
+#   python map_exit_graph.py build --maps extracted/maps --master extracted/master \
+#       --messages extracted/message/system_en.txt -o map_exits.bin
+#   python map_exit_graph.py route map_exits.bin 20020 30011
+#   python map_exit_graph.py exits map_exits.bin 20020
+
+import argparse
+import csv
+import json
+import os
+import struct
+import sys
+from collections import deque
+
+import numpy as np
+
+MAGIC = b"FFMG"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+MAP_ENTRY = struct.Struct("<III")
+EXIT_ENTRY = struct.Struct("<HHhhi")
+NO_EXIT = 0xFFFF
+NO_ROUTE = 0xFF
+CELL_SIZE = 16              # Tiled pixels per collision cell
+GOTO_MAP_OBJECT_TYPE = 3    # EntityDetectionHelpers.GetObjectType: 3 = GotoMap
+
+# Property spellings seen across extraction tools
+MAP_ID_KEYS = ("map_id", "MapId", "mapId")
+ASSET_KEYS = ("asset_name", "AssetName", "assetName")
+POINT_IN_KEYS = ("point_in", "PointIn", "pointIn")
+OBJECT_TYPE_KEYS = ("object_type", "ObjectType", "objectType")
+
+class MapInfo(object):
+
+    def __init__(self, map_id, area_id, title_key, floor, asset):
+        self.map_id = map_id
+        self.area_id = area_id
+        self.title_key = title_key
+        self.floor = floor
+        self.asset = asset
+        self.label = ""
+
+class Exit(object):
+
+    def __init__(self, source, dest, asset, point_in, x, y, path):
+        self.source = source
+        self.dest = dest
+        self.asset = asset
+        self.point_in = point_in
+        self.x = x
+        self.y = y
+        self.path = path
+
+def to_int(value, default=0):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+def read_csv(path):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+def read_messages(paths):
+    messages = {}
+    for path in paths or []:
+        with open(path, encoding="utf-8-sig") as f:
+            for line in f:
+                if "\t" in line:
+                    key, text = line.rstrip("\r\n").split("\t", 1)
+                    messages[key] = text
+    return messages
+
+def load_master(master_dir, messages):
+    """{map id: MapInfo} with labels resolved the way MapNameResolver does it."""
+    areas = dict((to_int(row.get("id")), row.get("area_name", "")) for row in read_csv(os.path.join(master_dir, "area.csv")))
+    maps = {}
+    for row in read_csv(os.path.join(master_dir, "map.csv")):
+        info = MapInfo(to_int(row.get("id")), to_int(row.get("area_id")), row.get("map_title", ""),
+                       to_int(row.get("floor")), row.get("asset_name", ""))
+        area_name = messages.get(areas.get(info.area_id, ""), "")
+        title = ""
+        if info.title_key and info.title_key.lower() != "none":
+            title = messages.get(info.title_key, "")
+        if not title and info.floor:
+            title = "{}F".format(info.floor) if info.floor > 0 else "B{}".format(-info.floor)
+        info.label = " ".join(part for part in (area_name, title) if part) or "Map {}".format(info.map_id)
+        maps[info.map_id] = info
+    return maps
+
+def object_properties(obj):
+    """Tiled properties as a dict (both the list and the legacy dict form)."""
+    props = obj.get("properties") or {}
+    if isinstance(props, list):
+        props = dict((p.get("name"), p.get("value")) for p in props if isinstance(p, dict))
+    return props
+
+def first(props, keys, default=None):
+    for key in keys:
+        if key in props:
+            return props[key]
+    return default
+
+def iter_objects(layer):
+    for obj in layer.get("objects", []) or []:
+        yield obj
+    for child in layer.get("layers", []) or []:
+        for obj in iter_objects(child):
+            yield obj
+
+def scan_exits(maps_dir, by_asset):
+    """Exit records from every entity_default.json whose directory names a known map asset."""
+    exits = []
+    unknown_dirs = set()
+    for directory, _, files in os.walk(maps_dir):
+        if "entity_default.json" not in files:
+            continue
+        source = None
+        probe = directory
+        while probe and probe != os.path.dirname(probe):
+            source = by_asset.get(os.path.basename(probe).lower())
+            if source is not None:
+                break
+            probe = os.path.dirname(probe)
+        path = os.path.join(directory, "entity_default.json")
+        if source is None:
+            unknown_dirs.add(os.path.relpath(directory, maps_dir))
+            continue
+        with open(path, encoding="utf-8-sig") as f:
+            data = json.load(f)
+        for layer in data.get("layers", []):
+            for obj in iter_objects(layer):
+                props = object_properties(obj)
+                object_type = to_int(first(props, OBJECT_TYPE_KEYS, obj.get("type")), -1)
+                dest = to_int(first(props, MAP_ID_KEYS), 0)
+                if object_type != GOTO_MAP_OBJECT_TYPE and dest <= 0:
+                    continue
+                exits.append(Exit(source, dest, str(first(props, ASSET_KEYS, "") or ""),
+                                  to_int(first(props, POINT_IN_KEYS), -1),
+                                  to_int(obj.get("x")) // CELL_SIZE, to_int(obj.get("y")) // CELL_SIZE,
+                                  os.path.relpath(path, maps_dir)))
+    return exits, sorted(unknown_dirs)
+
+def validate(maps, exits, unknown_dirs):
+    """Human-readable problems found offline."""
+    problems = []
+    for directory in unknown_dirs:
+        problems.append("no map.csv asset_name matches {}".format(directory))
+    for e in exits:
+        where = "{} ({},{}) in {}".format(maps[e.source].label, e.x, e.y, e.path)
+        if e.dest not in maps:
+            problems.append("{}: MapId {} is not in map.csv".format(where, e.dest))
+            continue
+        dest = maps[e.dest]
+        if e.asset and dest.asset and e.asset.lower() != dest.asset.lower():
+            by_asset = [m for m in maps.values() if m.asset.lower() == e.asset.lower()]
+            hint = " (AssetName belongs to {})".format(by_asset[0].label) if by_asset else ""
+            problems.append("{}: MapId {} \"{}\" but AssetName {}{}".format(where, e.dest, dest.label, e.asset, hint))
+        if e.dest == e.source:
+            problems.append("{}: exit leads back into the same map".format(where))
+    sources = set(e.source for e in exits)
+    targets = set(e.dest for e in exits)
+    for map_id in sorted(targets - sources):
+        if map_id in maps:
+            problems.append("{} (map {}) is entered but has no exits".format(maps[map_id].label, map_id))
+    return problems
+
+def build_routes(node_ids, exits):
+    """(next_hop[N, N] exit index, hops[N, N]) by breadth-first search from every map."""
+    index = dict((map_id, i) for i, map_id in enumerate(node_ids))
+    n = len(node_ids)
+    outgoing = [[] for _ in range(n)]
+    for k, e in enumerate(exits):
+        if e.dest in index:
+            outgoing[index[e.source]].append((k, index[e.dest]))
+    next_hop = np.full((n, n), NO_EXIT, dtype=np.uint16)
+    hops = np.full((n, n), NO_ROUTE, dtype=np.uint8)
+    for s in range(n):
+        hops[s, s] = 0
+        queue = deque()
+        for k, t in outgoing[s]:
+            if hops[s, t] == NO_ROUTE:
+                hops[s, t] = 1
+                next_hop[s, t] = k
+                queue.append(t)
+        while queue:
+            u = queue.popleft()
+            for _, t in outgoing[u]:
+                if hops[s, t] == NO_ROUTE:
+                    hops[s, t] = min(int(hops[s, u]) + 1, NO_ROUTE - 1)
+                    next_hop[s, t] = next_hop[s, u]
+                    queue.append(t)
+    return next_hop, hops
+
+def write_graph(path, maps, node_ids, exits, next_hop, hops):
+    index = dict((map_id, i) for i, map_id in enumerate(node_ids))
+    pool = bytearray()
+    offsets = {}
+
+    def add(text):
+        if text not in offsets:
+            encoded = text.encode("utf-8")
+            offsets[text] = len(pool)
+            pool.extend(struct.pack("<H", len(encoded)) + encoded)
+        return offsets[text]
+
+    body = bytearray()
+    for map_id in node_ids:
+        info = maps.get(map_id)
+        body.extend(MAP_ENTRY.pack(map_id, add(info.label if info else "Map {}".format(map_id)),
+                                   add(info.asset if info else "")))
+    first_exit = np.searchsorted([index[e.source] for e in exits], np.arange(len(node_ids) + 1)).astype("<u4")
+    body.extend(first_exit.tobytes())
+    for e in exits:
+        body.extend(EXIT_ENTRY.pack(index[e.source], index.get(e.dest, NO_EXIT), e.x, e.y, e.point_in))
+    body.extend(next_hop.astype("<u2").tobytes())
+    body.extend(hops.tobytes())
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(node_ids), len(exits), HEADER.size + len(body)))
+        f.write(body)
+        f.write(pool)
+
+class MapGraph(object):
+    """Reader for a built graph asset."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, n, e, pool_offset = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{}: not a version {} map exit graph".format(path, VERSION))
+
+        def string(offset):
+            start = pool_offset + offset
+            length = struct.unpack_from("<H", data, start)[0]
+            return data[start + 2:start + 2 + length].decode("utf-8")
+
+        pos = HEADER.size
+        self.maps = []
+        for i in range(n):
+            map_id, label, asset = MAP_ENTRY.unpack_from(data, pos + i * MAP_ENTRY.size)
+            self.maps.append((map_id, string(label), string(asset)))
+        pos += n * MAP_ENTRY.size
+        self.first_exit = np.frombuffer(data, dtype="<u4", count=n + 1, offset=pos)
+        pos += 4 * (n + 1)
+        self.exits = [EXIT_ENTRY.unpack_from(data, pos + k * EXIT_ENTRY.size) for k in range(e)]
+        pos += e * EXIT_ENTRY.size
+        self.next_hop = np.frombuffer(data, dtype="<u2", count=n * n, offset=pos).reshape(n, n)
+        pos += 2 * n * n
+        self.hops = np.frombuffer(data, dtype=np.uint8, count=n * n, offset=pos).reshape(n, n)
+        self.index = dict((m[0], i) for i, m in enumerate(self.maps))
+
+    def exits_of(self, map_id):
+        i = self.index[map_id]
+        return [self.exits[k] for k in range(self.first_exit[i], self.first_exit[i + 1])]
+
+    def route(self, source_id, dest_id):
+        """Exits to take from source to dest, or None if dest can't be reached."""
+        s, t = self.index[source_id], self.index[dest_id]
+        if self.hops[s, t] == NO_ROUTE:
+            return None
+        steps = []
+        while s != t:
+            exit_entry = self.exits[self.next_hop[s, t]]
+            steps.append(exit_entry)
+            s = exit_entry[1]
+        return steps
+
+def describe_exit(graph, exit_entry):
+    source, dest, x, y, point_in = exit_entry
+    dest_name = graph.maps[dest][1] if dest != NO_EXIT else "(unknown map)"
+    return "{} ({},{}) -> {} [{}]".format(graph.maps[source][1], x, y, dest_name,
+                                          graph.maps[dest][0] if dest != NO_EXIT else "?")
+
+def cmd_build(args):
+    messages = read_messages(args.messages)
+    maps = load_master(args.master, messages)
+    by_asset = {}
+    for info in sorted(maps.values(), key=lambda m: m.map_id):
+        if info.asset:
+            by_asset.setdefault(info.asset.lower(), info.map_id)
+    exits, unknown_dirs = scan_exits(args.maps, by_asset)
+    exits.sort(key=lambda e: (e.source, e.y, e.x))
+
+    node_ids = sorted(set(maps) | set(e.source for e in exits))
+    if len(node_ids) >= NO_EXIT or len(exits) >= NO_EXIT:
+        sys.exit("Too many maps/exits for u16 indexes")
+    next_hop, hops = build_routes(node_ids, exits)
+    write_graph(args.output, maps, node_ids, exits, next_hop, hops)
+
+    problems = validate(maps, exits, unknown_dirs)
+    for problem in problems[:args.limit]:
+        print("  " + problem)
+    if len(problems) > args.limit:
+        print("  ... {} more".format(len(problems) - args.limit))
+    connected = int((hops != NO_ROUTE).sum())
+    print("{} maps, {} exits, {} of {} map pairs connected, {} problems -> {} ({} bytes)".format(
+        len(node_ids), len(exits), connected, len(node_ids) ** 2, len(problems),
+        args.output, os.path.getsize(args.output)))
+    return 1 if args.strict and problems else 0
+
+def cmd_route(args):
+    graph = MapGraph(args.graph)
+    steps = graph.route(args.source, args.dest)
+    if steps is None:
+        print("No route from {} to {}".format(args.source, args.dest))
+        return 1
+    for n, step in enumerate(steps, 1):
+        print("{}. {}".format(n, describe_exit(graph, step)))
+    return 0
+
+def cmd_exits(args):
+    graph = MapGraph(args.graph)
+    for exit_entry in graph.exits_of(args.map):
+        print(describe_exit(graph, exit_entry))
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Map-exit graph and precomputed routes")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="Extract exits, validate labels and write the graph asset")
+    p.add_argument("--maps", required=True)
+    p.add_argument("--master", required=True)
+    p.add_argument("--messages", nargs="*")
+    p.add_argument("-o", "--output", default="map_exits.bin")
+    p.add_argument("--limit", type=int, default=50, help="Problems shown")
+    p.add_argument("--strict", action="store_true", help="Exit 1 if validation finds problems")
+
+    p = sub.add_parser("route", help="Exits to take from one map to another")
+    p.add_argument("graph")
+    p.add_argument("source", type=int)
+    p.add_argument("dest", type=int)
+
+    p = sub.add_parser("exits", help="List one map's exits")
+    p.add_argument("graph")
+    p.add_argument("map", type=int)
+    args = parser.parse_args()
+
+    return {"build": cmd_build, "route": cmd_route, "exits": cmd_exits}[args.command](args)
+
+if __name__ == "__main__":
+    sys.exit(main())
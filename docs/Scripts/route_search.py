@@ -0,0 +1,376 @@
+# Reference implementation of MapRouteSearcher for offline path benchmarking
+# Runs under regular Python 3 with NumPy (not Ghidra)
+#
+# Reimplements the route search in decompiled_pathfinding.c so pathfinding cost
+# and correctness can be measured outside the game:
+#   MakeRouteMapWithCollision  route[layer, x, y] = 0 where the collision tile is
+#                              walkable (FUN_1800dbe90 != 0), else -1
+#   Search                     window of at most WINDOW x WINDOW cells centred on
+#                              the start; the goal is seeded with step 1, then
+#                              every step scans the window for cells == step and
+#                              calls UpdateRouteMapCellStep on their neighbours
+#   UpdateRouteMapCellStep     neighbour in bounds and == 0 -> step + 1; visit
+#                              counter +1; true when the neighbour is the start
+#   SearchShortestRoute        walk back from the start through step - 1 cells,
+#                              neighbours tried in NEIGHBOURS order
+# Search gives up when a step adds no cells; it then retries once per lower
+# layer whose collision tile at the goal is walkable.
+#
+# Everything is vectorised over a batch axis: route maps are (batch, layer, x, y)
+# and one wavefront step advances every pending start/goal pair at once.
+#
+# Grids are .npz files with a "collision" array shaped (layers, width, height),
+# non-zero = walkable, i.e. the data MakeRouteMapWithCollision reads through
+# IMapAccessor. Without --grids the benchmark uses synthetic maps.
+#
+# Usage:
+#   python route_search.py                       (synthetic maps)
+#   python route_search.py --grids exported_grids --pairs 500
+#   python route_search.py --size 256 --window 0 --verify
+
+import argparse
+import glob
+import os
+import time
+from collections import deque
+
+import numpy as np
+
+WINDOW = 64                 # Search's window clamp (FUN_180fa5950(size, 0x40))
+LAYERS_TRIED = (2, 1, 0)    # FieldNavigationHelper.FindPathTo tries dest z = 2..0
+
+# (dx, dy, dz) in the order SearchShortestRoute tests them: the four
+# orthogonal cells, the four diagonals, then the layer above and below
+NEIGHBOURS = [
+    (0, -1, 0), (1, 0, 0), (0, 1, 0), (-1, 0, 0),
+    (1, -1, 0), (1, 1, 0), (-1, 1, 0), (-1, -1, 0),
+    (0, 0, 1), (0, 0, -1),
+]
+
+# Cell offsets of FieldNavigationHelper's adjacentOffsets (world +y is cell -y)
+ADJACENT = [(0, -1), (1, 0), (0, 1), (-1, 0), (1, -1), (1, 1), (-1, 1), (-1, -1)]
+
+def load_grid(path):
+    """(layers, width, height) bool walkable array from an exported .npz/.npy grid."""
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            collision = data["collision"]
+    else:
+        collision = np.load(path)
+    if collision.ndim == 2:
+        collision = collision[None]
+    return collision != 0
+
+def make_route_map(walkable):
+    """MakeRouteMapWithCollision: 0 = walkable and unvisited, -1 = blocked."""
+    return np.where(walkable, 0, -1).astype(np.int32)
+
+def _shift_slices(delta, size):
+    """(source, destination) slices moving cells by delta along one axis."""
+    if delta > 0:
+        return slice(0, size - delta), slice(delta, size)
+    if delta < 0:
+        return slice(-delta, size), slice(0, size + delta)
+    return slice(None), slice(None)
+
+def expand(route, active, targets=None, neighbours=NEIGHBOURS, max_steps=None):
+    """Wavefront expansion over a batch of seeded route maps.
+
+    route is (batch, layer, x, y) int32 with seeds already set to 1 and is
+    updated in place. targets is a (batch, 3) int array of (layer, x, y) cells
+    whose pair finishes when reached, or None to flood everything. Returns
+    (reached[batch], steps[batch], visits[batch]).
+    """
+    batch = route.shape[0]
+    shape = route.shape[1:]
+    moves = []
+    for dx, dy, dz in neighbours:
+        pairs = [_shift_slices(d, n) for d, n in zip((dz, dx, dy), shape)]
+        moves.append(((slice(None),) + tuple(p[0] for p in pairs),
+                      (slice(None),) + tuple(p[1] for p in pairs)))
+
+    reached = np.zeros(batch, dtype=bool)
+    steps = np.zeros(batch, dtype=np.int32)
+    visits = np.zeros(batch, dtype=np.int64)
+    # Finished pairs are dropped from the working set once it is half empty,
+    # so one long search doesn't keep every other pair's maps in the step loop
+    idx = np.nonzero(active)[0]
+    work = route[idx]
+    live = np.ones(len(idx), dtype=bool)
+    step = 1
+    while live.any() and (max_steps is None or step <= max_steps):
+        if live.sum() * 2 < len(idx):
+            route[idx] = work
+            idx, work, live = idx[live], work[live], live[live]
+        n = len(idx)
+        frontier = (work == step) & live[:, None, None, None]
+        added = np.zeros(n, dtype=np.int64)
+        for src, dst in moves:
+            view = work[dst]
+            grow = frontier[src] & (view == 0)
+            view[grow] = step + 1
+            added += grow.reshape(n, -1).sum(axis=1)
+        visits[idx] += added
+        steps[idx[live]] = step
+        if targets is not None:
+            t = targets[idx]
+            hit = work[np.arange(n), t[:, 0], t[:, 1], t[:, 2]] > 0
+            reached[idx[hit & live]] = True
+            live &= ~hit
+        live &= added > 0
+        step += 1
+    route[idx] = work
+    return reached, steps, visits
+
+def shortest_routes(route, starts, ok, neighbours=NEIGHBOURS):
+    """SearchShortestRoute for every pair: cell lists from start down to the step-1 seed."""
+    batch, layers, width, height = route.shape
+    rows = np.arange(batch)
+    pos = starts.copy()
+    value = route[rows, pos[:, 0], pos[:, 1], pos[:, 2]]
+    paths = [[tuple(p)] if ok[b] else None for b, p in enumerate(pos)]
+    walking = ok & (value > 1)
+    while walking.any():
+        moved = np.zeros(batch, dtype=bool)
+        for dx, dy, dz in neighbours:
+            nxt = pos + np.array([dz, dx, dy])
+            inside = ((nxt >= 0) & (nxt < np.array([layers, width, height]))).all(axis=1)
+            take = walking & ~moved & inside
+            clipped = np.clip(nxt, 0, np.array([layers - 1, width - 1, height - 1]))
+            take &= route[rows, clipped[:, 0], clipped[:, 1], clipped[:, 2]] == value - 1
+            pos[take] = nxt[take]
+            moved |= take
+        value[moved] -= 1
+        for b in np.nonzero(moved)[0]:
+            paths[b].append(tuple(pos[b]))
+        walking &= moved & (value > 1)
+    return paths
+
+class Searcher(object):
+    """Batched MapRouteSearcher.Search over one map."""
+
+    def __init__(self, walkable, window=WINDOW, neighbours=NEIGHBOURS):
+        self.walkable = walkable
+        self.base = make_route_map(walkable)
+        self.layers, self.width, self.height = walkable.shape
+        if not window:
+            self.window = (self.width, self.height)
+        else:
+            self.window = (min(self.width, window), min(self.height, window))
+        self.neighbours = neighbours
+
+    def origins(self, starts):
+        """Window origin (x, y) per start, clamped so the window stays on the map."""
+        ww, wh = self.window
+        ox = np.clip(starts[:, 1] - ww // 2, 0, self.width - ww)
+        oy = np.clip(starts[:, 2] - wh // 2, 0, self.height - wh)
+        return np.stack([ox, oy], axis=1)
+
+    def search(self, starts, goal_sets):
+        """One Search call per pair; goal_sets[b] is a list of (layer, x, y) seeds.
+
+        A single seed is the game's behaviour; several seeds answer "nearest of
+        these" in one expansion. Returns (paths, steps, visits, scanned) where
+        scanned counts the window cells the game would test per step.
+        """
+        starts = np.asarray(starts, dtype=np.int64).reshape(-1, 3)
+        batch = len(starts)
+        ww, wh = self.window
+        origin = self.origins(starts)
+        route = np.empty((batch, self.layers, ww, wh), dtype=np.int32)
+        active = np.zeros(batch, dtype=bool)
+        for b in range(batch):
+            ox, oy = origin[b]
+            route[b] = self.base[:, ox:ox + ww, oy:oy + wh]
+            for layer, x, y in goal_sets[b]:
+                if 0 <= x - ox < ww and 0 <= y - oy < wh:
+                    route[b, layer, x - ox, y - oy] = 1
+                    active[b] = True
+        local = starts - np.concatenate([np.zeros((batch, 1), dtype=np.int64), origin], axis=1)
+        already = route[np.arange(batch), local[:, 0], local[:, 1], local[:, 2]] == 1
+        reached, steps, visits = expand(route, active & ~already, local, self.neighbours)
+        reached |= already & active
+        paths = shortest_routes(route, local, reached, self.neighbours)
+        for b, path in enumerate(paths):
+            if path is not None:
+                ox, oy = origin[b]
+                paths[b] = [(layer, x + ox, y + oy) for layer, x, y in path]
+        scanned = steps.astype(np.int64) * self.layers * ww * wh
+        return paths, steps, visits, scanned
+
+    def search_with_fallback(self, starts, goals):
+        """Search as the game runs it: a stalled search retries lower layers walkable at the goal."""
+        goals = np.asarray(goals, dtype=np.int64).reshape(-1, 3)
+        paths, steps, visits, scanned = self.search(starts, [[tuple(g)] for g in goals])
+        calls = np.ones(len(goals), dtype=np.int64)
+        pending = [b for b, p in enumerate(paths) if p is None]
+        for lower in range(self.layers - 2, -1, -1):
+            retry = [b for b in pending if goals[b, 0] > lower
+                     and self.walkable[lower, goals[b, 1], goals[b, 2]]]
+            if not retry:
+                continue
+            retry_goals = [[(lower, goals[b, 1], goals[b, 2])] for b in retry]
+            p2, s2, v2, c2 = self.search(np.asarray(starts).reshape(-1, 3)[retry], retry_goals)
+            for i, b in enumerate(retry):
+                calls[b] += 1
+                steps[b] += s2[i]
+                visits[b] += v2[i]
+                scanned[b] += c2[i]
+                paths[b] = p2[i]
+            pending = [b for b in pending if paths[b] is None]
+        return paths, steps, visits, scanned, calls
+
+def candidate_goals(searcher, target):
+    """FindPathTo's destination order: the target on z = 2..0, then each adjacent cell on z = 2..0."""
+    _, x, y = target
+    cells = [(x, y)] + [(x + dx, y + dy) for dx, dy in ADJACENT]
+    goals = []
+    for cx, cy in cells:
+        if 0 <= cx < searcher.width and 0 <= cy < searcher.height:
+            goals.extend((z, cx, cy) for z in LAYERS_TRIED if z < searcher.layers)
+    return goals
+
+def retry_strategy(searcher, starts, targets):
+    """FieldNavigationHelper's loop: one Search per candidate until one returns a path."""
+    n = len(starts)
+    paths = [None] * n
+    totals = dict(calls=np.zeros(n, np.int64), visits=np.zeros(n, np.int64), scanned=np.zeros(n, np.int64))
+    candidates = [candidate_goals(searcher, t) for t in targets]
+    pending = list(range(n))
+    for round_index in range(max(len(c) for c in candidates)):
+        pending = [b for b in pending if paths[b] is None and round_index < len(candidates[b])]
+        if not pending:
+            break
+        goals = [candidates[b][round_index] for b in pending]
+        p, _, visits, scanned, calls = searcher.search_with_fallback(starts[pending], goals)
+        for i, b in enumerate(pending):
+            paths[b] = p[i]
+            totals["calls"][b] += calls[i]
+            totals["visits"][b] += visits[i]
+            totals["scanned"][b] += scanned[i]
+    return paths, totals
+
+def multi_goal_strategy(searcher, starts, targets):
+    """All of FindPathTo's candidates seeded at once: one expansion reaches the nearest."""
+    paths, _, visits, scanned = searcher.search(starts, [candidate_goals(searcher, t) for t in targets])
+    return paths, dict(calls=np.ones(len(starts), np.int64), visits=visits, scanned=scanned)
+
+def bfs_distance(walkable, start, goal, neighbours=NEIGHBOURS):
+    """Plain BFS (start to goal, goal may be blocked) used by --verify."""
+    layers, width, height = walkable.shape
+    seen = {start: 0}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        if cell == goal:
+            return seen[cell]
+        layer, x, y = cell
+        for dx, dy, dz in neighbours:
+            nxt = (layer + dz, x + dx, y + dy)
+            if nxt in seen or not (0 <= nxt[0] < layers and 0 <= nxt[1] < width and 0 <= nxt[2] < height):
+                continue
+            if walkable[nxt] or nxt == goal:
+                seen[nxt] = seen[cell] + 1
+                queue.append(nxt)
+    return None
+
+def synthetic_grid(rng, size, layers, density):
+    """Random walls plus rooms with one-cell pockets (NPCs behind counters, chests in alcoves)."""
+    walkable = rng.random((layers, size, size)) >= density
+    for _ in range(size // 8):
+        x, y = rng.integers(2, size - 8, size=2)
+        w, h = rng.integers(4, 8, size=2)
+        walkable[0, x:x + w, y] = False
+        walkable[0, x:x + w, y + h] = False
+        walkable[0, x, y:y + h] = False
+        walkable[0, x + w, y:y + h + 1] = False
+        walkable[0, x + w // 2, y] = True
+    return walkable
+
+def pick_pairs(rng, walkable, count):
+    """Walkable starts; targets are mostly walkable cells, some blocked ones next to walkable cells."""
+    walk = np.argwhere(walkable)
+    blocked = np.argwhere(~walkable)
+    starts = walk[rng.integers(0, len(walk), size=count)]
+    targets = walk[rng.integers(0, len(walk), size=count)]
+    if len(blocked):
+        some = rng.random(count) < 0.3
+        targets[some] = blocked[rng.integers(0, len(blocked), size=some.sum())]
+    targets[:, 0] = np.minimum(targets[:, 0], max(LAYERS_TRIED))
+    return starts.astype(np.int64), targets.astype(np.int64)
+
+def summarise(name, paths, totals, elapsed):
+    found = sum(1 for p in paths if p is not None)
+    n = len(paths)
+    print("  {:<12} found {:>5}/{:<5} calls avg {:>5.2f} max {:>3}  visits avg {:>8.0f}  "
+          "scanned avg {:>9.0f}  {:>8.1f} ms".format(
+              name, found, n, totals["calls"].mean(), totals["calls"].max(),
+              totals["visits"].mean(), totals["scanned"].mean(), elapsed * 1000))
+
+def benchmark_map(name, walkable, args, rng):
+    searcher = Searcher(walkable, args.window)
+    starts, targets = pick_pairs(rng, walkable, args.pairs)
+    print("{}: {} layers, {}x{}, window {}x{}, {} pairs".format(
+        name, searcher.layers, searcher.width, searcher.height, searcher.window[0], searcher.window[1], len(starts)))
+
+    t = time.perf_counter()
+    retry_paths, retry_totals = retry_strategy(searcher, starts, targets)
+    summarise("retry", retry_paths, retry_totals, time.perf_counter() - t)
+
+    t = time.perf_counter()
+    multi_paths, multi_totals = multi_goal_strategy(searcher, starts, targets)
+    summarise("multi-goal", multi_paths, multi_totals, time.perf_counter() - t)
+
+    same = sum(1 for a, b in zip(retry_paths, multi_paths) if (a is None) == (b is None))
+    moved = sum(1 for a, b in zip(retry_paths, multi_paths) if a and b and a[-1] != b[-1])
+    print("  agreement {}/{} found/not-found; multi-goal ends on a different candidate cell for {}".format(
+        same, len(starts), moved))
+
+    t = time.perf_counter()
+    for b in range(min(len(starts), 50)):
+        searcher.search(starts[b:b + 1], [[tuple(targets[b])]])
+    per_pair = (time.perf_counter() - t) / min(len(starts), 50)
+    t = time.perf_counter()
+    searcher.search(starts, [[tuple(g)] for g in targets])
+    batched = (time.perf_counter() - t) / len(starts)
+    print("  single Search: {:.3f} ms/pair unbatched, {:.3f} ms/pair batched".format(per_pair * 1000, batched * 1000))
+
+    if args.verify and args.window:
+        print("  verify: skipped (needs --window 0)")
+    elif args.verify:
+        bad = 0
+        for b in range(min(len(starts), 100)):
+            goal = tuple(int(v) for v in targets[b])
+            path = searcher.search(starts[b:b + 1], [[goal]])[0][0]
+            expected = bfs_distance(walkable, tuple(int(v) for v in starts[b]), goal)
+            if (path is None) != (expected is None) or (path and len(path) - 1 != expected):
+                bad += 1
+        print("  verify: {} mismatches against plain BFS".format(bad))
+    print("")
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline MapRouteSearcher reference and benchmark")
+    parser.add_argument("--grids", help="Directory of exported .npz/.npy collision grids")
+    parser.add_argument("--pairs", type=int, default=200)
+    parser.add_argument("--size", type=int, default=96, help="Synthetic map size")
+    parser.add_argument("--layers", type=int, default=3, help="Synthetic map layers")
+    parser.add_argument("--density", type=float, default=0.25, help="Synthetic wall density")
+    parser.add_argument("--maps", type=int, default=3, help="Synthetic map count")
+    parser.add_argument("--window", type=int, default=WINDOW, help="Search window (0 = whole map)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verify", action="store_true", help="Check path lengths against plain BFS")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    if args.grids:
+        paths = sorted(glob.glob(os.path.join(args.grids, "*.np[yz]")))
+        if not paths:
+            raise SystemExit("No .npz/.npy grids in " + args.grids)
+        for path in paths:
+            benchmark_map(os.path.basename(path), load_grid(path), args, rng)
+    else:
+        for i in range(args.maps):
+            benchmark_map("synthetic{}".format(i), synthetic_grid(rng, args.size, args.layers, args.density), args, rng)
+
+if __name__ == "__main__":
+    main()
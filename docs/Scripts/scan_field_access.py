@@ -0,0 +1,194 @@
+# Ghidra headless script to find every instruction that touches a field offset
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+#
+# Walks the instruction stream of the functions of TARGET_CLASSES (or the whole
+# binary when empty) and reports every base+displacement memory operand whose
+# displacement is in TARGET_OFFSETS. Read/write comes from the instruction's
+# p-code (LOAD/STORE); LEA-style address computations are reported as "addr".
+#
+# Work is split into contiguous address chunks scanned on a thread pool, so a
+# whole-binary pass finishes without decompiling anything.
+#
+# Output is a TSV sorted by offset, then function - the "index" you grep or
+# load into a spreadsheet - written next to the xref index, outside the repo:
+#   offset  access  function_rva  function  site_rva  instruction
+
+from ghidra.program.model.lang import OperandType
+from ghidra.program.model.pcode import PcodeOp
+from ghidra.program.model.scalar import Scalar
+from java.util import ArrayList
+from java.util.concurrent import Callable, Executors
+import codecs
+import os
+import time
+
+from script_json import load_script_json
+
+# Offsets to match (see docs/debug.md for where the mod reads these)
+TARGET_OFFSETS = [0x88, 0xA0, 0xA8, 0xF8]
+
+# Class names from script.json to restrict the scan to (empty = whole binary)
+TARGET_CLASSES = ["MessageWindowManager"]
+
+THREADS = 8
+EXCLUDE_STACK = True        # Ignore [RSP+disp] - those are locals, not fields
+STACK_REGISTERS = ["RSP", "ESP"]
+
+# Paths
+OUTPUT_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\xref_index\\field_access_report.tsv"
+SCRIPT_JSON_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\script.json"
+
+def load_script_names():
+    """Map RVA -> IL2CPP method name from script.json."""
+    names = {}
+    print("Loading IL2CPP method names from: " + SCRIPT_JSON_PATH)
+    data = load_script_json(SCRIPT_JSON_PATH)
+    if data is None:
+        print("WARNING: script.json not found at: " + SCRIPT_JSON_PATH)
+        return names
+    for method in data.get("ScriptMethod", []):
+        addr = method.get("Address")
+        name = method.get("Name")
+        if addr and name and addr not in names:
+            names[addr] = name
+    print("Loaded " + str(len(names)) + " method names")
+    return names
+
+def select_functions(program, script_names):
+    """Functions to scan, in address order."""
+    func_mgr = program.getFunctionManager()
+    image_base = program.getImageBase().getOffset()
+
+    if not TARGET_CLASSES:
+        return [f for f in func_mgr.getFunctions(True)]
+
+    functions = []
+    for rva in sorted(script_names):
+        name = script_names[rva]
+        class_name = name.split("$$")[0] if "$$" in name else name
+        if class_name in TARGET_CLASSES:
+            func = func_mgr.getFunctionAt(toAddr(image_base + rva))
+            if func is None:
+                func = createFunction(toAddr(image_base + rva), None)
+            if func is not None:
+                functions.append(func)
+    return functions
+
+def memory_displacement(instr, op_index, offsets):
+    """Displacement of a [reg+disp] operand if it is one of offsets, else None."""
+    if not OperandType.isDynamic(instr.getOperandType(op_index)):
+        return None
+    disp = None
+    for obj in instr.getOpObjects(op_index):
+        if isinstance(obj, Scalar):
+            disp = obj.getSignedValue()
+        elif EXCLUDE_STACK and hasattr(obj, "getName") and obj.getName() in STACK_REGISTERS:
+            return None
+    if disp is not None and disp in offsets:
+        return disp
+    return None
+
+def access_kind(instr):
+    load = store = False
+    for op in instr.getPcode():
+        code = op.getOpcode()
+        if code == PcodeOp.LOAD:
+            load = True
+        elif code == PcodeOp.STORE:
+            store = True
+    if load and store:
+        return "rw"
+    if store:
+        return "write"
+    if load:
+        return "read"
+    return "addr"
+
+class ScanTask(Callable):
+    """Scan one contiguous chunk of functions."""
+
+    def __init__(self, program, functions, offsets, image_base, script_names):
+        self.program = program
+        self.functions = functions
+        self.offsets = offsets
+        self.image_base = image_base
+        self.script_names = script_names
+
+    def call(self):
+        listing = self.program.getListing()
+        hits = []
+        for func in self.functions:
+            func_rva = func.getEntryPoint().getOffset() - self.image_base
+            func_name = self.script_names.get(func_rva, func.getName())
+            for instr in listing.getInstructions(func.getBody(), True):
+                for op_index in range(instr.getNumOperands()):
+                    disp = memory_displacement(instr, op_index, self.offsets)
+                    if disp is None:
+                        continue
+                    site_rva = instr.getAddress().getOffset() - self.image_base
+                    hits.append((disp, access_kind(instr), func_rva, func_name, site_rva, str(instr)))
+                    break
+        return hits
+
+def run():
+    """Main script entry point."""
+    print("=" * 70)
+    print("FF1 Field Access Scanner")
+    print("=" * 70)
+
+    program = getCurrentProgram()
+    if program is None:
+        print("ERROR: No program loaded!")
+        return
+
+    image_base = program.getImageBase().getOffset()
+    offsets = set(TARGET_OFFSETS)
+    print("Program: " + program.getName())
+    print("Offsets: " + ", ".join("0x{:X}".format(o) for o in sorted(offsets)))
+    print("Classes: " + (", ".join(TARGET_CLASSES) if TARGET_CLASSES else "(whole binary)"))
+    print("Output: " + OUTPUT_PATH)
+    print("")
+
+    script_names = load_script_names()
+    functions = select_functions(program, script_names)
+    print("Scanning " + str(len(functions)) + " functions on " + str(THREADS) + " threads...")
+
+    start = time.time()
+    chunk_size = max(1, (len(functions) + THREADS - 1) // THREADS)
+    tasks = ArrayList()
+    for i in range(0, len(functions), chunk_size):
+        tasks.add(ScanTask(program, functions[i:i + chunk_size], offsets, image_base, script_names))
+
+    executor = Executors.newFixedThreadPool(THREADS)
+    hits = []
+    try:
+        for future in executor.invokeAll(tasks):
+            hits.extend(future.get())
+    finally:
+        executor.shutdown()
+
+    hits.sort(key=lambda h: (h[0], h[3], h[4]))
+
+    if not os.path.exists(os.path.dirname(OUTPUT_PATH)):
+        os.makedirs(os.path.dirname(OUTPUT_PATH))
+    with codecs.open(OUTPUT_PATH, 'w', 'utf-8') as f:
+        f.write("offset\taccess\tfunction_rva\tfunction\tsite_rva\tinstruction\n")
+        for disp, access, func_rva, func_name, site_rva, text in hits:
+            f.write("0x{:X}\t{}\t0x{:X}\t{}\t0x{:X}\t{}\n".format(disp, access, func_rva, func_name, site_rva, text))
+
+    print("")
+    print("=" * 70)
+    print("Scan complete in {:.1f}s: {} accesses".format(time.time() - start, len(hits)))
+    for offset in sorted(offsets):
+        matching = [h for h in hits if h[0] == offset]
+        writers = set(h[3] for h in matching if h[1] in ("write", "rw"))
+        readers = set(h[3] for h in matching if h[1] in ("read", "rw"))
+        print("  0x{:X}: {} sites, {} reading functions, {} writing functions".format(
+            offset, len(matching), len(readers), len(writers)))
+        for name in sorted(writers):
+            print("      W " + name)
+    print("  Output: " + OUTPUT_PATH)
+    print("=" * 70)
+
+# Run the script
+run()
@@ -0,0 +1,25 @@
+# Cached script.json loader shared by the decompile_*.py Ghidra scripts
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+#
+# script.json (Il2CppDumper output) is large; symbol naming, signature
+# application and globals resolution all read it, so it is parsed once per run
+# (and again only if the file changes, for watch_decompile.py).
+
+import codecs
+import json
+import os
+
+_cache = {}
+
+def load_script_json(path):
+    """Parsed script.json, or None if it doesn't exist."""
+    key = (path, os.path.getmtime(path) if os.path.exists(path) else None)
+    if key in _cache:
+        return _cache[key]
+    data = None
+    if key[1] is not None:
+        with codecs.open(path, 'r', 'utf-8') as f:
+            data = json.load(f)
+    _cache.clear()
+    _cache[key] = data
+    return data
@@ -0,0 +1,194 @@
+# Cross-game function similarity index (FF1 <-> FF2/FF3 Pixel Remaster)
+# Runs under regular Python 3 with NumPy (not Ghidra)
+#
+# Loads the per-game fingerprints written by export_fingerprints.py, computes a
+# MinHash signature per function and buckets it with LSH banding in SQLite, so
+# "what is FF1's MapRouteSearcher$$Search in FF3?" is a few indexed lookups.
+#
+# Ranking: estimated Jaccard similarity of the normalised instruction shingles,
+# plus a bonus when the script.json name is identical in both games (most
+# methods keep their name between ports; their offsets and RVAs do not).
+#
+# Usage:
+#   python similarity_index.py add ff1 fingerprints_ff1.tsv
+#   python similarity_index.py add ff3 fingerprints_ff3.tsv
+#   python similarity_index.py match ff1 ff3 BattlePauseController$$SetActive
+#   python similarity_index.py match ff1 ff3 0xCB4E60 --top 5
+#   python similarity_index.py manifest ff1 ff3 decompile_pathfinding.py > ff3_targets.py
+
+import argparse
+import ast
+import os
+import sqlite3
+import sys
+
+import numpy as np
+
+INDEX_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\similarity_index.db"
+
+NUM_PERM = 64
+BANDS = 16                  # NUM_PERM / BANDS rows per band
+ROWS = NUM_PERM // BANDS
+PRIME = (1 << 61) - 1
+SEED = 0x46463150           # Fixed so signatures from separate runs are comparable
+NAME_BONUS = 0.5            # Added to the score when script.json names match
+MIN_SCORE = 0.2             # Manifest entries below this are emitted commented out
+
+_rng = np.random.RandomState(SEED)
+_PERM_A = _rng.randint(1, 1 << 31, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, 1 << 31, size=NUM_PERM).astype(np.uint64)
+
+def minhash(hashes):
+    """MinHash signature (uint32[NUM_PERM]) of a set of 32-bit shingle hashes."""
+    h = np.asarray(hashes, dtype=np.uint64)
+    # a, b < 2^31 and h < 2^32 keep a*h+b below 2^63, so uint64 never overflows
+    values = (np.outer(_PERM_A, h) + _PERM_B[:, None]) % np.uint64(PRIME)
+    return (values.min(axis=1) & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+def band_keys(signature):
+    """One LSH bucket key per band."""
+    rows = signature.reshape(BANDS, ROWS).astype(np.int64)
+    keys = rows[:, 0]
+    for r in range(1, ROWS):
+        keys = (keys * 1000003) ^ rows[:, r]
+    return [int(k) & 0x7FFFFFFFFFFFFFFF for k in keys]
+
+def open_index(path):
+    db = sqlite3.connect(path)
+    db.executescript("""
+        CREATE TABLE IF NOT EXISTS functions (
+            game TEXT, rva INTEGER, name TEXT, instructions INTEGER, signature BLOB,
+            PRIMARY KEY (game, rva));
+        CREATE TABLE IF NOT EXISTS buckets (game TEXT, band INTEGER, key INTEGER, rva INTEGER);
+        CREATE INDEX IF NOT EXISTS buckets_key ON buckets (game, band, key);
+        CREATE INDEX IF NOT EXISTS functions_name ON functions (game, name);
+    """)
+    return db
+
+def cmd_add(db, args):
+    db.execute("DELETE FROM functions WHERE game = ?", (args.game,))
+    db.execute("DELETE FROM buckets WHERE game = ?", (args.game,))
+    count = 0
+    functions = []
+    buckets = []
+    with open(args.fingerprints, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            rva, name, instructions, hashes = line.rstrip("\n").split("\t")
+            signature = minhash([int(h, 16) for h in hashes.split()])
+            rva = int(rva, 16)
+            functions.append((args.game, rva, name, int(instructions), signature.tobytes()))
+            for band, key in enumerate(band_keys(signature)):
+                buckets.append((args.game, band, key, rva))
+            count += 1
+            if len(functions) >= 10000:
+                db.executemany("INSERT OR REPLACE INTO functions VALUES (?, ?, ?, ?, ?)", functions)
+                db.executemany("INSERT INTO buckets VALUES (?, ?, ?, ?)", buckets)
+                functions, buckets = [], []
+                print("  {} functions".format(count), file=sys.stderr)
+    db.executemany("INSERT OR REPLACE INTO functions VALUES (?, ?, ?, ?, ?)", functions)
+    db.executemany("INSERT INTO buckets VALUES (?, ?, ?, ?)", buckets)
+    db.commit()
+    print("Indexed {} functions for {}".format(count, args.game))
+
+def resolve(db, game, target):
+    """Rows (rva, name, instructions, signature) for an RVA ("0x...") or script.json name."""
+    query = "SELECT rva, name, instructions, signature FROM functions WHERE game = ? AND "
+    if target.lower().startswith("0x"):
+        return db.execute(query + "rva = ?", (game, int(target, 16))).fetchall()
+    name = target if "$$" in target else target.replace(".", "$$", 1)
+    return db.execute(query + "name = ?", (game, name)).fetchall()
+
+def find_matches(db, src_game, dst_game, row, top):
+    """Ranked [(score, jaccard, rva, name, instructions)] in dst_game for one src function."""
+    rva, name, instructions, blob = row
+    signature = np.frombuffer(blob, dtype=np.uint32)
+
+    candidates = set()
+    for band, key in enumerate(band_keys(signature)):
+        for (other,) in db.execute("SELECT rva FROM buckets WHERE game = ? AND band = ? AND key = ?",
+                                   (dst_game, band, key)):
+            candidates.add(other)
+    for (other,) in db.execute("SELECT rva FROM functions WHERE game = ? AND name = ?", (dst_game, name)):
+        candidates.add(other)
+    if not candidates:
+        return []
+
+    ranked = []
+    placeholders = ",".join("?" * len(candidates))
+    for other, other_name, other_instructions, other_blob in db.execute(
+            "SELECT rva, name, instructions, signature FROM functions WHERE game = ? AND rva IN ({})".format(placeholders),
+            [dst_game] + list(candidates)):
+        jaccard = float(np.mean(np.frombuffer(other_blob, dtype=np.uint32) == signature))
+        score = jaccard + (NAME_BONUS if other_name == name else 0.0)
+        ranked.append((score, jaccard, other, other_name, other_instructions))
+    ranked.sort(key=lambda r: -r[0])
+    return ranked[:top]
+
+def cmd_match(db, args):
+    rows = resolve(db, args.src, args.target)
+    if not rows:
+        sys.exit("No {} function matches: {}".format(args.src, args.target))
+    for row in rows:
+        print("{} 0x{:X} {} ({} instructions)".format(args.src, row[0], row[1], row[2]))
+        matches = find_matches(db, args.src, args.dst, row, args.top)
+        for score, jaccard, rva, name, instructions in matches:
+            print("  {:.2f}  jaccard {:.2f}  {} 0x{:X} {} ({} instructions)".format(
+                score, jaccard, args.dst, rva, name, instructions))
+        if not matches:
+            print("  (no candidates)")
+
+def read_targets(script_path):
+    with open(script_path, encoding="utf-8") as f:
+        source = f.read()
+    start = source.index("TARGET_FUNCTIONS_RVA = {")
+    end = source.index("\n}", start)
+    return ast.literal_eval(source[start + len("TARGET_FUNCTIONS_RVA = "):end + 2])
+
+def cmd_manifest(db, args):
+    """Print a TARGET_FUNCTIONS_RVA block for dst_game built from a src_game decompile script."""
+    targets = read_targets(args.script)
+    print("# Generated by similarity_index.py from {} ({} -> {})".format(
+        os.path.basename(args.script), args.src, args.dst))
+    print("TARGET_FUNCTIONS_RVA = {")
+    for src_rva, name in sorted(targets.items(), key=lambda x: x[1]):
+        rows = db.execute("SELECT rva, name, instructions, signature FROM functions WHERE game = ? AND rva = ?",
+                          (args.src, src_rva)).fetchall()
+        matches = find_matches(db, args.src, args.dst, rows[0], 1) if rows else []
+        if not matches:
+            print("    # 0x??????: \"{}\",  # no match ({} 0x{:X})".format(name, args.src, src_rva))
+            continue
+        score, jaccard, rva, dst_name, _ = matches[0]
+        prefix = "" if score >= MIN_SCORE else "# "
+        print("    {}0x{:X}: \"{}\",  # score {:.2f}, jaccard {:.2f}, {} 0x{:X}{}".format(
+            prefix, rva, name, score, jaccard, args.src, src_rva,
+            "" if dst_name == name else ", named " + dst_name))
+    print("}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-game function similarity index")
+    parser.add_argument("--index", default=INDEX_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("add", help="Load (or replace) one game's fingerprints")
+    p.add_argument("game")
+    p.add_argument("fingerprints")
+
+    p = sub.add_parser("match", help="Ranked matches for one function in another game")
+    p.add_argument("src")
+    p.add_argument("dst")
+    p.add_argument("target", help="RVA (0x...) or script.json name")
+    p.add_argument("--top", type=int, default=10)
+
+    p = sub.add_parser("manifest", help="TARGET_FUNCTIONS_RVA for dst from a src decompile script")
+    p.add_argument("src")
+    p.add_argument("dst")
+    p.add_argument("script")
+    args = parser.parse_args()
+
+    db = open_index(args.index)
+    {"add": cmd_add, "match": cmd_match, "manifest": cmd_manifest}[args.command](db, args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+# Ghidra script that keeps a decompile session warm and re-runs only what changed
+# Compatible with Jython 2.7 (Ghidra's Python interpreter)
+#
+# Watches:
+#   - The decompile_*.py scripts in WATCHED_SCRIPTS (their TARGET_FUNCTIONS_RVA
+#     and OUTPUT_PATH act as manifests)
+#   - il2cpp_ghidra.h
+#   - script.json
+# and regenerates only the affected sections of each decompiled_*.c in place:
+#   - Manifest edit      -> added/renamed functions decompiled, removed ones dropped
+#   - Header edit        -> header re-parsed; functions whose output mentions an
+#                           identifier on a changed header line are redone
+#   - script.json edit   -> functions whose name changed, or whose output calls a
+#                           renamed function, are redone
+#
+# Run it once from the Script Manager (or headless with -noanalysis) and leave it
+# running; cancel the task or create STOP_FILE to exit.
+
+from ghidra.app.decompiler import DecompInterface
+from ghidra.app.util.cparser.C import CParser
+from ghidra.program.model.symbol import SourceType
+import ast
+import codecs
+import os
+import re
+import time
+
+from decompile_globals import globals_comment, resolve_globals
+from decompile_signatures import apply_signatures
+from decompile_timeouts import DecompileStats, decompile_adaptive
+from script_json import load_script_json
+
+SCRIPTS_DIR = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\ff1-screen-reader\\docs\\Scripts"
+WATCHED_SCRIPTS = [
+    os.path.join(SCRIPTS_DIR, "decompile_magic.py"),
+    os.path.join(SCRIPTS_DIR, "decompile_mapexits.py"),
+    os.path.join(SCRIPTS_DIR, "decompile_pathfinding.py"),
+]
+SCRIPT_JSON_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\script.json"
+IL2CPP_HEADER_PATH = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\il2cpp_ghidra.h"
+DECOMPILE_STATS_PATH = os.path.join(SCRIPTS_DIR, "decompile_stats.json")
+STOP_FILE = os.path.join(SCRIPTS_DIR, "watch_decompile.stop")
+
+POLL_SECONDS = 2
+
+IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]{3,}")
+RULE = re.compile(r"^/\*{20,}/$")
+BANNER_NAME = re.compile(r"^/\* (\S+)\s*$")
+BANNER_RVA = re.compile(r"^ \* RVA: 0x([0-9A-Fa-f]+)")
+BANNER_ADDRESS = re.compile(r"^ \* Address: 0x[0-9A-Fa-f]+")
+SKIPPED_LINE = re.compile(r"^/\* (\S+) \(RVA: 0x([0-9A-Fa-f]+)\) SKIPPED")
+BANNER_END = re.compile(r"^ \*{20,}/$")
+CLASS_RULE = re.compile(r"^/={20,}/$")
+
+def file_signature(path):
+    if not os.path.exists(path):
+        return None
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime)
+
+def read_manifest(script_path):
+    """Return (targets {rva: name}, output path) parsed from a decompile_*.py without running it."""
+    with codecs.open(script_path, 'r', 'utf-8') as f:
+        source = f.read()
+    start = source.index("TARGET_FUNCTIONS_RVA = {")
+    end = source.index("\n}", start)
+    targets = ast.literal_eval(source[start + len("TARGET_FUNCTIONS_RVA = "):end + 2])
+    output = re.search(r'^OUTPUT_PATH = "(.*)"', source, re.M).group(1).replace("\\\\", "\\")
+    return targets, output
+
+def drop_separator(section):
+    """Remove the blank line the writer appends before the next banner."""
+    if section is not None and section[1] and section[1][-1] == "":
+        section[1].pop()
+
+def banner_lines(name, rva, image_base, old=None):
+    """Banner text for a (re)generated section, keeping annotations such as
+    xref_query's caller list from the old banner."""
+    extra = [line for line in (old or [])[1:] if not BANNER_RVA.match(line) and not BANNER_ADDRESS.match(line)]
+    return ["/* " + name, " * RVA: 0x{:X}".format(rva)] + extra + [" * Address: 0x{:X}".format(image_base + rva)]
+
+def parse_output(path):
+    """Split a decompiled_*.c into (file header, {rva: (name, body, banner lines)})."""
+    if not os.path.exists(path):
+        return None, {}
+    with codecs.open(path, 'r', 'utf-8') as f:
+        lines = f.read().split("\n")
+
+    header_end = len(lines)
+    for i, line in enumerate(lines):
+        if CLASS_RULE.match(line) or RULE.match(line):
+            header_end = i
+            break
+    header = "\n".join(lines[:header_end]).rstrip("\n")
+
+    sections = {}
+    current = None
+    i = header_end
+    while i < len(lines):
+        line = lines[i]
+        if RULE.match(line) and i + 1 < len(lines) and BANNER_NAME.match(lines[i + 1]):
+            drop_separator(current)
+            name = BANNER_NAME.match(lines[i + 1]).group(1)
+            rva = None
+            j = i + 2
+            while j < len(lines) and not BANNER_END.match(lines[j]):
+                m = BANNER_RVA.match(lines[j])
+                if m:
+                    rva = int(m.group(1), 16)
+                j += 1
+            current = [name, [], lines[i + 1:j]]
+            if rva is not None:
+                sections[rva] = current
+            i = j + 1
+            continue
+        m = SKIPPED_LINE.match(line)
+        if m:
+            # Bannerless placeholder from older decompile_*.py output
+            drop_separator(current)
+            current = None
+            sections[int(m.group(2), 16)] = [m.group(1), ["/* SKIPPED: timed out in previous runs */"], None]
+            i += 1
+            continue
+        if CLASS_RULE.match(line):
+            # Class group header: rule, "/* Class", closing rule
+            drop_separator(current)
+            i += 3
+            continue
+        if current is not None:
+            current[1].append(line)
+        i += 1
+
+    # Drop the blank line the writer puts between each banner and its body
+    for section in sections.values():
+        if section[1] and section[1][0] == "":
+            del section[1][0]
+    return header, dict((rva, (s[0], "\n".join(s[1]), s[2])) for rva, s in sections.items())
+
+def write_output(path, header, sections, image_base):
+    """Rewrite a decompiled_*.c in the same layout the decompile scripts produce.
+
+    Sections keep their parsed banner text, so annotations inside it survive.
+    """
+    results = [header, ""]
+    current_class = ""
+    for rva, (name, body, banner) in sorted(sections.items(), key=lambda x: x[1][0]):
+        class_name = name.split("$$")[0] if "$$" in name else "Unknown"
+        if class_name != current_class:
+            current_class = class_name
+            results.append("")
+            results.append("/" + "=" * 68 + "/")
+            results.append("/* " + class_name)
+            results.append(" " + "=" * 67 + "/")
+        results.append("")
+        results.append("/" + "*" * 68 + "/")
+        results.extend(banner or banner_lines(name, rva, image_base))
+        results.append(" " + "*" * 67 + "/")
+        results.append("")
+        results.append(body)
+    with codecs.open(path, 'w', 'utf-8') as f:
+        f.write("\n".join(results))
+
+def default_header(program, script_path):
+    return "\n".join([
+        "/*",
+        " * FF1 Decompiled Functions - " + os.path.basename(script_path),
+        " * Generated by Ghidra headless analysis (watch mode)",
+        " * Program: " + program.getName(),
+        " * Image Base: 0x{:X}".format(program.getImageBase().getOffset()),
+        " */",
+    ])
+
+def load_method_names():
+    names = {}
+    data = load_script_json(SCRIPT_JSON_PATH)
+    if data is None:
+        return names
+    for method in data.get("ScriptMethod", []):
+        addr = method.get("Address")
+        name = method.get("Name")
+        if addr and name and addr not in names:
+            names[addr] = name
+    return names
+
+def read_header_lines():
+    if not os.path.exists(IL2CPP_HEADER_PATH):
+        return set()
+    with codecs.open(IL2CPP_HEADER_PATH, 'r', 'utf-8', 'replace') as f:
+        return set(f.read().split("\n"))
+
+def parse_il2cpp_header(program):
+    """Re-parse il2cpp_ghidra.h into the program's data type manager."""
+    print("Re-parsing IL2CPP header: " + IL2CPP_HEADER_PATH)
+    try:
+        with open(IL2CPP_HEADER_PATH, 'r') as f:
+            CParser(program.getDataTypeManager()).parse(f.read())
+        return True
+    except Exception as e:
+        print("C Parser error: " + str(e))
+        return False
+
+def apply_symbol(program, rva, name):
+    image_base = program.getImageBase().getOffset()
+    clean_name = name.replace("$$", "__").replace("<", "_").replace(">", "_").replace(",", "_")
+    try:
+        func = getFunctionAt(toAddr(image_base + rva))
+        if func is not None:
+            # A plain label would not replace an existing function name in the output
+            func.setName(clean_name, SourceType.IMPORTED)
+        else:
+            program.getSymbolTable().createLabel(toAddr(image_base + rva), clean_name, SourceType.IMPORTED)
+    except Exception:
+        pass
+
+def ensure_function(program, rva, name):
+    addr = toAddr(program.getImageBase().getOffset() + rva)
+    func = getFunctionAt(addr)
+    if func is None:
+        func = createFunction(addr, name.replace("$$", "_"))
+    return func
+
+def decompile_one(decompiler, program, stats, rva, name):
+    func = ensure_function(program, rva, name)
+    if func is None:
+        return "/* DECOMPILATION FAILED: Could not create function at 0x{:X} */".format(
+            program.getImageBase().getOffset() + rva), None
+    code, error = decompile_adaptive(decompiler, func, rva, name, stats)
+    if code:
+        return None, code
+    return "/* DECOMPILATION FAILED: " + str(error) + " */", None
+
+def regenerate(program, decompiler, stats, state, script_path, dirty_rvas):
+    """Re-decompile dirty_rvas for one manifest and rewrite its output in place."""
+    targets, output_path = state["manifests"][script_path]
+    header, sections = parse_output(output_path)
+    if header is None:
+        header = default_header(program, script_path)
+
+    for rva in list(sections.keys()):
+        if rva not in targets:
+            print("  Dropped: " + sections[rva][0])
+            del sections[rva]
+
+    todo = sorted(rva for rva in set(dirty_rvas) | (set(targets) - set(sections)) if rva in targets)
+    if not todo:
+        write_output(output_path, header, sections, program.getImageBase().getOffset())
+        return 0
+
+    # Create new targets first so they get signatures too
+    functions = {}
+    for rva in todo:
+        func = ensure_function(program, rva, targets[rva])
+        if func is not None:
+            functions[rva] = func
+    apply_signatures(program, functions, SCRIPT_JSON_PATH)
+
+    image_base = program.getImageBase().getOffset()
+    fresh = {}
+    for rva in todo:
+        print("  Decompiling: " + targets[rva])
+        failure, code = decompile_one(decompiler, program, stats, rva, targets[rva])
+        stats.save()
+        fresh[rva] = code
+        old_banner = sections[rva][2] if rva in sections else None
+        sections[rva] = (targets[rva], failure if failure else code, banner_lines(targets[rva], rva, image_base, old_banner))
+
+    resolved = resolve_globals(program, [c for c in fresh.values() if c], SCRIPT_JSON_PATH)
+    for rva, code in fresh.items():
+        if code:
+            comment = globals_comment(code, resolved)
+            sections[rva] = (targets[rva], code + ("\n" + comment if comment else ""), sections[rva][2])
+
+    write_output(output_path, header, sections, program.getImageBase().getOffset())
+    print("  Rewrote " + str(len(todo)) + " section(s) in " + output_path)
+    return len(todo)
+
+def affected_by_identifiers(output_path, identifiers):
+    """RVAs whose current output mentions any of the identifiers."""
+    if not identifiers:
+        return set()
+    _, sections = parse_output(output_path)
+    hits = set()
+    for rva, (name, body, _) in sections.items():
+        if identifiers & set(IDENTIFIER.findall(body)):
+            hits.add(rva)
+    return hits
+
+def run():
+    """Main script entry point."""
+    print("=" * 70)
+    print("FF1 Decompile Watch Mode")
+    print("=" * 70)
+
+    program = getCurrentProgram()
+    if program is None:
+        print("ERROR: No program loaded!")
+        return
+    image_base = program.getImageBase().getOffset()
+
+    decompiler = DecompInterface()
+    decompiler.openProgram(program)
+    stats = DecompileStats(DECOMPILE_STATS_PATH, program.getName())
+
+    state = {
+        "manifests": {},
+        "signatures": {},
+        "header_lines": read_header_lines(),
+        "method_names": load_method_names(),
+    }
+    for path in WATCHED_SCRIPTS + [IL2CPP_HEADER_PATH, SCRIPT_JSON_PATH]:
+        state["signatures"][path] = file_signature(path)
+
+    # Initial pass: fill in anything missing from the existing outputs
+    for script_path in WATCHED_SCRIPTS:
+        state["manifests"][script_path] = read_manifest(script_path)
+        targets = state["manifests"][script_path][0]
+        for rva, name in targets.items():
+            apply_symbol(program, rva, name)
+        print("Watching " + os.path.basename(script_path) + " (" + str(len(targets)) + " targets)")
+        regenerate(program, decompiler, stats, state, script_path, [])
+
+    print("")
+    print("Waiting for changes (cancel the task or create " + STOP_FILE + " to stop)...")
+    while not getMonitor().isCancelled() and not os.path.exists(STOP_FILE):
+        time.sleep(POLL_SECONDS)
+        dirty = dict((path, set()) for path in WATCHED_SCRIPTS)
+        changed = False
+
+        for script_path in WATCHED_SCRIPTS:
+            sig = file_signature(script_path)
+            if sig == state["signatures"][script_path]:
+                continue
+            state["signatures"][script_path] = sig
+            try:
+                new_targets, output_path = read_manifest(script_path)
+            except Exception as e:
+                print("Manifest not parseable yet (" + os.path.basename(script_path) + "): " + str(e))
+                continue
+            old_targets = state["manifests"][script_path][0]
+            state["manifests"][script_path] = (new_targets, output_path)
+            for rva, name in new_targets.items():
+                if old_targets.get(rva) != name:
+                    apply_symbol(program, rva, name)
+                    dirty[script_path].add(rva)
+            print("Manifest changed: " + os.path.basename(script_path))
+            changed = True
+
+        sig = file_signature(IL2CPP_HEADER_PATH)
+        if sig != state["signatures"][IL2CPP_HEADER_PATH]:
+            state["signatures"][IL2CPP_HEADER_PATH] = sig
+            new_lines = read_header_lines()
+            identifiers = set()
+            for line in new_lines ^ state["header_lines"]:
+                identifiers.update(IDENTIFIER.findall(line))
+            state["header_lines"] = new_lines
+            print("Header changed: " + str(len(identifiers)) + " identifiers on changed lines")
+            parse_il2cpp_header(program)
+            # Decompiler caches data types per session - reopen against the new DTM
+            decompiler.dispose()
+            decompiler = DecompInterface()
+            decompiler.openProgram(program)
+            for script_path in WATCHED_SCRIPTS:
+                output_path = state["manifests"][script_path][1]
+                dirty[script_path].update(affected_by_identifiers(output_path, identifiers))
+            changed = True
+
+        sig = file_signature(SCRIPT_JSON_PATH)
+        if sig != state["signatures"][SCRIPT_JSON_PATH]:
+            state["signatures"][SCRIPT_JSON_PATH] = sig
+            new_names = load_method_names()
+            old_names = state["method_names"]
+            renamed = set(rva for rva in set(new_names) | set(old_names) if new_names.get(rva) != old_names.get(rva))
+            state["method_names"] = new_names
+            print("script.json changed: " + str(len(renamed)) + " method names differ")
+            # Relabel before decompiling so regenerated output uses the new names
+            for rva in renamed:
+                if new_names.get(rva):
+                    apply_symbol(program, rva, new_names[rva])
+            identifiers = set("FUN_{:x}".format(image_base + rva) for rva in renamed)
+            for rva in renamed:
+                if old_names.get(rva):
+                    identifiers.update(IDENTIFIER.findall(old_names[rva].replace("$$", "__")))
+            for script_path in WATCHED_SCRIPTS:
+                targets, output_path = state["manifests"][script_path]
+                dirty[script_path].update(rva for rva in renamed if rva in targets)
+                dirty[script_path].update(affected_by_identifiers(output_path, identifiers))
+            changed = True
+
+        if not changed:
+            continue
+        start = time.time()
+        total = 0
+        for script_path in WATCHED_SCRIPTS:
+            total += regenerate(program, decompiler, stats, state, script_path, dirty[script_path])
+        print("Updated {} function(s) in {:.1f}s".format(total, time.time() - start))
+        print("Waiting for changes...")
+
+    if os.path.exists(STOP_FILE):
+        os.remove(STOP_FILE)
+    decompiler.dispose()
+    print("Watch mode stopped")
+
+# Run the script
+run()
@@ -0,0 +1,245 @@
+# Query the caller/callee index produced by build_xref_index.py and the string
+# literal index produced by build_string_index.py
+# Runs under regular Python 3 (not Ghidra)
+#
+# The first query compiles the TSV exports (functions.tsv/edges.tsv and, when
+# present, strings.tsv) into xref.db (SQLite) next to them; later queries
+# reuse it until a TSV file changes. Functions without a script.json name are
+# shown the way Ghidra names them, FUN_<absolute address> in lowercase hex.
+#
+# Usage:
+#   python xref_query.py callers MapRouteSearcher$$Search --depth 3
+#   python xref_query.py callees 0x272010
+#   python xref_query.py annotate decompiled_mapexits.c --depth 2
+#   python xref_query.py uses-string "MSG_"
+#   python xref_query.py uses-string "MENU_TITLE_PRESS_TEXT" --exact
+#   python xref_query.py strings-of MapModel$$GetMapName
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+
+XREF_INDEX_DIR = "D:\\Games\\Dev\\Unity\\FFPR\\ff1\\xref_index"
+
+MAX_LISTED_CALLERS = 25     # Per function when annotating decompiled output
+
+def open_index(index_dir):
+    """Open xref.db, rebuilding it from the TSV exports when they are newer."""
+    functions_path = os.path.join(index_dir, "functions.tsv")
+    edges_path = os.path.join(index_dir, "edges.tsv")
+    strings_path = os.path.join(index_dir, "strings.tsv")
+    db_path = os.path.join(index_dir, "xref.db")
+
+    sources = [p for p in (functions_path, edges_path, strings_path) if os.path.exists(p)]
+    if not sources:
+        sys.exit("No xref index in " + index_dir + " - run build_xref_index.py / build_string_index.py in Ghidra first")
+
+    source_mtime = max(os.path.getmtime(p) for p in sources)
+    if os.path.exists(db_path) and os.path.getmtime(db_path) >= source_mtime:
+        return sqlite3.connect(db_path)
+
+    print("Compiling xref index...", file=sys.stderr)
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    db = sqlite3.connect(db_path)
+    db.executescript("""
+        CREATE TABLE functions (rva INTEGER PRIMARY KEY, name TEXT NOT NULL);
+        CREATE TABLE edges (caller INTEGER NOT NULL, callee INTEGER NOT NULL, site INTEGER NOT NULL);
+        CREATE TABLE strings (slot INTEGER NOT NULL, function INTEGER NOT NULL, site INTEGER NOT NULL, value TEXT);
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+    """)
+    for path in sources:
+        image_base = read_image_base(path)
+        if image_base is not None:
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('image_base', ?)", (str(image_base),))
+    if os.path.exists(functions_path):
+        db.executemany("INSERT OR IGNORE INTO functions VALUES (?, ?)", read_tsv(functions_path, (16, None)))
+    if os.path.exists(edges_path):
+        db.executemany("INSERT INTO edges VALUES (?, ?, ?)", read_tsv(edges_path, (16, 16, 16)))
+    if os.path.exists(strings_path):
+        rows = list(read_tsv(strings_path, (16, 16, None, 16, None)))
+        db.executemany("INSERT OR IGNORE INTO functions VALUES (?, ?)", ((r[1], r[2]) for r in rows if r[1]))
+        db.executemany("INSERT INTO strings VALUES (?, ?, ?, ?)", ((r[0], r[1], r[3], unescape(r[4])) for r in rows))
+    db.executescript("""
+        CREATE INDEX functions_name ON functions (name);
+        CREATE INDEX edges_callee ON edges (callee, caller);
+        CREATE INDEX edges_caller ON edges (caller, callee);
+        CREATE INDEX strings_function ON strings (function);
+        CREATE INDEX strings_value ON strings (value);
+    """)
+    db.commit()
+    return db
+
+def unescape(text):
+    """Reverse the backslash escaping build_string_index.py applies to literals."""
+    out = []
+    i = 0
+    while i < len(text):
+        if text[i] == "\\" and i + 1 < len(text):
+            out.append({"t": "\t", "r": "\r", "n": "\n"}.get(text[i + 1], text[i + 1]))
+            i += 2
+        else:
+            out.append(text[i])
+            i += 1
+    return "".join(out)
+
+def read_image_base(path):
+    """Image base from a "# image_base" header line, or None (older exports)."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.startswith("#"):
+                return None
+            parts = line[1:].strip().split("\t")
+            if len(parts) == 2 and parts[0] == "image_base":
+                return int(parts[1], 16)
+    return None
+
+def read_tsv(path, columns):
+    """Yield rows, converting columns whose spec is a base (16) to ints."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            parts = line.rstrip("\n").split("\t")
+            yield tuple(int(p, base) if base else p for p, base in zip(parts, columns))
+
+def resolve(db, target):
+    """Resolve an RVA ("0x2CB600") or script.json name ("MapManager$$SearchEntity") to RVAs."""
+    if re.match(r"^0x[0-9A-Fa-f]+$", target):
+        return [int(target, 16)]
+    name = target if "$$" in target else target.replace(".", "$$", 1)
+    rows = db.execute("SELECT rva FROM functions WHERE name = ?", (name,)).fetchall()
+    if not rows:
+        rows = db.execute("SELECT rva FROM functions WHERE name LIKE ? LIMIT 50", ("%" + name + "%",)).fetchall()
+    return [r[0] for r in rows]
+
+def walk(db, rvas, depth, direction):
+    """Return [(depth, rva, name)] reachable within depth hops, nearest first."""
+    near, far = ("callee", "caller") if direction == "callers" else ("caller", "callee")
+    placeholders = ",".join("?" * len(rvas))
+    query = """
+        WITH RECURSIVE reach(rva, depth) AS (
+            SELECT e.{far}, 1 FROM edges e WHERE e.{near} IN ({placeholders})
+            UNION
+            SELECT e.{far}, r.depth + 1 FROM edges e JOIN reach r ON e.{near} = r.rva
+            WHERE r.depth < ?
+        )
+        SELECT MIN(r.depth) AS d, r.rva, COALESCE(f.name, '')
+        FROM reach r LEFT JOIN functions f ON f.rva = r.rva
+        GROUP BY r.rva ORDER BY d, f.name
+    """.format(near=near, far=far, placeholders=placeholders)
+    return db.execute(query, list(rvas) + [depth]).fetchall()
+
+def name_of(db, rva):
+    """Indexed name, else Ghidra's default FUN_<absolute address> name."""
+    row = db.execute("SELECT name FROM functions WHERE rva = ?", (rva,)).fetchone()
+    if row:
+        return row[0]
+    base = db.execute("SELECT value FROM meta WHERE key = 'image_base'").fetchone()
+    if base is None:
+        return "(unnamed, RVA 0x{:X})".format(rva)
+    return "FUN_{:x}".format(int(base[0]) + rva)
+
+def cmd_walk(db, args):
+    rvas = resolve(db, args.target)
+    if not rvas:
+        sys.exit("No function matches: " + args.target)
+    for rva in rvas:
+        print("{} (RVA 0x{:X}) - {} up to depth {}".format(name_of(db, rva), rva, args.command, args.depth))
+        rows = walk(db, [rva], args.depth, args.command)
+        for depth, other, name in rows:
+            print("  {}[{}] 0x{:X} {}".format("  " * (depth - 1), depth, other, name))
+        if not rows:
+            print("  (none)")
+
+BANNER_RVA = re.compile(r"^ \* RVA: 0x([0-9A-Fa-f]+)\s*$")
+CALLER_LINE = re.compile(r"^ \* (Callers|  \[\d+\]) ")
+
+def cmd_annotate(db, args):
+    """Insert caller lists under each "RVA:" line of a decompiled .c file (idempotent)."""
+    with open(args.file, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+
+    out = []
+    annotated = 0
+    for line in lines:
+        if CALLER_LINE.match(line):
+            continue  # Drop annotations from a previous run
+        out.append(line)
+        m = BANNER_RVA.match(line)
+        if not m:
+            continue
+        rows = walk(db, [int(m.group(1), 16)], args.depth, "callers")
+        out.append(" * Callers (depth {}): {}".format(args.depth, len(rows)))
+        for depth, rva, name in rows[:MAX_LISTED_CALLERS]:
+            out.append(" *   [{}] 0x{:X} {}".format(depth, rva, name))
+        if len(rows) > MAX_LISTED_CALLERS:
+            out.append(" *   [{}] ... {} more".format(args.depth, len(rows) - MAX_LISTED_CALLERS))
+        annotated += 1
+
+    with open(args.file, "w", encoding="utf-8") as f:
+        f.write("\n".join(out))
+    print("Annotated {} functions in {}".format(annotated, args.file))
+
+def cmd_uses_string(db, args):
+    """Functions referencing string literals that contain (or equal) the text."""
+    if args.exact:
+        where, param = "s.value = ?", args.text
+    else:
+        where, param = "s.value LIKE ? ESCAPE '\\'", "%" + args.text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    rows = db.execute("""
+        SELECT s.value, s.function, COALESCE(f.name, ''), COUNT(*)
+        FROM strings s LEFT JOIN functions f ON f.rva = s.function
+        WHERE {} GROUP BY s.value, s.function ORDER BY s.value, f.name
+    """.format(where), (param,)).fetchall()
+    current = None
+    for value, function, name, sites in rows:
+        if value != current:
+            current = value
+            print(repr(value))
+        print("  0x{:X} {}{}".format(function, name, " ({} sites)".format(sites) if sites > 1 else ""))
+    if not rows:
+        print("No function references a string matching: " + args.text)
+
+def cmd_strings_of(db, args):
+    rvas = resolve(db, args.target)
+    if not rvas:
+        sys.exit("No function matches: " + args.target)
+    for rva in rvas:
+        rows = db.execute("SELECT DISTINCT value FROM strings WHERE function = ? ORDER BY value", (rva,)).fetchall()
+        print("{} (RVA 0x{:X}) - {} string literal(s)".format(name_of(db, rva), rva, len(rows)))
+        for (value,) in rows:
+            print("  " + repr(value))
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the FF1 caller/callee index")
+    parser.add_argument("--index", default=XREF_INDEX_DIR, help="Directory written by build_xref_index.py")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for command in ("callers", "callees"):
+        p = sub.add_parser(command)
+        p.add_argument("target", help="RVA (0x...) or script.json name")
+        p.add_argument("--depth", type=int, default=1)
+    p = sub.add_parser("annotate", help="Add caller lists to a decompiled_*.c file in place")
+    p.add_argument("file")
+    p.add_argument("--depth", type=int, default=1)
+    p = sub.add_parser("uses-string", help="Functions referencing a string literal")
+    p.add_argument("text")
+    p.add_argument("--exact", action="store_true", help="Match the whole literal instead of a substring")
+    p = sub.add_parser("strings-of", help="String literals referenced by a function")
+    p.add_argument("target", help="RVA (0x...) or script.json name")
+    args = parser.parse_args()
+
+    db = open_index(args.index)
+    if args.command == "annotate":
+        cmd_annotate(db, args)
+    elif args.command == "uses-string":
+        cmd_uses_string(db, args)
+    elif args.command == "strings-of":
+        cmd_strings_of(db, args)
+    else:
+        cmd_walk(db, args)
+
+if __name__ == "__main__":
+    main()
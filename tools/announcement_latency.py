@@ -0,0 +1,230 @@
+# Announcement latency profiler over MelonLoader logs
+# Runs under regular Python 3
+#
+# Reads the "[Timing]" records the mod writes when the AnnouncementTiming
+# preference is on (MelonPreferences.cfg, [FFI_ScreenReader] section):
+#   [Timing] evt id=<n> t=<us> src=<PatchClass>.<Method>       hook entered
+#   [TTS] <text>                                               (always logged)
+#   [Timing] speak evt=<n> t=<us> out=<us> len=<chars> src=<CallerFile>.<Method>
+#   [Timing] dedup evt=<n> t=<us> src=<PatchClass>.<Method>   repeat dropped
+# Timestamps are Stopwatch microseconds, so only differences within one game
+# session mean anything.
+#
+# A speak record is paired with the event it names: the first speech after an
+# event gives that hook's latency (event -> start of the Tolk call), later
+# speeches for the same event count as follow-ups. Events that end without any
+# speech are "silent". Speech more than --window ms after the last event came
+# from an uninstrumented path (field keys, timers) and is left unpaired.
+#
+# Per hook class (unpaired speech counts under its caller's class) it reports
+# latency percentiles, time spent inside Tolk, dedup hit rate (dedup records
+# over dedup + speech), repeats that still reached Tolk (same text within
+# --repeat-window ms) and the slowest events. Logs are streamed line by line, so any size works.
+#
+# Usage:
+#   python announcement_latency.py "<game>/MelonLoader/Latest.log"
+#   python announcement_latency.py Logs/*.log --worst 5 --csv latency.csv
+#   type Latest.log | python announcement_latency.py -
+
+import argparse
+import csv
+import glob
+import heapq
+import math
+import re
+import sys
+from array import array
+from collections import defaultdict
+
+RECORD = re.compile(r"\[Timing\] (evt|speak|dedup) (.*)$")
+TTS = re.compile(r"\[TTS\] (.*)$")
+FIELD = re.compile(r"(\w+)=(\S+)")
+
+class ClassStats(object):
+    """Counters and samples for one hook class."""
+
+    def __init__(self):
+        self.events = 0
+        self.silent = 0
+        self.follow_ups = 0
+        self.latency = array("q")     # us, first speech per event
+        self.tolk = array("q")        # us spent in the Tolk call
+        self.dedup = 0
+        self.speeches = 0
+        self.repeats = 0
+        self.worst = []               # min-heap of (latency, member, text)
+
+    def add_worst(self, latency, member, text, keep):
+        item = (latency, member, text)
+        if keep <= 0:
+            return
+        if len(self.worst) < keep:
+            heapq.heappush(self.worst, item)
+        elif latency > self.worst[0][0]:
+            heapq.heapreplace(self.worst, item)
+
+class Profile(object):
+    """Streaming pairer: feed it lines, read per-class stats afterwards."""
+
+    def __init__(self, window_ms, repeat_window_ms, keep, csv_writer=None):
+        self.window = window_ms * 1000
+        self.repeat_window = repeat_window_ms * 1000
+        self.keep = keep
+        self.csv = csv_writer
+        self.classes = defaultdict(ClassStats)
+        self.unpaired = 0
+        self.sessions = 0
+        self.reset()
+
+    def reset(self):
+        """Forget the current event; called per file and when the mod restarts."""
+        self.event = None             # [id, t, class, member, speeches]
+        self.last_tts = ""
+        self.last_speech = None       # (t, text)
+
+    def close_event(self):
+        if self.event is not None and self.event[4] == 0:
+            self.classes[self.event[2]].silent += 1
+        self.event = None
+
+    def feed(self, line):
+        match = RECORD.search(line)
+        if match is None:
+            tts = TTS.search(line)
+            if tts is not None:
+                self.last_tts = tts.group(1)
+            return
+        kind = match.group(1)
+        fields = dict(FIELD.findall(match.group(2)))
+        try:
+            t = int(fields["t"])
+        except (KeyError, ValueError):
+            return
+        if kind == "evt":
+            self.on_event(int(fields.get("id", 0)), t, fields.get("src", "?"))
+        elif kind == "speak":
+            self.on_speak(int(fields.get("evt", 0)), t, int(fields.get("out", 0)), fields.get("src", "?"))
+        else:
+            self.classes[fields.get("src", "?").split(".", 1)[0]].dedup += 1
+
+    def on_event(self, event_id, t, src):
+        if self.event is None or event_id <= self.event[0]:
+            self.sessions += 1
+        self.close_event()
+        cls, _, member = src.partition(".")
+        self.classes[cls].events += 1
+        self.event = [event_id, t, cls, member, 0]
+
+    def on_speak(self, event_id, t, out, caller):
+        text = self.last_tts
+        self.last_tts = ""
+        event = self.event
+        if event is None or event_id != event[0] or t - event[1] > self.window:
+            self.unpaired += 1
+            owner = self.classes[caller.split(".", 1)[0]]
+        else:
+            owner = self.classes[event[2]]
+            event[4] += 1
+            if event[4] == 1:
+                latency = t - event[1]
+                owner.latency.append(latency)
+                owner.add_worst(latency, event[3], text, self.keep)
+                if self.csv is not None:
+                    self.csv.writerow([event[2], event[3], caller, event_id, latency, out, text])
+            else:
+                owner.follow_ups += 1
+        owner.speeches += 1
+        owner.tolk.append(out)
+
+        if self.last_speech is not None and text and text == self.last_speech[1] \
+                and t - self.last_speech[0] <= self.repeat_window:
+            owner.repeats += 1
+        self.last_speech = (t, text)
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0
+    rank = int(math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+def ms(us):
+    return "{:.1f}".format(us / 1000.0)
+
+def open_inputs(patterns):
+    for pattern in patterns:
+        if pattern == "-":
+            yield "<stdin>", sys.stdin
+            continue
+        paths = sorted(glob.glob(pattern)) or [pattern]
+        for path in paths:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                yield path, f
+
+def report(profile, worst):
+    rows = []
+    for cls, stats in profile.classes.items():
+        if not (stats.events or stats.dedup or stats.speeches):
+            continue
+        latency = sorted(stats.latency)
+        tolk = sorted(stats.tolk)
+        checks = stats.dedup + stats.speeches
+        rows.append((percentile(latency, 99), cls, stats, latency, tolk, checks))
+    if not rows:
+        print("No [Timing] records found. Enable AnnouncementTiming in MelonPreferences.cfg and replay.")
+        return
+    rows.sort(key=lambda r: (-r[0], r[1]))
+
+    print("{:<28} {:>7} {:>6} {:>6} {:>7} {:>7} {:>7} {:>7} {:>7} {:>6} {:>7} {:>6}".format(
+        "Hook class", "events", "silent", "extra", "p50 ms", "p90 ms", "p99 ms", "max ms",
+        "tolk99", "dedup", "hit %", "repeat"))
+    for _, cls, stats, latency, tolk, checks in rows:
+        print("{:<28} {:>7} {:>6} {:>6} {:>7} {:>7} {:>7} {:>7} {:>7} {:>6} {:>7} {:>6}".format(
+            cls[:28], stats.events, stats.silent, stats.follow_ups,
+            ms(percentile(latency, 50)), ms(percentile(latency, 90)), ms(percentile(latency, 99)),
+            ms(latency[-1] if latency else 0), ms(percentile(tolk, 99)), stats.dedup,
+            "{:.1f}".format(100.0 * stats.dedup / checks) if checks else "-", stats.repeats))
+    print()
+    print("{} session(s), {} speech record(s) not tied to an instrumented hook".format(
+        profile.sessions, profile.unpaired))
+
+    if worst <= 0:
+        return
+    print()
+    print("Slowest events per hook class:")
+    for _, cls, stats, _, _, _ in rows:
+        if not stats.worst:
+            continue
+        print("  " + cls)
+        for latency, member, text in sorted(stats.worst, reverse=True):
+            print("    {:>8} ms  {:<32} {}".format(ms(latency), member[:32], text[:60]))
+
+def main():
+    parser = argparse.ArgumentParser(description="Hook-to-speech latency report from MelonLoader logs")
+    parser.add_argument("logs", nargs="+", help="Log files or globs ('-' for stdin)")
+    parser.add_argument("--window", type=float, default=2000, help="Max ms from event to paired speech (default 2000)")
+    parser.add_argument("--repeat-window", type=float, default=1000,
+                        help="Same text within this many ms counts as a repeat (default 1000)")
+    parser.add_argument("--worst", type=int, default=3, help="Slowest events listed per class (default 3)")
+    parser.add_argument("--csv", help="Also write every paired event to this CSV file")
+    args = parser.parse_args()
+
+    csv_file = open(args.csv, "w", newline="", encoding="utf-8") if args.csv else None
+    writer = None
+    if csv_file is not None:
+        writer = csv.writer(csv_file)
+        writer.writerow(["class", "member", "caller", "event", "latency_us", "tolk_us", "text"])
+
+    profile = Profile(args.window, args.repeat_window, max(args.worst, 0), writer)
+    for _, stream in open_inputs(args.logs):
+        profile.reset()
+        for line in stream:
+            profile.feed(line.rstrip("\r\n"))
+        profile.close_event()
+    if csv_file is not None:
+        csv_file.close()
+
+    report(profile, args.worst)
+
+if __name__ == "__main__":
+    main()
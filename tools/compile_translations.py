@@ -0,0 +1,276 @@
+# Build step: compile a nested translation JSON into a compact binary bundle
+# Runs under regular Python 3; invoked by FFI_ScreenReader.csproj before build
+#
+# Input is the { key: { lang: value } } format used by mod_text.json and
+# translation.json. The bundle is read at runtime by Utils/TranslationBundle.cs,
+# so the mod no longer parses JSON or builds nested dictionaries at startup.
+#
+# Validation (any error fails the build):
+#   - Malformed JSON, duplicate keys, non-string values
+#   - Unknown language codes
+#   - Format placeholders ({0}, {1}, ...) that differ from the English value
+# Entries whose values are all empty are dropped (both translators already
+# treated them as missing) and identical strings are stored once.
+#
+# Layout (little-endian):
+#   Header      magic "FFTB", u16 version, u16 language count, u32 key count,
+#               u32 key table offset, u32 pool offset, u32 pool size
+#   Languages   per language: u32 code (pool offset), u32 index offset,
+#               u32 entry count
+#   Key table   u32 pool offset per distinct key (shared by all languages)
+#   Index       per language: u32 bucket count R, i32 displacement[R],
+#               then entries packed as u16 key id, u32 value pool offset
+#   Pool        u16 byte length + UTF-8 bytes per string, deduplicated
+#
+# Lookup is a minimal perfect hash (hash-and-displace): bucket =
+# fnv1a(key, 0) % R; d = displacement[bucket]; slot = -d - 1 if d < 0 else
+# fnv1a(key, d) % count; then the slot's key is compared to reject misses.
+#
+# With --split the output is a directory and one single-language bundle is
+# written per language (<name>-<lang>.bin), so the mod only has to load the
+# slice for the language the game is running in. The language is not a dotted
+# suffix on purpose: MSBuild would read "name.en.bin" as an "en" culture
+# resource and move it into a satellite assembly.
+#
+# Usage:
+#   python compile_translations.py mod_text.json obj/translations/mod_text.bin
+#   python compile_translations.py mod_text.json obj/translations --split
+#   python compile_translations.py translation.json --check
+
+import argparse
+import json
+import os
+import re
+import struct
+import sys
+
+MAGIC = b"FFTB"
+VERSION = 1
+LANGUAGES = ["ja", "en", "fr", "it", "de", "es", "ko", "zht", "zhc", "ru", "th", "pt"]
+PLACEHOLDER = re.compile(r"\{(\d+)(?:[,:][^}]*)?\}")
+KEYS_PER_BUCKET = 4
+MAX_DISPLACEMENT = 1 << 20
+
+class BundleError(Exception):
+    pass
+
+def fnv1a(data, seed):
+    """32-bit FNV-1a with the seed folded into the offset basis (matches TranslationBundle.Hash)."""
+    h = (0x811C9DC5 ^ seed) & 0xFFFFFFFF
+    for b in data:
+        h ^= b
+        h = (h * 0x01000193) & 0xFFFFFFFF
+    return h
+
+def reject_duplicates(pairs):
+    result = {}
+    for key, value in pairs:
+        if key in result:
+            raise BundleError("duplicate key: " + repr(key))
+        result[key] = value
+    return result
+
+def load_translations(path):
+    """Parse and validate; returns ({key: {lang: value}}, [warnings])."""
+    with open(path, encoding="utf-8-sig") as f:
+        try:
+            data = json.load(f, object_pairs_hook=reject_duplicates)
+        except json.JSONDecodeError as e:
+            raise BundleError("{}: invalid JSON: {}".format(path, e))
+
+    if not isinstance(data, dict):
+        raise BundleError(path + ": top level must be an object")
+
+    errors = []
+    warnings = []
+    entries = {}
+    for key, langs in data.items():
+        if not isinstance(langs, dict):
+            errors.append("{!r}: value must be an object of language -> string".format(key))
+            continue
+        if key != key.strip():
+            warnings.append("{!r}: key has leading/trailing whitespace".format(key))
+        english = langs.get("en", "")
+        expected = sorted(set(PLACEHOLDER.findall(english))) if isinstance(english, str) else []
+        kept = {}
+        for lang, value in langs.items():
+            if lang not in LANGUAGES:
+                errors.append("{!r}: unknown language code {!r}".format(key, lang))
+                continue
+            if not isinstance(value, str):
+                errors.append("{!r}/{}: value must be a string".format(key, lang))
+                continue
+            if not value:
+                continue
+            found = sorted(set(PLACEHOLDER.findall(value)))
+            if english and found != expected:
+                errors.append("{!r}/{}: placeholders {} do not match English {}".format(key, lang, found, expected))
+            kept[lang] = value
+        if kept:
+            entries[key] = kept
+        else:
+            warnings.append("{!r}: no non-empty values, dropped".format(key))
+
+    if errors:
+        raise BundleError(path + ":\n  " + "\n  ".join(errors))
+    return entries, warnings
+
+class StringPool(object):
+    """Length-prefixed UTF-8 string pool that stores each distinct string once."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = {}
+
+    def add(self, text):
+        if text not in self.offsets:
+            encoded = text.encode("utf-8")
+            if len(encoded) > 0xFFFF:
+                raise BundleError("string longer than 65535 bytes: " + repr(text[:40]))
+            self.offsets[text] = len(self.data)
+            self.data.extend(struct.pack("<H", len(encoded)))
+            self.data.extend(encoded)
+        return self.offsets[text]
+
+def build_perfect_hash(keys):
+    """Return (displacements, slots) where slots[i] is the key placed at slot i."""
+    n = len(keys)
+    if n == 0:
+        return [0], []
+    bucket_count = max(1, (n + KEYS_PER_BUCKET - 1) // KEYS_PER_BUCKET)
+    encoded = dict((k, k.encode("utf-8")) for k in keys)
+    buckets = [[] for _ in range(bucket_count)]
+    for key in keys:
+        buckets[fnv1a(encoded[key], 0) % bucket_count].append(key)
+
+    displacements = [0] * bucket_count
+    slots = [None] * n
+    order = sorted(range(bucket_count), key=lambda b: -len(buckets[b]))
+    for b in order:
+        bucket = buckets[b]
+        if len(bucket) > 1:
+            for d in range(1, MAX_DISPLACEMENT):
+                wanted = [fnv1a(encoded[k], d) % n for k in bucket]
+                if len(set(wanted)) == len(wanted) and all(slots[s] is None for s in wanted):
+                    for key, slot in zip(bucket, wanted):
+                        slots[slot] = key
+                    displacements[b] = d
+                    break
+            else:
+                raise BundleError("could not place hash bucket of {} keys".format(len(bucket)))
+        elif len(bucket) == 1:
+            # Single keys go straight into any free slot
+            free = slots.index(None)
+            slots[free] = bucket[0]
+            displacements[b] = -free - 1
+    return displacements, slots
+
+def languages_of(entries):
+    return [lang for lang in LANGUAGES if any(lang in langs for langs in entries.values())]
+
+def slice_entries(entries, lang):
+    """Entries restricted to one language (keys without a value in it are omitted)."""
+    return dict((key, {lang: langs[lang]}) for key, langs in entries.items() if lang in langs)
+
+def compile_bundle(entries):
+    """Serialise validated entries into the bundle byte layout."""
+    pool = StringPool()
+    languages = languages_of(entries)
+    all_keys = sorted(entries)
+    if len(all_keys) > 0xFFFF:
+        raise BundleError("too many keys for u16 key ids: {}".format(len(all_keys)))
+    key_ids = dict((key, i) for i, key in enumerate(all_keys))
+    key_table = bytearray()
+    for key in all_keys:
+        key_table.extend(struct.pack("<I", pool.add(key)))
+
+    indexes = []
+    for lang in languages:
+        keys = [k for k in all_keys if lang in entries[k]]
+        displacements, slots = build_perfect_hash(keys)
+        body = bytearray(struct.pack("<I", len(displacements)))
+        body.extend(struct.pack("<{}i".format(len(displacements)), *displacements))
+        for key in slots:
+            body.extend(struct.pack("<HI", key_ids[key], pool.add(entries[key][lang])))
+        indexes.append((pool.add(lang), len(slots), body))
+
+    header_size = 24
+    key_table_offset = header_size + 12 * len(languages)
+    offset = key_table_offset + len(key_table)
+    table = bytearray()
+    bodies = bytearray()
+    for code_off, count, body in indexes:
+        table.extend(struct.pack("<III", code_off, offset + len(bodies), count))
+        bodies.extend(body)
+    pool_offset = offset + len(bodies)
+
+    header = MAGIC + struct.pack("<HHIIII", VERSION, len(languages), len(all_keys),
+                                 key_table_offset, pool_offset, len(pool.data))
+    return bytes(header + table + key_table + bodies + pool.data), pool
+
+def write_file(path, data):
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, "wb") as f:
+        f.write(data)
+
+def write_slices(input_path, entries, directory):
+    """Write <name>-<lang>.bin per language, removing slices for languages that no longer exist,
+    any single-file <name>.bin bundle and slices in the older <name>.<lang>.bin naming."""
+    name = os.path.splitext(os.path.basename(input_path))[0]
+    if os.path.isdir(directory):
+        for existing in os.listdir(directory):
+            stem = existing[:-len(".bin")]
+            if existing.endswith(".bin") and (stem == name or stem.startswith(name + "-")
+                                              or (stem.startswith(name + ".") and stem.count(".") == 1)):
+                os.remove(os.path.join(directory, existing))
+    written = []
+    for lang in languages_of(entries):
+        bundle, pool = compile_bundle(slice_entries(entries, lang))
+        path = os.path.join(directory, "{}-{}.bin".format(name, lang))
+        write_file(path, bundle)
+        written.append((lang, len(bundle)))
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a translation JSON into a binary bundle")
+    parser.add_argument("input")
+    parser.add_argument("output", nargs="?", help="Bundle path, or directory with --split")
+    parser.add_argument("--split", action="store_true", help="Write one bundle per language into OUTPUT")
+    parser.add_argument("--check", action="store_true", help="Validate only, don't write a bundle")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        entries, warnings = load_translations(args.input)
+        if args.split and args.output and not args.check:
+            slices = write_slices(args.input, entries, args.output)
+        else:
+            bundle, pool = compile_bundle(entries)
+    except BundleError as e:
+        print("error: " + str(e), file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        for warning in warnings:
+            print("warning: " + warning, file=sys.stderr)
+    if args.check or not args.output:
+        print("{}: {} keys OK".format(args.input, len(entries)))
+        return 0
+
+    if args.split:
+        if not args.quiet:
+            print("{} -> {}: {} keys, {} language slices ({})".format(
+                args.input, args.output, len(entries), len(slices),
+                ", ".join("{} {}B".format(lang, size) for lang, size in slices)))
+        return 0
+
+    write_file(args.output, bundle)
+    if not args.quiet:
+        print("{} -> {}: {} keys, {} unique strings, {} bytes (JSON {} bytes)".format(
+            args.input, args.output, len(entries), len(pool.offsets), len(bundle), os.path.getsize(args.input)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+# Translation key analyser: dead, missing and duplicated keys across the
+# embedded resources and the C# source
+# Runs under regular Python 3
+#
+# One pass over the C# tree collects:
+#   - ModTextTranslator keys: T("...") / ModTextTranslator.T("...") literals
+#   - Dynamic T(expr) call sites (their keys come from other literals, e.g.
+#     ConditionTypeFallbacks values), so every other string literal is also
+#     recorded as a possible indirect key
+#   - EntityTranslator.Translate("...") literals (most entity lookups use names
+#     read from the game at runtime, so entity coverage is checked against
+#     EntityNames.json, the per-map dump of names seen in the field)
+# and cross-checks them against:
+#   mod_text.json          { English key: { lang: value } }   (embedded)
+#   translation.json       { Japanese name: { lang: value } } (embedded)
+#   FF1_translations.json  { Japanese name: English }         (legacy, not embedded)
+#   EntityNames.json       { map: { Japanese name: "" } }     (field dump, not embedded)
+#
+# Reports unused, missing and duplicated keys; --emit DIR writes a pruned
+# mod_text.json / translation.json pair that the build can embed instead:
+#   dotnet build -p:TranslationSourceDir=obj\pruned\
+#
+# Usage:
+#   python translation_keys.py
+#   python translation_keys.py --root .. --emit ../obj/pruned
+#   python translation_keys.py --strict          (exit 1 on missing keys)
+
+import argparse
+import json
+import os
+import re
+import sys
+
+LANGUAGES = ["ja", "en", "fr", "it", "de", "es", "ko", "zht", "zhc", "ru", "th", "pt"]
+SKIP_DIRS = set(["bin", "obj", ".git", ".vs", "docs", "tools"])
+
+# C# string literals: regular "..." (with escapes) or verbatim @"..." ("" escapes);
+# a $ prefix marks an interpolated string
+STRING_LITERAL = r'(\$?@?|@\$)"((?:[^"\\\n]|\\.|"")*)"'
+T_CALL = re.compile(r'(?<![\w.])(?:ModTextTranslator\.)?T\(\s*')
+TRANSLATE_CALL = re.compile(r'EntityTranslator\.Translate\(\s*')
+LITERAL = re.compile(STRING_LITERAL)
+COMMENT_OR_LITERAL = re.compile(r"//[^\n]*|/\*.*?\*/|" + STRING_LITERAL + r"|'(?:[^'\\\n]|\\.)*'", re.DOTALL)
+ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "0": "\0", "\\": "\\", "\"": "\"", "'": "'"}
+
+# Mirrors EntityTranslator.Translate's lookup tiers
+TRAILING_ENUM = re.compile(u"[①-⑳]+$")
+TRAILING_DIGITS = re.compile(r"(?<=.)\d+$")
+LEADING_ENUM = re.compile(u"^[①-⑳]+")
+LEADING_DIGITS = re.compile(r"^\d+(?![\d.:])(?=.)")
+ENTITY_PREFIX = re.compile(r"^((?:SC)?\d+[.:])", re.IGNORECASE)
+PAREN_SUFFIX = re.compile(u"[(（][^)）]*[)）]$")
+
+def unescape_csharp(prefix, body):
+    if "@" in prefix:
+        return body.replace('""', '"')
+    def replace(match):
+        code = match.group(1)
+        if code.startswith("u"):
+            return chr(int(code[1:], 16))
+        return ESCAPES.get(code, code)
+    return re.sub(r"\\(u[0-9a-fA-F]{4}|.)", replace, body)
+
+def strip_comments(source):
+    """Blank out comments (keeping line numbers) without touching string literals."""
+    def replace(match):
+        text = match.group(0)
+        if text.startswith("/"):
+            return re.sub(r"[^\n]", " ", text)
+        return text
+    return COMMENT_OR_LITERAL.sub(replace, source)
+
+def line_of(source, index):
+    return source.count("\n", 0, index) + 1
+
+class SourceScan(object):
+    """Translation key references collected from the C# tree."""
+
+    def __init__(self):
+        self.t_keys = {}            # key -> [(file, line)]
+        self.translate_keys = {}    # Japanese name -> [(file, line)]
+        self.dynamic_calls = []     # (file, line, expression)
+        self.literals = set()       # every other non-interpolated string literal
+        self.files = 0
+
+    def add(self, target, key, where):
+        target.setdefault(key, []).append(where)
+
+    def scan_file(self, path, rel):
+        with open(path, encoding="utf-8-sig") as f:
+            source = strip_comments(f.read())
+        self.files += 1
+        claimed = set()
+        for call, target in ((T_CALL, self.t_keys), (TRANSLATE_CALL, self.translate_keys)):
+            for match in call.finditer(source):
+                literal = LITERAL.match(source, match.end())
+                where = (rel, line_of(source, match.start()))
+                if literal and "$" not in literal.group(1) and source[literal.end():].lstrip().startswith(")"):
+                    self.add(target, unescape_csharp(literal.group(1), literal.group(2)), where)
+                    claimed.add(literal.start())
+                elif target is self.t_keys and not source[match.end():].startswith("string "):
+                    end = source.find(")", match.end())
+                    self.dynamic_calls.append(where + (source[match.end():end].strip()[:60],))
+        for literal in LITERAL.finditer(source):
+            if literal.start() not in claimed and "$" not in literal.group(1):
+                self.literals.add(unescape_csharp(literal.group(1), literal.group(2)))
+
+    def scan_tree(self, root):
+        for directory, dirs, files in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+            for name in sorted(files):
+                if name.endswith(".cs"):
+                    path = os.path.join(directory, name)
+                    self.scan_file(path, os.path.relpath(path, root))
+        return self
+
+class JsonResource(object):
+    """A loaded JSON file plus the problems found while parsing it."""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.data = None
+        self.duplicates = []
+        self.problems = []
+        if not os.path.exists(path):
+            self.problems.append("not found")
+            return
+        with open(path, encoding="utf-8-sig") as f:
+            text = f.read()
+        try:
+            self.data = json.loads(text, object_pairs_hook=self.pairs)
+        except ValueError:
+            # Hand-edited dumps sometimes contain raw newlines inside strings
+            self.duplicates = []
+            self.data = json.loads(text, object_pairs_hook=self.pairs, strict=False)
+            self.problems.append("contains raw control characters inside strings (invalid JSON)")
+
+    def pairs(self, pairs):
+        result = {}
+        for key, value in pairs:
+            if key in result:
+                self.duplicates.append(key)
+            result[key] = value
+        return result
+
+def entity_candidates(name):
+    """Keys EntityTranslator.Translate would try for a field name, in tier order."""
+    core = TRAILING_ENUM.sub("", name)
+    if core == name:
+        core = TRAILING_DIGITS.sub("", name)
+    yield core
+    core = LEADING_ENUM.sub("", core)
+    core = LEADING_DIGITS.sub("", core)
+    yield core
+    yield core.replace(u"（", "(").replace(u"）", ")")
+    match = ENTITY_PREFIX.match(core)
+    base = core[len(match.group(1)):] if match else core
+    yield base
+    stripped = PAREN_SUFFIX.sub("", base).strip()
+    if stripped:
+        yield stripped
+
+def has_value(langs):
+    return isinstance(langs, dict) and any(v for v in langs.values())
+
+def whitespace_variants(keys):
+    groups = {}
+    for key in keys:
+        groups.setdefault(" ".join(key.split()), []).append(key)
+    return [sorted(g) for g in groups.values() if len(g) > 1]
+
+class Report(object):
+
+    def __init__(self):
+        self.sections = []
+        self.missing = 0
+
+    def section(self, title, items, limit):
+        if items:
+            self.sections.append((title, items, limit))
+
+    def problem(self, text):
+        self.sections.append((text, None, 0))
+
+    def write(self, out):
+        for title, items, limit in self.sections:
+            if items is None:
+                out.write("\n" + title + "\n")
+                continue
+            out.write("\n{} ({})\n".format(title, len(items)))
+            for item in items[:limit]:
+                out.write("  " + item + "\n")
+            if len(items) > limit:
+                out.write("  ... {} more\n".format(len(items) - limit))
+
+def analyse(scan, mod_text, translation, legacy, field_names, limit):
+    report = Report()
+    for resource in (mod_text, translation, legacy, field_names):
+        for problem in resource.problems:
+            report.problem("{}: {}".format(resource.name, problem))
+        if resource.duplicates:
+            report.section(resource.name + ": duplicate keys (last one wins)",
+                           ["{!r}".format(k) for k in resource.duplicates], limit)
+
+    mod = mod_text.data or {}
+    used = set(scan.t_keys)
+    indirect = set(k for k in mod if k not in used and k in scan.literals)
+    unused = sorted(k for k in mod if k not in used and k not in indirect)
+    missing = sorted(k for k in used if k not in mod)
+    report.missing += len(missing)
+    report.section("mod_text.json: keys used by T(\"...\") but missing",
+                   ["{!r}  {}".format(k, ", ".join("{}:{}".format(*w) for w in scan.t_keys[k][:3])) for k in missing],
+                   limit)
+    report.section("mod_text.json: unused keys (no T() call or other literal)", [repr(k) for k in unused], limit)
+    report.section("mod_text.json: keys only reachable through dynamic T(expr) calls",
+                   [repr(k) for k in sorted(indirect)], limit)
+    report.section("dynamic T(expr) call sites", ["{}:{}  T({})".format(*c) for c in scan.dynamic_calls], limit)
+    incomplete = sorted("{!r}: missing {}".format(k, ", ".join(l for l in LANGUAGES if not v.get(l)))
+                        for k, v in mod.items() if isinstance(v, dict) and not all(v.get(l) for l in LANGUAGES))
+    report.section("mod_text.json: keys without every language", incomplete, limit)
+    report.section("mod_text.json: keys differing only in whitespace",
+                   [" / ".join(repr(k) for k in g) for g in whitespace_variants(mod)], limit)
+
+    entities = translation.data or {}
+    empty = sorted(k for k, v in entities.items() if not has_value(v))
+    report.section("translation.json: entries with no values (dropped at build)", [repr(k) for k in empty], limit)
+    observed = {}
+    for map_name, names in (field_names.data or {}).items():
+        for name in names:
+            observed.setdefault(name, set()).add(map_name)
+    for name in scan.translate_keys:
+        observed.setdefault(name, set()).add("(C# literal)")
+    covered = set()
+    untranslated = []
+    for name in sorted(observed):
+        hit = next((c for c in entity_candidates(name) if has_value(entities.get(c))), None)
+        if hit is None:
+            untranslated.append("{!r}  ({})".format(name, ", ".join(sorted(observed[name]))))
+        else:
+            covered.add(hit)
+    report.missing += sum(1 for name in scan.translate_keys if name not in covered and name not in entities)
+    report.section("field names with no translation.json entry (EntityNames.json)", untranslated, limit)
+    unobserved = sorted(k for k in entities if k not in covered and has_value(entities[k]))
+    report.section("translation.json: entries never seen in EntityNames.json", [repr(k) for k in unobserved], limit)
+
+    old = legacy.data or {}
+    report.section("FF1_translations.json: names translation.json cannot resolve (not embedded)",
+                   ["{!r} -> {!r}".format(k, v) for k, v in sorted(old.items())
+                    if not any(has_value(entities.get(c)) for c in entity_candidates(k))], limit)
+    report.section("FF1_translations.json: English differs from translation.json",
+                   ["{!r}: {!r} vs {!r}".format(k, v, entities[k].get("en"))
+                    for k, v in sorted(old.items())
+                    if k in entities and isinstance(entities[k], dict) and v and v != entities[k].get("en")], limit)
+    overlap = sorted(set(mod) & set(entities))
+    report.section("keys present in both mod_text.json and translation.json", [repr(k) for k in overlap], limit)
+
+    keep_mod = dict((k, v) for k, v in mod.items() if k in used or k in indirect)
+    keep_entities = dict((k, v) for k, v in entities.items() if has_value(v))
+    return report, keep_mod, keep_entities
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Dead/missing/duplicate translation key analysis")
+    parser.add_argument("--root", default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        help="Repository root (default: parent of tools/)")
+    parser.add_argument("--emit", metavar="DIR", help="Write pruned mod_text.json and translation.json to DIR")
+    parser.add_argument("--limit", type=int, default=40, help="Items shown per section")
+    parser.add_argument("--strict", action="store_true", help="Exit 1 if any referenced key is missing")
+    args = parser.parse_args()
+
+    scan = SourceScan().scan_tree(args.root)
+    resources = [JsonResource(os.path.join(args.root, name)) for name in
+                 ("mod_text.json", "translation.json", "FF1_translations.json", "EntityNames.json")]
+    report, keep_mod, keep_entities = analyse(scan, *(resources + [args.limit]))
+
+    print("Scanned {} C# files: {} T() keys, {} dynamic T() calls, {} Translate() literals".format(
+        scan.files, len(scan.t_keys), len(scan.dynamic_calls), len(scan.translate_keys)))
+    report.write(sys.stdout)
+
+    if args.emit:
+        if not os.path.exists(args.emit):
+            os.makedirs(args.emit)
+        write_json(os.path.join(args.emit, "mod_text.json"), keep_mod)
+        write_json(os.path.join(args.emit, "translation.json"), keep_entities)
+        print("\nPruned resources written to {}: mod_text {} -> {} keys, translation {} -> {} keys".format(
+            args.emit, len(resources[0].data or {}), len(keep_mod), len(resources[1].data or {}), len(keep_entities)))
+
+    return 1 if args.strict and report.missing else 0
+
+if __name__ == "__main__":
+    sys.exit(main())